@@ -0,0 +1,94 @@
+"""
+Online-vs-batch equivalence check.
+
+Replays synthetic histories through NewsMomentumStream (saving and
+reloading the state half-way) and compares every emitted position and
+the final cumulative returns and drawdowns with run_strategy_analysis.
+The inputs include many tied and zero-return days and flat stretches,
+where rounding differences would flip signs. Exits with code 1 on any
+mismatch.
+
+Usage:
+    python benchmarks/check_online.py [--days 2000] [--seeds 3]
+"""
+import argparse
+import io
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.strategies.news_momentum import run_strategy_analysis  # noqa: E402
+from src.strategies.online import STRATEGIES, NewsMomentumStream  # noqa: E402
+
+
+CATEGORIES = ['supply', 'demand', 'currency', 'geopolitics']
+
+
+def make_tied_history(days: int, seed: int) -> pd.DataFrame:
+    """Price changes on a coarse grid with 40% zero days and flat runs."""
+    rng = np.random.default_rng(seed)
+    price_change = np.round(rng.normal(0.0005, 0.02, days), 3)
+    price_change[rng.random(days) < 0.4] = 0.0
+    for start in rng.integers(0, days - 30, size=days // 200):
+        price_change[start:start + rng.integers(5, 30)] = rng.choice([0.0, 0.01, -0.005])
+    df = pd.DataFrame({'price_change': price_change})
+    for cat in CATEGORIES:
+        df[f'{cat}_sym'] = rng.choice([-1, 0, 0, 1], size=days)
+    return df
+
+
+def batch_positions(df: pd.DataFrame, window: int, beta: float, middle_weight: float):
+    """Positions run_strategy_analysis holds on each day (indexed by row)."""
+    with redirect_stdout(io.StringIO()):
+        result = run_strategy_analysis(df, CATEGORIES, beta, middle_weight, window)
+    return result['positions'], result
+
+
+def check(df: pd.DataFrame, window: int, beta: float = 0.8, middle_weight: float = 0.2) -> int:
+    """Number of mismatching positions and summary values for one history."""
+    expected, result = batch_positions(df, window, beta, middle_weight)
+
+    engine = NewsMomentumStream(CATEGORIES, beta, middle_weight, window)
+    emitted = {}
+    sym_values = df[[f'{cat}_sym' for cat in CATEGORIES]].to_numpy(dtype=float)
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, (price_change, sym) in enumerate(zip(df['price_change'].to_numpy(), sym_values)):
+            if i == len(df) // 2:
+                engine.save(Path(tmp) / 'state.json')
+                engine = NewsMomentumStream.load(Path(tmp) / 'state.json')
+            positions = engine.update(price_change, sym)
+            if positions is not None:
+                emitted[i + 1] = positions
+    online = pd.DataFrame(emitted).T
+
+    mismatches = 0
+    for name in expected.columns:
+        got = online[name].reindex(expected.index).to_numpy()
+        mismatches += int(np.sum(got != expected[name].to_numpy()))
+    for name in STRATEGIES:
+        mismatches += result['cumulative_returns'][name] != engine.cumulative_returns[name]
+        mismatches += result['max_drawdowns'][name] != engine.max_drawdowns[name]
+    return int(mismatches)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--days', type=int, default=2000)
+    parser.add_argument('--seeds', type=int, default=3)
+    args = parser.parse_args()
+
+    failed = False
+    for seed in range(args.seeds):
+        df = make_tied_history(args.days, seed)
+        for window in (5, 20):
+            mismatches = check(df, window)
+            failed |= mismatches > 0
+            print(f"seed={seed} window={window}: {mismatches} mismatches{'  FAIL' if mismatches else ''}")
+    sys.exit(1 if failed else 0)
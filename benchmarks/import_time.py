@@ -0,0 +1,107 @@
+"""
+Import-time budget check.
+
+Imports each package in a fresh interpreter and fails (exit code 1) if
+the import is slower than its budget or loads a heavy dependency that
+should only be imported on use. Package imports alone never touch the
+lazily exported names, so ATTRIBUTE_PROBES also imports real functions
+and checks that they do not drag in a heavy dependency either.
+
+Usage:
+    python benchmarks/import_time.py [--repeat 5] [--scale 1.0]
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Budgets in seconds on a laptop-class CPU, on top of the bare interpreter
+IMPORT_BUDGETS = {
+    'src.strategies': 0.05,
+    'src.analysis': 0.05,
+    'src.visualization': 0.05,
+    'src.data_processing': 1.5,
+}
+
+# Statements that resolve lazy exports; they must not load HEAVY_MODULES
+ATTRIBUTE_PROBES = [
+    'from src.strategies import run_strategy_analysis, naive_momentum_strategy',
+    'from src.visualization import generate_interactive_report',
+]
+
+HEAVY_MODULES = ['pmdarima', 'statsmodels', 'scipy', 'tqdm', 'matplotlib', 'plotly']
+
+_PROBE = '''
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'modules': sorted(sys.modules)}}))
+'''
+
+
+def measure_import(statement: str, repeat: int = 5) -> dict:
+    """
+    Best-of-repeat time of an import statement in fresh interpreters.
+
+    Args:
+        statement: Import statement, e.g. 'import src.strategies'
+        repeat: Number of fresh interpreters to try
+
+    Returns:
+        dict: 'seconds' (fastest import) and 'heavy' (heavy modules loaded)
+    """
+    best = None
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', _PROBE.format(root=str(ROOT), statement=statement)],
+                                capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        if best is None or result['seconds'] < best['seconds']:
+            best = result
+    loaded = set(best['modules'])
+    return {'seconds': best['seconds'], 'heavy': [m for m in HEAVY_MODULES if m in loaded]}
+
+
+def check_import_budgets(repeat: int = 5, scale: float = 1.0) -> bool:
+    """
+    Measure every package import against its budget and print a table.
+
+    Attribute probes have no time budget; they only fail on heavy imports.
+
+    Args:
+        repeat: Fresh interpreters per package
+        scale: Multiplier applied to all budgets (for slower machines)
+
+    Returns:
+        bool: True when every package is within budget
+    """
+    ok = True
+    print(f"{'module':<22}{'seconds':>10}{'budget':>10}  heavy imports")
+    for module, budget in IMPORT_BUDGETS.items():
+        result = measure_import(f'import {module}', repeat)
+        within = result['seconds'] <= budget * scale and not result['heavy']
+        ok &= within
+        status = '' if within else '  FAIL'
+        print(f"{module:<22}{result['seconds']:>10.3f}{budget * scale:>10.3f}  "
+              f"{', '.join(result['heavy']) or '-'}{status}")
+
+    for statement in ATTRIBUTE_PROBES:
+        result = measure_import(statement, 1)
+        ok &= not result['heavy']
+        status = '' if not result['heavy'] else '  FAIL'
+        print(f"{statement}\n{'':<22}{result['seconds']:>10.3f}{'-':>10}  "
+              f"{', '.join(result['heavy']) or '-'}{status}")
+    return ok
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--scale', type=float, default=1.0)
+    args = parser.parse_args()
+    sys.exit(0 if check_import_budgets(args.repeat, args.scale) else 1)
@@ -0,0 +1,182 @@
+"""
+News collector benchmark against a local stand-in server.
+
+Serves synthetic barchart-style listing pages from 127.0.0.1 with a
+fixed latency per request and ETag validators, then times collect_news
+with one request per host at a time, with concurrent requests, with a
+rerun that revalidates every cached page (304) and with a rerun served
+from the page cache. Exits with code 1 if any run collects stories that
+differ from the ones served.
+
+Usage:
+    python benchmarks/news_server.py [--pages 12] [--per-page 10] [--latency 0.1] [--per-host 4]
+    python benchmarks/news_server.py --serve [--port 8765]
+"""
+import argparse
+import asyncio
+import io
+import sys
+import tempfile
+import threading
+import time
+from contextlib import redirect_stdout
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.data_collection import collect_news  # noqa: E402
+
+
+DAY = date(2025, 5, 30)
+ETAG = '"v1"'
+
+
+def make_stories(pages: int, per_page: int, day: date = DAY) -> list:
+    """Stories of one day, newest first, in the news-dataset schema (without url)."""
+    n = pages * per_page
+    stories = []
+    for k in range(n):
+        minutes = 17 * 60 + 59 - k * (17 * 60) // n
+        published = datetime(day.year, day.month, day.day, minutes // 60, minutes % 60)
+        text = f"{published:%a %b} {published.day}, {int(published.strftime('%I'))}:{published:%M%p} CDT"
+        stories.append({
+            'id': str(90000000 + n - k),
+            'title': f'Synthetic story {n - k}',
+            'published_str_original': text,
+            'published_timestamp_utc': int(published.replace(tzinfo=timezone(timedelta(hours=-5))).timestamp()),
+            'summary': f'Excerpt of synthetic story {n - k}.',
+        })
+    return stories
+
+
+def render_page(stories: list) -> str:
+    """Listing page HTML with the markup parse_listing reads."""
+    blocks = [
+        f'<div class="story"><h3><a href="/story/news/{s["id"]}/synthetic">{s["title"]}</a></h3>'
+        f'<span class="story-meta">Barchart - {s["published_str_original"]}</span>'
+        f'<p class="story-excerpt">{s["summary"]}</p></div>'
+        for s in stories
+    ]
+    return '<html><body>' + ''.join(blocks) + '</body></html>'
+
+
+class StandInServer:
+    """
+    Listing pages served from a background thread.
+
+    Page p (?page=p, default 1) holds stories[(p - 1) * per_page : p * per_page].
+    Every response is delayed by latency seconds; requests carrying the
+    current ETag get a 304.
+    """
+
+    def __init__(self, stories: list, per_page: int, latency: float, port: int = 0):
+        self.stories = stories
+        self.per_page = per_page
+        self.latency = latency
+        self.port = port
+        self.stats = {'requests': 0, 'not_modified': 0, 'max_in_flight': 0}
+        self._in_flight = 0
+
+    async def _handle(self, request):
+        from aiohttp import web
+
+        self.stats['requests'] += 1
+        self._in_flight += 1
+        self.stats['max_in_flight'] = max(self.stats['max_in_flight'], self._in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self._in_flight -= 1
+
+        if request.headers.get('If-None-Match') == ETAG:
+            self.stats['not_modified'] += 1
+            return web.Response(status=304)
+        page = int(request.query.get('page', 1))
+        stories = self.stories[(page - 1) * self.per_page:page * self.per_page]
+        return web.Response(text=render_page(stories), content_type='text/html', headers={'ETag': ETAG})
+
+    def start(self) -> str:
+        """Start serving in a daemon thread and return the listing URL."""
+        from aiohttp import web
+
+        started = threading.Event()
+
+        def serve():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            app = web.Application()
+            app.router.add_get('/news', self._handle)
+            runner = web.AppRunner(app)
+            loop.run_until_complete(runner.setup())
+            site = web.TCPSite(runner, '127.0.0.1', self.port)
+            loop.run_until_complete(site.start())
+            self.port = runner.addresses[0][1]
+            started.set()
+            loop.run_forever()
+
+        threading.Thread(target=serve, daemon=True).start()
+        started.wait()
+        return f'http://127.0.0.1:{self.port}/news'
+
+    def reset_stats(self):
+        self.stats = {'requests': 0, 'not_modified': 0, 'max_in_flight': 0}
+
+
+def run_benchmark(pages: int, per_page: int, latency: float, per_host: int) -> bool:
+    """
+    Time the collector runs and check their stories.
+
+    Returns:
+        bool: True when every run collected exactly the served stories
+    """
+    stories = make_stories(pages, per_page)
+    server = StandInServer(stories, per_page, latency)
+    url = server.start()
+
+    ok = True
+    print(f"{pages} pages x {per_page} stories, {latency:.3f}s latency per request")
+    print(f"{'run':<14}{'seconds':>10}{'requests':>10}{'304s':>8}{'in flight':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        runs = [
+            ('sequential', dict(per_host=1, use_cache=False)),
+            ('concurrent', dict(per_host=per_host, cache_dir=tmp)),
+            ('revalidated', dict(per_host=per_host, cache_dir=tmp)),
+            ('cached', dict(per_host=per_host, cache_dir=tmp, max_age=3600)),
+        ]
+        for name, kwargs in runs:
+            server.reset_stats()
+            start = time.perf_counter()
+            with redirect_stdout(io.StringIO()):
+                collected = collect_news([url], pages=pages, day=DAY, output_dir=False, **kwargs)
+            elapsed = time.perf_counter() - start
+
+            got = [{key: value for key, value in story.items() if key != 'url'} for story in collected]
+            matches = got == stories
+            ok &= matches
+            print(f"{name:<14}{elapsed:>10.3f}{server.stats['requests']:>10}{server.stats['not_modified']:>8}"
+                  f"{server.stats['max_in_flight']:>11}{'' if matches else '  FAIL'}")
+    return ok
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pages', type=int, default=12)
+    parser.add_argument('--per-page', type=int, default=10)
+    parser.add_argument('--latency', type=float, default=0.1)
+    parser.add_argument('--per-host', type=int, default=4)
+    parser.add_argument('--serve', action='store_true', help='only run the server until interrupted')
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    if args.serve:
+        server = StandInServer(make_stories(args.pages, args.per_page), args.per_page, args.latency, args.port)
+        print(f"Serving {args.pages} listing pages at {server.start()}?page=1..{args.pages} (Ctrl-C to stop)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+        sys.exit(0)
+
+    sys.exit(0 if run_benchmark(args.pages, args.per_page, args.latency, args.per_host) else 1)
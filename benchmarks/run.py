@@ -0,0 +1,157 @@
+"""
+Benchmark runner with result history and regression thresholds.
+
+Times every benchmark in suite.py on synthetic inputs of the requested
+size, appends the results to a JSON-lines history and compares them with
+earlier runs of the same size on the same machine. Exits with code 1 if
+a benchmark is slower than threshold x its baseline.
+
+Usage:
+    python benchmarks/run.py [--years 5] [--commodities 4] [--categories 4]
+                             [--repeat 5] [--filter NAME] [--threshold 1.5]
+                             [--history PATH] [--no-save]
+"""
+import argparse
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from suite import BENCHMARKS  # noqa: E402
+from synthetic import make_inputs  # noqa: E402
+
+
+DEFAULT_HISTORY = Path(__file__).resolve().parent / 'results' / 'history.jsonl'
+BASELINE_RUNS = 5
+
+
+def machine_id() -> str:
+    """Identifier of the machine the results were measured on."""
+    return f'{platform.node()}|{platform.machine()}|{platform.processor()}|py{platform.python_version()}'
+
+
+def time_benchmark(run, repeat: int) -> dict:
+    """
+    Time a benchmark callable after one warm-up call.
+
+    Args:
+        run: Zero-argument callable
+        repeat: Number of timed calls
+
+    Returns:
+        dict: 'min', 'median' and 'max' wall time in seconds
+    """
+    timings = []
+    # Progress prints of the pipeline are not part of the measurement
+    with redirect_stdout(io.StringIO()):
+        run()
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+    return {'min': min(timings), 'median': statistics.median(timings), 'max': max(timings)}
+
+
+def load_history(path: Path) -> list:
+    """Read all history records (one JSON object per line)."""
+    if not path.exists():
+        return []
+    records = []
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    return records
+
+
+def baseline(history: list, name: str, size: dict, machine: str) -> float:
+    """Median of the best times of the last BASELINE_RUNS comparable runs."""
+    best = [record['results'][name]['min'] for record in history
+            if record['size'] == size and record['machine'] == machine and name in record['results']]
+    return statistics.median(best[-BASELINE_RUNS:]) if best else None
+
+
+def run_suite(size: dict, repeat: int = 5, name_filter: str = None, threshold: float = 1.5,
+              history_path: Path = DEFAULT_HISTORY, save: bool = True) -> bool:
+    """
+    Run the benchmark suite and report regressions.
+
+    Args:
+        size: make_inputs keyword arguments (years, n_commodities, n_categories)
+        repeat: Timed calls per benchmark
+        name_filter: Only run benchmarks whose name contains this string
+        threshold: Allowed slowdown factor relative to the baseline
+        history_path: JSON-lines file holding previous results
+        save: Append this run to the history
+
+    Returns:
+        bool: True when no benchmark regressed
+    """
+    print(f"Generating inputs: {size}")
+    inputs = make_inputs(**size)
+    history = load_history(history_path)
+    machine = machine_id()
+
+    results = {}
+    ok = True
+    print(f"{'benchmark':<32}{'min (s)':>10}{'median (s)':>12}{'baseline':>10}{'ratio':>8}")
+    for name, setup in BENCHMARKS.items():
+        if name_filter and name_filter not in name:
+            continue
+        run = setup(inputs)
+        if run is None:
+            continue
+        timing = time_benchmark(run, repeat)
+        results[name] = timing
+
+        reference = baseline(history, name, size, machine)
+        ratio = timing['min'] / reference if reference else None
+        regressed = ratio is not None and ratio > threshold
+        ok &= not regressed
+        print(f"{name:<32}{timing['min']:>10.4f}{timing['median']:>12.4f}"
+              f"{reference if reference else float('nan'):>10.4f}"
+              f"{ratio if ratio else float('nan'):>8.2f}{'  REGRESSION' if regressed else ''}")
+
+    if save and results:
+        history_path.parent.mkdir(parents=True, exist_ok=True)
+        record = {
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'machine': machine,
+            'size': size,
+            'repeat': repeat,
+            'results': results,
+        }
+        with open(history_path, 'a') as f:
+            f.write(json.dumps(record) + '\n')
+        print(f"Results appended to {history_path}")
+    return ok
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--years', type=float, default=5)
+    parser.add_argument('--commodities', type=int, default=4)
+    parser.add_argument('--categories', type=int, default=4)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--filter', dest='name_filter', default=None)
+    parser.add_argument('--threshold', type=float, default=1.5)
+    parser.add_argument('--history', type=Path, default=DEFAULT_HISTORY)
+    parser.add_argument('--no-save', dest='save', action='store_false')
+    args = parser.parse_args()
+
+    size = {'years': args.years, 'n_commodities': args.commodities, 'n_categories': args.categories}
+    passed = run_suite(size, args.repeat, args.name_filter, args.threshold, args.history, args.save)
+    sys.exit(0 if passed else 1)
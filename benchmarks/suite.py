@@ -0,0 +1,103 @@
+"""
+Benchmarks of the pipeline hot paths.
+
+Each benchmark is a setup function taking the make_inputs dict and
+returning the zero-argument callable that gets timed. Content-keyed
+caches are cleared inside the timed call so every run measures the cold
+path.
+"""
+import importlib.util
+import os
+import tempfile
+
+from src.analysis.statistics import calculate_descriptive_stats
+from src.data_processing.classification_data import _LABEL_CACHE, extract_theme_scores
+from src.strategies.momentum import slope_momentum_strategy
+from src.strategies.news_momentum import (
+    calculate_arma_residual_scores,
+    clear_residual_cache,
+    run_strategy_analysis
+)
+from src.strategies.simulation import simulate_event_series
+
+
+BENCHMARKS = {}
+
+
+def benchmark(name: str):
+    """Register a benchmark setup function under name."""
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+@benchmark('extract_theme_scores')
+def bench_extract_theme_scores(inputs: dict):
+    def run():
+        _LABEL_CACHE.clear()
+        extract_theme_scores(inputs['reason'].copy(), inputs['price'].copy(), inputs['categories'])
+    return run
+
+
+@benchmark('calculate_arma_residual_scores')
+def bench_arma_residual_scores(inputs: dict):
+    def run():
+        clear_residual_cache()
+        calculate_arma_residual_scores(inputs['themes'], inputs['categories'], window=20, beta=0.8)
+    return run
+
+
+@benchmark('run_strategy_analysis')
+def bench_run_strategy_analysis(inputs: dict):
+    def run():
+        clear_residual_cache()
+        run_strategy_analysis(inputs['themes'], inputs['categories'], beta=0.8, middle_weight=0.2, window=20)
+    return run
+
+
+@benchmark('slope_momentum_strategy')
+def bench_slope_momentum(inputs: dict):
+    def run():
+        slope_momentum_strategy(inputs['themes'], 5)
+    return run
+
+
+@benchmark('simulate_event_series')
+def bench_simulate_event_series(inputs: dict):
+    num_days = len(inputs['themes'])
+
+    def run():
+        simulate_event_series(num_days_total=num_days)
+    return run
+
+
+@benchmark('calculate_descriptive_stats')
+def bench_descriptive_stats(inputs: dict):
+    themes = [f'{cat}_sym' for cat in inputs['categories']]
+
+    def run():
+        calculate_descriptive_stats(inputs['themes'].copy(), themes)
+    return run
+
+
+@benchmark('generate_interactive_report')
+def bench_interactive_report(inputs: dict):
+    # plots.py imports plotly on first use, so probe for it up front
+    if importlib.util.find_spec('plotly') is None:
+        print("Skipping generate_interactive_report: plotly is not installed")
+        return None
+    from src.visualization.plots import generate_interactive_report
+
+    df = inputs['themes']
+    result = run_strategy_analysis(df, inputs['categories'], beta=0.8, middle_weight=0.2, window=20)
+    climate_df = result['climate_df'].set_axis(df['date'].iloc[result['climate_df'].index].to_numpy())
+    climate_df.index.name = 'date'
+    reason = inputs['reason'].drop_duplicates('date').assign(
+        date=lambda d: d['date'].astype('datetime64[ns]'), price_change=df['price_change'].to_numpy()
+    ).set_index('date')
+
+    def run():
+        with tempfile.TemporaryDirectory() as tmp:
+            generate_interactive_report(reason, climate_df, os.path.join(tmp, 'report.html'))
+    return run
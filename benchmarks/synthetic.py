@@ -0,0 +1,117 @@
+"""
+Synthetic inputs for the benchmark suite.
+
+Frames mimic the layouts produced by the data_processing loaders so the
+benchmarks exercise the same code paths as real data, without network
+or data files.
+"""
+import numpy as np
+import pandas as pd
+
+
+TRADING_DAYS = 252
+CATEGORY_POOL = ['currency', 'demand', 'supply', 'geopolitics', 'inventory',
+                 'weather', 'policy', 'macro', 'logistics', 'sentiment']
+
+
+def make_categories(n_categories: int) -> list:
+    """First n_categories theme names (generic names beyond the pool)."""
+    names = CATEGORY_POOL[:n_categories]
+    names += [f'theme{i}' for i in range(len(names), n_categories)]
+    return names
+
+
+def make_dates(years: float) -> pd.DatetimeIndex:
+    """Business days covering the requested number of trading years."""
+    return pd.bdate_range('2015-01-01', periods=int(years * TRADING_DAYS))
+
+
+def make_price_frame(dates: pd.DatetimeIndex, seed: int = 0) -> pd.DataFrame:
+    """
+    Price file layout with 'Date' and '%Chg' columns.
+
+    Args:
+        dates: Trading dates
+        seed: Random seed
+
+    Returns:
+        pd.DataFrame: Daily price changes
+    """
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({'Date': dates, '%Chg': rng.normal(0.0002, 0.02, len(dates))})
+
+
+def make_reason_frame(dates: pd.DatetimeIndex, commodities: list, categories: list,
+                      seed: int = 0) -> pd.DataFrame:
+    """
+    Classification layout: one row per (date, commodity) with key drivers
+    and reverse factors mentioning categories in parentheses.
+
+    Args:
+        dates: Trading dates
+        commodities: Commodity names
+        categories: Theme categories
+        seed: Random seed
+
+    Returns:
+        pd.DataFrame: Columns date, commodity, key drivers, reverse factors
+    """
+    rng = np.random.default_rng(seed)
+    n_rows = len(dates) * len(commodities)
+    n_drivers = rng.integers(0, 4, size=n_rows)
+    labels = np.asarray(categories)[rng.integers(len(categories), size=(n_rows, 3))]
+
+    drivers = [
+        '; '.join(f'driver {j} ({labels[i, j]})' for j in range(n_drivers[i])) or 'No clear driver'
+        for i in range(n_rows)
+    ]
+    return pd.DataFrame({
+        'date': np.repeat(dates.strftime('%Y-%m-%d'), len(commodities)),
+        'commodity': np.tile(commodities, len(dates)),
+        'key drivers': drivers,
+        'reverse factors': np.where(rng.random(n_rows) < 0.3, 'offsetting flows (demand)', None),
+    })
+
+
+def make_theme_frame(dates: pd.DatetimeIndex, categories: list, seed: int = 0) -> pd.DataFrame:
+    """
+    Strategy input layout: date, price_change and <cat>_sym columns.
+
+    Args:
+        dates: Trading dates
+        categories: Theme categories
+        seed: Random seed
+
+    Returns:
+        pd.DataFrame: One commodity's aligned prices and theme symbols
+    """
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({'date': dates, 'price_change': rng.normal(0.0002, 0.02, len(dates))})
+    for cat in categories:
+        df[f'{cat}_sym'] = rng.choice([-1, 0, 0, 0, 1], size=len(dates))
+    return df
+
+
+def make_inputs(years: float = 5, n_commodities: int = 4, n_categories: int = 4, seed: int = 0) -> dict:
+    """
+    All benchmark inputs for one problem size.
+
+    Args:
+        years: Trading years of history
+        n_commodities: Commodities in the classification data
+        n_categories: Theme categories
+        seed: Random seed
+
+    Returns:
+        dict: 'categories', 'commodities', 'price', 'reason' and 'themes'
+    """
+    dates = make_dates(years)
+    categories = make_categories(n_categories)
+    commodities = [f'Commodity{i}' for i in range(n_commodities)]
+    return {
+        'categories': categories,
+        'commodities': commodities,
+        'price': make_price_frame(dates, seed),
+        'reason': make_reason_frame(dates, commodities, categories, seed),
+        'themes': make_theme_frame(dates, categories, seed),
+    }
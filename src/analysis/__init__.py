@@ -1,11 +1,25 @@
 """
 Analysis and performance evaluation modules
+
+Submodules are imported on first attribute access, so scipy is only
+loaded when statistics or bootstrap functions are used.
 """
-from .statistics import calculate_stats, calculate_descriptive_stats
-from .performance import calculate_performance_metrics
-
-__all__ = [
-    'calculate_stats',
-    'calculate_descriptive_stats',
-    'calculate_performance_metrics'
-]
+from ..utils.lazy import lazy_exports
+
+_EXPORTS = {
+    'calculate_stats': '.statistics',
+    'calculate_descriptive_stats': '.statistics',
+    'calculate_performance_metrics': '.performance',
+    'calculate_metrics_matrix': '.performance',
+    'rolling_metrics_matrix': '.performance',
+    'expanding_metrics_matrix': '.performance',
+    'compare_strategies': '.performance',
+    'bootstrap_sharpe': '.bootstrap',
+    'probabilistic_sharpe_ratio': '.bootstrap',
+    'deflated_sharpe_ratio': '.bootstrap',
+    'backtest_positions': '.backtest',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+
+from .performance import _as_matrix, calculate_metrics_matrix
+
+
+COST_FIELDS = ['commission', 'slippage', 'per_trade']
+
+
+def _cost_vectors(cost_model, columns, commodities=None) -> np.ndarray:
+    """
+    Per-column cost parameters of shape (len(COST_FIELDS), columns).
+
+    cost_model is either one model {field: value} applied to every column
+    or {commodity: model}; a column's commodity comes from commodities,
+    else the first level of a MultiIndex column, else the column name.
+    """
+    costs = np.zeros((len(COST_FIELDS), len(columns)))
+    if not cost_model:
+        return costs
+
+    if set(cost_model) <= set(COST_FIELDS):
+        models = [cost_model] * len(columns)
+    else:
+        if commodities is None:
+            commodities = [c[0] if isinstance(c, tuple) else c for c in columns]
+        missing = sorted({str(c) for c in commodities if c not in cost_model})
+        if missing:
+            raise ValueError(f"No cost model for: {', '.join(missing)}")
+        models = [cost_model[c] for c in commodities]
+
+    for j, model in enumerate(models):
+        for i, field in enumerate(COST_FIELDS):
+            costs[i, j] = model.get(field, 0.0)
+    return costs
+
+
+def backtest_positions(positions,
+                       price_change,
+                       cost_model: dict = None,
+                       commodities: list = None,
+                       risk_free_rate: float = 0.05,
+                       trading_days: int = 252) -> dict:
+    """
+    Net-of-cost backtest of a positions matrix.
+
+    positions[t] is the position held over day t and earns
+    positions[t] * price_change[t]. Trading into it costs
+    |positions[t] - positions[t-1]| * (commission + slippage), plus
+    per_trade whenever the position changes; the book starts flat. All
+    costs are fractions of notional.
+
+    Args:
+        positions: DataFrame or array (days, strategies) of positions, e.g.
+            the 'positions' of run_strategy_analysis
+        price_change: Daily price changes, shape (days,) or (days, strategies)
+        cost_model: {'commission', 'slippage', 'per_trade'} for every
+            column, or {commodity: such a dict}; None = frictionless
+        commodities: Commodity of each column when cost_model is keyed by
+            commodity
+        risk_free_rate: Annual risk-free rate
+        trading_days: Trading days per year
+
+    Returns:
+        dict: 'net_returns', 'gross_returns', 'turnover' and 'costs'
+            DataFrames shaped like positions, and 'summary' with net
+            metrics, gross_sharpe, annual_turnover, avg_holding_period,
+            n_trades and cost_drag (annualized) per column
+    """
+    pos, index, columns = _as_matrix(positions)
+    pos = np.nan_to_num(pos)
+    change = np.asarray(price_change, dtype=float)
+    if change.ndim == 1:
+        change = change[:, None]
+
+    previous = np.zeros_like(pos)
+    previous[1:] = pos[:-1]
+    turnover = np.abs(pos - previous)
+    trades = turnover > 0
+
+    commission, slippage, per_trade = _cost_vectors(cost_model, columns, commodities)
+    costs = turnover * (commission + slippage) + trades * per_trade
+    gross = pos * change
+    net = gross - costs
+
+    held = pos != 0
+    entries = np.sum(trades & held, axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        avg_holding = np.where(entries > 0, held.sum(axis=0) / entries, np.nan)
+
+    summary = calculate_metrics_matrix(pd.DataFrame(net, columns=columns), risk_free_rate, trading_days)
+    summary['gross_sharpe'] = calculate_metrics_matrix(gross, risk_free_rate, trading_days)['sharpe_ratio'].to_numpy()
+    summary['annual_turnover'] = np.nanmean(turnover, axis=0) * trading_days
+    summary['avg_holding_period'] = avg_holding
+    summary['n_trades'] = trades.sum(axis=0)
+    summary['cost_drag'] = np.nanmean(costs, axis=0) * trading_days
+
+    def frame(values):
+        return pd.DataFrame(values, index=index, columns=columns)
+
+    return {
+        'net_returns': frame(net),
+        'gross_returns': frame(gross),
+        'turnover': frame(turnover),
+        'costs': frame(costs),
+        'summary': summary,
+    }
@@ -0,0 +1,216 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy.stats import kurtosis, norm, skew
+
+from .performance import sharpe_ratios
+
+
+def stationary_bootstrap_indices(n_days: int, n_resamples: int, block_length: float,
+                                 rng: np.random.Generator) -> np.ndarray:
+    """
+    Index arrays of the Politis-Romano stationary bootstrap.
+
+    Blocks start at uniform random days and have geometric lengths with
+    mean block_length; blocks wrap around the end of the sample.
+
+    Args:
+        n_days: Length of the original sample
+        n_resamples: Number of resamples
+        block_length: Expected block length in days
+        rng: Random generator
+
+    Returns:
+        np.ndarray: Integer array of shape (n_resamples, n_days)
+    """
+    starts = rng.integers(n_days, size=(n_resamples, n_days))
+    new_block = rng.random((n_resamples, n_days)) < 1.0 / block_length
+    new_block[:, 0] = True
+
+    days = np.arange(n_days)
+    block_start = np.maximum.accumulate(np.where(new_block, days, 0), axis=1)
+    first_day = np.take_along_axis(starts, block_start, axis=1)
+    return (first_day + days - block_start) % n_days
+
+
+def block_bootstrap_indices(n_days: int, n_resamples: int, block_length: int,
+                            rng: np.random.Generator) -> np.ndarray:
+    """
+    Index arrays of the circular moving-block bootstrap.
+
+    Args:
+        n_days: Length of the original sample
+        n_resamples: Number of resamples
+        block_length: Block length in days
+        rng: Random generator
+
+    Returns:
+        np.ndarray: Integer array of shape (n_resamples, n_days)
+    """
+    block_length = int(block_length)
+    n_blocks = -(-n_days // block_length)
+    starts = rng.integers(n_days, size=(n_resamples, n_blocks, 1))
+    indices = (starts + np.arange(block_length)) % n_days
+    return indices.reshape(n_resamples, -1)[:, :n_days]
+
+
+def _bootstrap_chunk(values: np.ndarray, n_resamples: int, method: str, block_length: float,
+                     seed: np.random.SeedSequence, risk_free_rate: float, trading_days: int) -> np.ndarray:
+    """Worker: Sharpe ratios of one chunk of resamples, shape (n_resamples, strategies)."""
+    rng = np.random.default_rng(seed)
+    if method == 'stationary':
+        indices = stationary_bootstrap_indices(len(values), n_resamples, block_length, rng)
+    elif method == 'block':
+        indices = block_bootstrap_indices(len(values), n_resamples, block_length, rng)
+    else:
+        raise ValueError(f"Unknown bootstrap method '{method}'")
+    return sharpe_ratios(values[indices], risk_free_rate, trading_days, axis=1)
+
+
+def bootstrap_sharpe(returns: pd.DataFrame,
+                     n_resamples: int = 10000,
+                     method: str = 'stationary',
+                     block_length: float = None,
+                     benchmark: str = 'long_only',
+                     confidence: float = 0.95,
+                     seed: int = None,
+                     chunk_size: int = 1000,
+                     n_workers: int = 1,
+                     risk_free_rate: float = 0.05,
+                     trading_days: int = 252) -> pd.DataFrame:
+    """
+    Bootstrap confidence intervals and p-values for strategy Sharpe ratios.
+
+    All strategies are resampled with the same index arrays so their
+    cross-correlation is preserved. Resamples are drawn in chunks, each
+    from its own SeedSequence child, so results do not depend on
+    n_workers. The p-value tests H0: Sharpe <= benchmark Sharpe using the
+    bootstrap distribution of the difference, re-centred at zero.
+
+    Args:
+        returns: Daily returns, one column per strategy (e.g. the
+            'daily_returns' of run_strategy_analysis)
+        n_resamples: Number of bootstrap resamples
+        method: 'stationary' or 'block'
+        block_length: (Expected) block length; defaults to n_days ** (1/3)
+        benchmark: Column the other strategies are tested against
+        confidence: Two-sided confidence level of the intervals
+        seed: Seed for the resampling
+        chunk_size: Resamples per work unit
+        n_workers: Worker processes (1 = run in-process)
+        risk_free_rate: Annual risk-free rate
+        trading_days: Trading days per year
+
+    Returns:
+        pd.DataFrame: Per strategy sharpe_ratio, std_error, ci_lower,
+            ci_upper, excess_sharpe (vs benchmark) and p_value
+    """
+    returns = pd.DataFrame(returns).dropna()
+    values = returns.to_numpy(dtype=float)
+    n_days = len(values)
+    if block_length is None:
+        block_length = max(1.0, round(n_days ** (1 / 3)))
+
+    chunks = [min(chunk_size, n_resamples - lo) for lo in range(0, n_resamples, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    jobs = [(values, size, method, block_length, chunk_seed, risk_free_rate, trading_days)
+            for size, chunk_seed in zip(chunks, seeds)]
+
+    if n_workers == 1:
+        samples = [_bootstrap_chunk(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            samples = list(executor.map(_bootstrap_chunk, *zip(*jobs)))
+    samples = np.concatenate(samples)
+
+    point = sharpe_ratios(values, risk_free_rate, trading_days)
+    alpha = (1 - confidence) / 2
+    result = pd.DataFrame({
+        'sharpe_ratio': point,
+        'std_error': samples.std(axis=0, ddof=1),
+        'ci_lower': np.quantile(samples, alpha, axis=0),
+        'ci_upper': np.quantile(samples, 1 - alpha, axis=0),
+    }, index=returns.columns)
+
+    if benchmark in returns.columns:
+        b = returns.columns.get_loc(benchmark)
+        excess = point - point[b]
+        excess_samples = samples - samples[:, [b]]
+        result['excess_sharpe'] = excess
+        result['p_value'] = np.mean(excess_samples - excess >= excess, axis=0)
+        result.loc[benchmark, 'p_value'] = np.nan
+    return result
+
+
+def probabilistic_sharpe_ratio(returns: pd.DataFrame,
+                               benchmark_sharpe=0.0,
+                               risk_free_rate: float = 0.05,
+                               trading_days: int = 252) -> pd.Series:
+    """
+    Probability that the true Sharpe ratio exceeds benchmark_sharpe.
+
+    Bailey & Lopez de Prado's PSR, which corrects the Sharpe ratio's
+    standard error for the sample length, skewness and kurtosis.
+
+    Args:
+        returns: Daily returns, one column per strategy
+        benchmark_sharpe: Annualized Sharpe ratio to beat (scalar or per column)
+        risk_free_rate: Annual risk-free rate
+        trading_days: Trading days per year
+
+    Returns:
+        pd.Series: PSR per strategy
+    """
+    returns = pd.DataFrame(returns).dropna()
+    values = returns.to_numpy(dtype=float)
+    n_days = len(values)
+
+    # Work with per-period Sharpe ratios
+    sr = sharpe_ratios(values, risk_free_rate, trading_days) / np.sqrt(trading_days)
+    sr_star = np.asarray(benchmark_sharpe, dtype=float) / np.sqrt(trading_days)
+    g3 = skew(values, axis=0)
+    g4 = kurtosis(values, axis=0, fisher=False)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        z = (sr - sr_star) * np.sqrt(n_days - 1) / np.sqrt(1 - g3 * sr + (g4 - 1) / 4 * sr ** 2)
+    return pd.Series(norm.cdf(z), index=returns.columns)
+
+
+def deflated_sharpe_ratio(returns: pd.DataFrame,
+                          n_trials: int = None,
+                          trial_sharpes=None,
+                          risk_free_rate: float = 0.05,
+                          trading_days: int = 252) -> pd.Series:
+    """
+    Deflated Sharpe ratio: PSR against the Sharpe expected from the best of
+    n_trials unskilled strategies.
+
+    Args:
+        returns: Daily returns, one column per strategy
+        n_trials: Number of strategies/parameter sets tried (defaults to
+            the number of trial Sharpe ratios)
+        trial_sharpes: Annualized Sharpe ratios of all trials, used for
+            their dispersion (defaults to the columns of returns)
+        risk_free_rate: Annual risk-free rate
+        trading_days: Trading days per year
+
+    Returns:
+        pd.Series: DSR per strategy
+    """
+    returns = pd.DataFrame(returns).dropna()
+    if trial_sharpes is None:
+        trial_sharpes = sharpe_ratios(returns.to_numpy(dtype=float), risk_free_rate, trading_days)
+    trial_sharpes = np.asarray(trial_sharpes, dtype=float)
+    n_trials = len(trial_sharpes) if n_trials is None else n_trials
+
+    # Expected maximum of n_trials Sharpe ratios drawn around zero
+    euler_gamma = 0.5772156649015329
+    sr_std = np.std(trial_sharpes, ddof=1) if len(trial_sharpes) > 1 else 0.0
+    if n_trials > 1:
+        expected_max = sr_std * ((1 - euler_gamma) * norm.ppf(1 - 1 / n_trials)
+                                 + euler_gamma * norm.ppf(1 - 1 / (n_trials * np.e)))
+    else:
+        expected_max = 0.0
+
+    return probabilistic_sharpe_ratio(returns, expected_max, risk_free_rate, trading_days)
@@ -2,54 +2,240 @@ import numpy as np
 import pandas as pd
 
 
-def calculate_performance_metrics(returns: pd.Series, 
-                                  risk_free_rate: float = 0.05,
-                                  trading_days: int = 252):
+def _as_matrix(returns):
+    """Split returns into a (days, columns) float array, index and column labels."""
+    if isinstance(returns, pd.Series):
+        returns = returns.to_frame()
+    if isinstance(returns, pd.DataFrame):
+        return returns.to_numpy(dtype=float), returns.index, returns.columns
+    values = np.asarray(returns, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    return values, pd.RangeIndex(len(values)), pd.RangeIndex(values.shape[1])
+
+
+# Volatility at or below this fraction of the mean excess return is
+# rounding noise of a constant series, which scores a Sharpe ratio of 0
+ZERO_VOL_RTOL = 1e-12
+
+
+def sharpe_ratios(returns: np.ndarray,
+                  risk_free_rate: float = 0.05,
+                  trading_days: int = 252,
+                  axis: int = 0) -> np.ndarray:
     """
-    Calculate comprehensive performance metrics.
+    Annualized Sharpe ratio of every column.
+    
+    Uses the sample standard deviation (ddof=1) of the excess returns and
+    skips NaNs; columns with zero volatility (up to ZERO_VOL_RTOL) score 0.
     
     Args:
-        returns: Series of daily returns
+        returns: Array of shape (days, columns)
         risk_free_rate: Annual risk-free rate
         trading_days: Trading days per year
-        
+        axis: Axis along which days run
+    
     Returns:
-        dict: Performance metrics
+        np.ndarray: Sharpe ratios of shape (columns,)
     """
-    excess_returns = returns - (risk_free_rate / trading_days)
+    excess = np.asarray(returns, dtype=float) - risk_free_rate / trading_days
+    with np.errstate(invalid='ignore', divide='ignore'):
+        count = np.sum(~np.isnan(excess), axis=axis, keepdims=True)
+        mean = np.nansum(excess, axis=axis, keepdims=True) / count
+        std = np.sqrt(np.nansum((excess - mean) ** 2, axis=axis, keepdims=True) / (count - 1))
+        mean = np.squeeze(mean, axis=axis)
+        std = np.squeeze(std, axis=axis)
+        sharpe = mean / std * np.sqrt(trading_days)
+    return np.where(np.isnan(std) | (std > ZERO_VOL_RTOL * np.abs(mean)), sharpe, 0.0)
+
+
+def wealth_paths(returns: np.ndarray) -> np.ndarray:
+    """Compounded wealth of every column starting from 1 (NaN returns count as 0)."""
+    return np.cumprod(1 + np.nan_to_num(np.asarray(returns, dtype=float)), axis=0)
+
+
+def max_drawdowns(wealth: np.ndarray) -> np.ndarray:
+    """
+    Maximum drawdown of every column of a wealth matrix.
     
-    # Sharpe Ratio
-    if excess_returns.std() != 0:
-        sharpe = (excess_returns.mean() / excess_returns.std()) * np.sqrt(trading_days)
-    else:
-        sharpe = 0.0
+    Drawdowns are measured from the running peak including the initial
+    wealth of 1, so a loss on the first day counts.
     
-    # Cumulative Return
-    cum_return = (1 + returns).cumprod().iloc[-1] - 1
+    Args:
+        wealth: Array of shape (days, columns) from wealth_paths
     
-    # Maximum Drawdown
-    cum_ret_series = (1 + returns).cumprod()
-    running_max = np.maximum.accumulate(cum_ret_series)
-    drawdowns = cum_ret_series / running_max - 1
-    max_dd = drawdowns.min()
+    Returns:
+        np.ndarray: Max drawdowns (<= 0) of shape (columns,)
+    """
+    if len(wealth) == 0:
+        return np.zeros(wealth.shape[1:])
+    peaks = np.maximum.accumulate(np.maximum(wealth, 1.0), axis=0)
+    return np.minimum((wealth / peaks - 1).min(axis=0), 0.0)
+
+
+def calculate_metrics_matrix(returns,
+                             risk_free_rate: float = 0.05,
+                             trading_days: int = 252) -> pd.DataFrame:
+    """
+    Performance metrics for every column of a returns matrix in one pass.
+    
+    Args:
+        returns: DataFrame, Series or array of daily returns with one
+            column per strategy or parameter set
+        risk_free_rate: Annual risk-free rate
+        trading_days: Trading days per year
+    
+    Returns:
+        pd.DataFrame: One row per column with sharpe_ratio,
+            cumulative_return, max_drawdown, win_rate, annual_volatility
+            and total_trades
+    """
+    values, _, columns = _as_matrix(returns)
+    wealth = wealth_paths(values)
+    n_days = len(values)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        count = np.sum(~np.isnan(values), axis=0)
+        mean = np.nansum(values, axis=0) / count
+        volatility = np.sqrt(np.nansum((values - mean) ** 2, axis=0) / (count - 1))
+        win_rate = np.sum(values > 0, axis=0) / n_days
+
+    return pd.DataFrame({
+        'sharpe_ratio': sharpe_ratios(values, risk_free_rate, trading_days),
+        'cumulative_return': wealth[-1] - 1 if n_days else np.zeros(len(columns)),
+        'max_drawdown': max_drawdowns(wealth),
+        'win_rate': win_rate,
+        'annual_volatility': volatility * np.sqrt(trading_days),
+        'total_trades': n_days,
+    }, index=columns)
+
+
+def rolling_metrics_matrix(returns,
+                           window: int,
+                           risk_free_rate: float = 0.05,
+                           trading_days: int = 252) -> dict:
+    """
+    Trailing-window Sharpe, cumulative return and drawdown for every column.
     
-    # Win Rate
-    win_rate = (returns > 0).sum() / len(returns)
+    Args:
+        returns: DataFrame, Series or array of daily returns
+        window: Window length in days
+        risk_free_rate: Annual risk-free rate
+        trading_days: Trading days per year
+    
+    Returns:
+        dict: {'sharpe_ratio', 'cumulative_return', 'max_drawdown'} ->
+            DataFrame shaped like returns (NaN for the first window - 1 days)
+    """
+    values, index, columns = _as_matrix(returns)
+    n_days = len(values)
+    shape = values.shape
+
+    # Window sums of centered excess returns keep the variance stable
+    excess = values - risk_free_rate / trading_days
+    valid = ~np.isnan(excess)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        center = np.nansum(excess, axis=0) / valid.sum(axis=0)
+    centered = np.where(valid, excess - np.nan_to_num(center), 0.0)
+    zero = np.zeros((1, shape[1]))
+    s1 = np.concatenate([zero, np.cumsum(centered, axis=0)])
+    s2 = np.concatenate([zero, np.cumsum(centered ** 2, axis=0)])
+    cnt = np.concatenate([zero, np.cumsum(valid, axis=0)])
+
+    sharpe = np.full(shape, np.nan)
+    growth = np.full(shape, np.nan)
+    drawdown = np.full(shape, np.nan)
+    if n_days >= window:
+        count = cnt[window:] - cnt[:-window]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = (s1[window:] - s1[:-window]) / count
+            var = ((s2[window:] - s2[:-window]) - count * mean ** 2) / (count - 1)
+            std = np.sqrt(np.maximum(var, 0.0))
+            ratio = (mean + np.nan_to_num(center)) / std * np.sqrt(trading_days)
+        sharpe[window - 1:] = np.where(std > ZERO_VOL_RTOL * np.abs(mean + np.nan_to_num(center)), ratio, 0.0)
+
+        # Compound each window from its own start so drawdowns are exact
+        gross = 1 + np.nan_to_num(values)
+        n_out = n_days - window + 1
+        wealth = np.ones((n_out, shape[1]))
+        peak = np.ones((n_out, shape[1]))
+        worst = np.zeros((n_out, shape[1]))
+        for j in range(window):
+            wealth *= gross[j:j + n_out]
+            np.maximum(peak, wealth, out=peak)
+            np.minimum(worst, wealth / peak - 1, out=worst)
+        growth[window - 1:] = wealth - 1
+        drawdown[window - 1:] = worst
+
+    return {
+        'sharpe_ratio': pd.DataFrame(sharpe, index=index, columns=columns),
+        'cumulative_return': pd.DataFrame(growth, index=index, columns=columns),
+        'max_drawdown': pd.DataFrame(drawdown, index=index, columns=columns),
+    }
+
+
+def expanding_metrics_matrix(returns,
+                             min_periods: int = 2,
+                             risk_free_rate: float = 0.05,
+                             trading_days: int = 252) -> dict:
+    """
+    Since-inception Sharpe, cumulative return and drawdown for every column.
     
-    # Volatility
-    annual_vol = returns.std() * np.sqrt(trading_days)
+    Args:
+        returns: DataFrame, Series or array of daily returns
+        min_periods: Days required before the Sharpe ratio is reported
+        risk_free_rate: Annual risk-free rate
+        trading_days: Trading days per year
     
+    Returns:
+        dict: {'sharpe_ratio', 'cumulative_return', 'max_drawdown'} ->
+            DataFrame shaped like returns
+    """
+    values, index, columns = _as_matrix(returns)
+
+    excess = values - risk_free_rate / trading_days
+    valid = ~np.isnan(excess)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        center = np.nan_to_num(np.nansum(excess, axis=0) / valid.sum(axis=0))
+        centered = np.where(valid, excess - center, 0.0)
+        count = np.cumsum(valid, axis=0)
+        mean = np.cumsum(centered, axis=0) / count
+        var = (np.cumsum(centered ** 2, axis=0) - count * mean ** 2) / (count - 1)
+        std = np.sqrt(np.maximum(var, 0.0))
+        sharpe = np.where(std > ZERO_VOL_RTOL * np.abs(mean + center),
+                          (mean + center) / std * np.sqrt(trading_days), 0.0)
+    sharpe[count < max(min_periods, 2)] = np.nan
+
+    wealth = wealth_paths(values)
+    peaks = np.maximum.accumulate(np.maximum(wealth, 1.0), axis=0)
+    drawdown = np.minimum.accumulate(np.minimum(wealth / peaks - 1, 0.0), axis=0)
+
     return {
-        'sharpe_ratio': sharpe,
-        'cumulative_return': cum_return,
-        'max_drawdown': max_dd,
-        'win_rate': win_rate,
-        'annual_volatility': annual_vol,
-        'total_trades': len(returns)
+        'sharpe_ratio': pd.DataFrame(sharpe, index=index, columns=columns),
+        'cumulative_return': pd.DataFrame(wealth - 1, index=index, columns=columns),
+        'max_drawdown': pd.DataFrame(drawdown, index=index, columns=columns),
     }
 
 
-def compare_strategies(strategy_returns: dict, 
+def calculate_performance_metrics(returns: pd.Series,
+                                  risk_free_rate: float = 0.05,
+                                  trading_days: int = 252):
+    """
+    Calculate comprehensive performance metrics.
+    
+    Args:
+        returns: Series of daily returns
+        risk_free_rate: Annual risk-free rate
+        trading_days: Trading days per year
+    
+    Returns:
+        dict: Performance metrics
+    """
+    metrics = calculate_metrics_matrix(pd.Series(returns), risk_free_rate, trading_days)
+    return metrics.iloc[0].to_dict() | {'total_trades': len(returns)}
+
+
+def compare_strategies(strategy_returns: dict,
                       risk_free_rate: float = 0.05):
     """
     Compare multiple strategies.
@@ -57,18 +243,24 @@ def compare_strategies(strategy_returns: dict,
     Args:
         strategy_returns: Dict of {strategy_name: returns_series}
         risk_free_rate: Annual risk-free rate
-        
+    
     Returns:
         pd.DataFrame: Comparison table
     """
-    results = []
-    
-    for name, returns in strategy_returns.items():
-        metrics = calculate_performance_metrics(returns, risk_free_rate)
-        metrics['strategy'] = name
-        results.append(metrics)
-    
-    df = pd.DataFrame(results)
-    df = df.set_index('strategy')
-    
+    series = list(strategy_returns.values())
+    first = series[0] if series else None
+    aligned = all(len(returns) == len(first) and
+                  (not isinstance(returns, pd.Series) or not isinstance(first, pd.Series)
+                   or returns.index.equals(first.index))
+                  for returns in series)
+
+    if aligned:
+        df = calculate_metrics_matrix(pd.DataFrame(strategy_returns), risk_free_rate)
+    else:
+        # Stacking series of different dates would pad them with NaN days,
+        # so each one is measured over its own days
+        df = pd.concat([calculate_metrics_matrix(np.asarray(returns, dtype=float), risk_free_rate)
+                        .set_axis([name]) for name, returns in strategy_returns.items()])
+    df.index.name = 'strategy'
+
     return df
@@ -0,0 +1,16 @@
+"""
+Data collection: asynchronous news scraping
+
+aiohttp and BeautifulSoup are imported when pages are fetched or parsed,
+so importing this package has no extra dependencies.
+"""
+from .barchart_news import PageCache, acollect_news, collect_news, fetch_pages, parse_listing, parse_published
+
+__all__ = [
+    'PageCache',
+    'acollect_news',
+    'collect_news',
+    'fetch_pages',
+    'parse_listing',
+    'parse_published'
+]
@@ -0,0 +1,298 @@
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from urllib.parse import urljoin, urlparse
+from zoneinfo import ZoneInfo
+
+from ..utils.config import get_data_paths
+
+
+LISTING_URL = 'https://www.barchart.com/news/commodities'
+SOURCE_NAME = 'barchart_all-commodities'
+USER_AGENT = 'Mozilla/5.0 (compatible; UMCO news collector)'
+
+MARKET_TZ = ZoneInfo('America/Chicago')
+# UTC offsets (hours) of the zone abbreviations barchart prints
+TZ_OFFSETS = {'CDT': -5, 'CST': -6, 'EDT': -4, 'EST': -5, 'UTC': 0, 'GMT': 0}
+
+_STORY_RE = re.compile(r'/story/news/(\d+)/')
+_PUBLISHED_RE = re.compile(r'([A-Z][a-z]{2} [A-Z][a-z]{2} \d{1,2}, \d{1,2}:\d{2}\s*[AP]M(?: [A-Z]{2,4})?)')
+_RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+def parse_published(text: str, reference: date = None) -> int:
+    """
+    UTC timestamp of a barchart time string such as 'Fri May 30, 5:14PM CDT'.
+
+    The strings carry no year: the year of the reference date is used,
+    stepping back a year when that would put the story in the future
+    (listings read in early January) or the date does not exist in that
+    year (Feb 29).
+
+    Args:
+        text: Published string as shown on the site
+        reference: Collection date (defaults to today in America/Chicago)
+
+    Returns:
+        int: Seconds since the epoch (UTC)
+    """
+    reference = reference or datetime.now(MARKET_TZ).date()
+    parts = text.strip().split()
+    zone = parts[-1] if parts[-1] in TZ_OFFSETS else None
+    stamp = ' '.join(parts[1:-1] if zone else parts[1:]).replace(' PM', 'PM').replace(' AM', 'AM')
+
+    # Feb 29 only parses in leap years, so keep stepping back until one fits
+    for year in range(reference.year, reference.year - 8, -1):
+        try:
+            naive = datetime.strptime(f'{stamp} {year}', '%b %d, %I:%M%p %Y')
+        except ValueError:
+            continue
+        if naive.date() <= reference + timedelta(days=1):
+            break
+    else:
+        raise ValueError(f"Cannot resolve a year for published time '{text}'")
+    if zone:
+        aware = naive.replace(tzinfo=timezone(timedelta(hours=TZ_OFFSETS[zone])))
+    else:
+        aware = naive.replace(tzinfo=MARKET_TZ)
+    return int(aware.timestamp())
+
+
+def parse_listing(html: str, base_url: str = LISTING_URL, reference: date = None) -> list:
+    """
+    Stories on one news listing page, in the news-dataset schema.
+
+    Every link to /story/news/<id>/ is a story; its published time and
+    excerpt are taken from the closest enclosing element that has them.
+
+    Args:
+        html: Listing page HTML
+        base_url: URL the page was fetched from (to resolve relative links)
+        reference: Collection date for year inference (see parse_published)
+
+    Returns:
+        list: Dicts with id, title, url, published_str_original,
+            published_timestamp_utc and summary
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    stories = {}
+    for link in soup.find_all('a', href=_STORY_RE):
+        story_id = _STORY_RE.search(link['href']).group(1)
+        title = link.get_text(' ', strip=True)
+        if story_id in stories or not title:
+            continue
+
+        container, published = link.parent, None
+        while container is not None and container.name not in ('body', 'html'):
+            match = _PUBLISHED_RE.search(container.get_text(' ', strip=True))
+            if match:
+                published = match.group(1)
+                break
+            container = container.parent
+        if published is None:
+            continue
+
+        excerpt = container.find(class_=re.compile('excerpt|summary|description')) if container else None
+        stories[story_id] = {
+            'id': story_id,
+            'title': title,
+            'url': urljoin(base_url, link['href']).split('?')[0],
+            'published_str_original': published,
+            'published_timestamp_utc': parse_published(published, reference),
+            'summary': excerpt.get_text(' ', strip=True) if excerpt else '',
+        }
+    return list(stories.values())
+
+
+class PageCache:
+    """
+    On-disk cache of fetched pages with their HTTP validators.
+
+    Each URL maps to <sha256>.html (body) and <sha256>.json (url, ETag,
+    Last-Modified, fetch time), used for conditional revalidation.
+    """
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = Path(cache_dir or get_data_paths()['cache_dir'] / 'pages')
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def get(self, url: str):
+        """Cached (body, meta) for url, or None."""
+        key = self._key(url)
+        try:
+            with open(self.cache_dir / f'{key}.json', 'r') as f:
+                meta = json.load(f)
+            body = (self.cache_dir / f'{key}.html').read_text(encoding='utf-8')
+        except (OSError, ValueError):
+            return None
+        return body, meta
+
+    def put(self, url: str, body: str, etag: str = None, last_modified: str = None):
+        key = self._key(url)
+        for suffix, content in (('html', body), ('json', json.dumps({
+            'url': url, 'etag': etag, 'last_modified': last_modified, 'fetched_at': time.time()
+        }))):
+            path = self.cache_dir / f'{key}.{suffix}'
+            tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_path.write_text(content, encoding='utf-8')
+            os.replace(tmp_path, path)
+
+    def touch(self, url: str, meta: dict):
+        """Record a successful revalidation (304) of a cached page."""
+        with open(self.cache_dir / f'{self._key(url)}.json', 'w') as f:
+            json.dump(dict(meta, fetched_at=time.time()), f)
+
+
+async def _fetch(session, url: str, cache: PageCache, host_limits: dict, per_host: int,
+                 max_age: float, max_retries: int, stats: dict) -> str:
+    import aiohttp
+
+    cached = cache.get(url) if cache is not None else None
+    if cached and max_age and time.time() - cached[1]['fetched_at'] < max_age:
+        stats['fresh'] += 1
+        return cached[0]
+
+    headers = {}
+    if cached:
+        if cached[1].get('etag'):
+            headers['If-None-Match'] = cached[1]['etag']
+        if cached[1].get('last_modified'):
+            headers['If-Modified-Since'] = cached[1]['last_modified']
+
+    host = urlparse(url).netloc
+    semaphore = host_limits.setdefault(host, asyncio.Semaphore(per_host))
+    delay = 1.0
+    for attempt in range(max_retries + 1):
+        async with semaphore:
+            try:
+                async with session.get(url, headers=headers) as response:
+                    stats['requests'] += 1
+                    if response.status == 304 and cached:
+                        stats['not_modified'] += 1
+                        cache.touch(url, cached[1])
+                        return cached[0]
+                    if response.status not in _RETRY_STATUS:
+                        response.raise_for_status()
+                        body = await response.text()
+                        if cache is not None:
+                            cache.put(url, body, response.headers.get('ETag'),
+                                      response.headers.get('Last-Modified'))
+                        return body
+                    error = f'HTTP {response.status}'
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                error = repr(e)
+        if attempt == max_retries:
+            raise RuntimeError(f"Failed to fetch {url}: {error}")
+        print(f"Fetching {url} failed ({error}); retrying in {delay:.0f}s")
+        await asyncio.sleep(delay)
+        delay *= 2
+
+
+async def fetch_pages(urls: list, cache_dir=None, per_host: int = 4, total: int = 32,
+                      timeout: float = 30.0, max_age: float = 0.0, max_retries: int = 2,
+                      use_cache: bool = True) -> dict:
+    """
+    Fetch pages concurrently through one pooled aiohttp session.
+
+    Cached pages are revalidated with If-None-Match / If-Modified-Since,
+    so unchanged pages cost a 304 instead of a full download.
+
+    Args:
+        urls: Page URLs
+        cache_dir: Page cache directory (defaults to data/cache/pages)
+        per_host: Concurrent requests per host
+        total: Connection pool size across hosts
+        timeout: Total timeout per request in seconds
+        max_age: Serve cached pages younger than this many seconds
+            without contacting the server
+        max_retries: Retries after connection errors, 429 and 5xx
+        use_cache: Read and write the page cache
+
+    Returns:
+        dict: url -> page body (failed URLs are omitted and reported)
+    """
+    try:
+        import aiohttp
+    except ImportError as e:
+        raise ImportError("aiohttp is required for news collection (pip install aiohttp)") from e
+
+    cache = PageCache(cache_dir) if use_cache else None
+    urls = list(dict.fromkeys(urls))
+    stats = {'requests': 0, 'not_modified': 0, 'fresh': 0}
+    host_limits = {}
+    connector = aiohttp.TCPConnector(limit=total, limit_per_host=per_host)
+    async with aiohttp.ClientSession(connector=connector, headers={'User-Agent': USER_AGENT},
+                                     timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+        results = await asyncio.gather(
+            *(_fetch(session, url, cache, host_limits, per_host, max_age, max_retries, stats) for url in urls),
+            return_exceptions=True,
+        )
+
+    pages = {}
+    for url, result in zip(urls, results):
+        if isinstance(result, Exception):
+            print(f"Skipping {url}: {result}")
+        else:
+            pages[url] = result
+    print(f"Fetched {len(pages)}/{len(urls)} pages: {stats['requests']} requests, "
+          f"{stats['not_modified']} not modified, {stats['fresh']} served from cache")
+    return pages
+
+
+async def acollect_news(listing_urls: list = None, pages: int = 1, day: date = None, output_dir=None,
+                        **fetch_kwargs) -> list:
+    """
+    Collect one day of news stories and write them as a news-dataset file.
+
+    Args:
+        listing_urls: Listing pages to read (defaults to LISTING_URL)
+        pages: Listing pages per URL (?page=1..pages)
+        day: Market date to keep (defaults to today in America/Chicago)
+        output_dir: Root of the news dataset (defaults to data/news-dataset);
+            the file goes to <output_dir>/<year>/<YYYYMMDD>_barchart_all-commodities_news.json.
+            Pass False to skip writing
+        **fetch_kwargs: Passed to fetch_pages
+
+    Returns:
+        list: Stories of the day, newest first
+    """
+    day = day or datetime.now(MARKET_TZ).date()
+    listing_urls = listing_urls or [LISTING_URL]
+    urls = [url if pages == 1 and page == 1 else f'{url}?page={page}'
+            for url in listing_urls for page in range(1, pages + 1)]
+
+    fetched = await fetch_pages(urls, **fetch_kwargs)
+
+    stories = {}
+    for url in urls:
+        if url in fetched:
+            for story in parse_listing(fetched[url], url, reference=day):
+                stories.setdefault(story['id'], story)
+    stories = [s for s in stories.values()
+               if datetime.fromtimestamp(s['published_timestamp_utc'], MARKET_TZ).date() == day]
+    stories.sort(key=lambda s: (s['published_timestamp_utc'], s['id']), reverse=True)
+
+    if output_dir is not False:
+        out_dir = Path(output_dir or get_data_paths()['news_dir']) / str(day.year)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        out_path = out_dir / f'{day:%Y%m%d}_{SOURCE_NAME}_news.json'
+        with open(out_path, 'w', encoding='utf-8') as f:
+            json.dump(stories, f, indent=4, ensure_ascii=False)
+        print(f"Wrote {len(stories)} stories to {out_path}")
+    return stories
+
+
+def collect_news(listing_urls: list = None, pages: int = 1, day: date = None, output_dir=None,
+                 **fetch_kwargs) -> list:
+    """Synchronous wrapper around acollect_news."""
+    return asyncio.run(acollect_news(listing_urls, pages, day, output_dir, **fetch_kwargs))
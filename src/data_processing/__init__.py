@@ -1,12 +1,30 @@
 """
 Data processing modules for loading and preparing financial data
 """
-from .load_data import load_and_prepare_data
+from .load_data import load_and_prepare_data, load_combined_classification_data
 from .price_data import load_price_data
-from .classification_data import load_classification_data
+from .classification_data import extract_theme_scores, label_indicators
+from .panel import PanelStore, build_commodity_panel, theme_fields, write_panel, write_theme_panel
+from .news_store import NewsStore, iter_news_items, map_commodities
+from .briefings import load_briefings, parse_briefing
+from .text_index import TextIndex, load_text_index
 
 __all__ = [
     'load_and_prepare_data',
+    'load_combined_classification_data',
     'load_price_data', 
-    'load_classification_data'
+    'extract_theme_scores',
+    'label_indicators',
+    'PanelStore',
+    'build_commodity_panel',
+    'theme_fields',
+    'write_panel',
+    'write_theme_panel',
+    'NewsStore',
+    'iter_news_items',
+    'map_commodities',
+    'load_briefings',
+    'parse_briefing',
+    'TextIndex',
+    'load_text_index'
 ]
@@ -0,0 +1,218 @@
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from ..utils.config import get_data_paths
+from .cache import file_digest, read_manifest, update_manifest
+
+
+MANIFEST_NAME = 'briefings_manifest.json'
+
+# Recorded in every manifest entry: bump when parse_briefing_text changes
+# its output so that all briefings are reparsed
+PARSER_VERSION = 1
+
+# Columns of combined_reason_factors.csv, followed by the extra briefing fields
+REASON_COLUMNS = ['date', 'commodity', 'key drivers', 'reverse factors']
+BRIEFING_COLUMNS = REASON_COLUMNS + ['price movement', 'classification', 'sector']
+
+_DATE_RE = re.compile(r'^News Briefing for:\s*(\d{4}-\d{2}-\d{2})')
+_HEADING_RE = re.compile(r'^(#{3,4})\s*\*\*(.+?)\*\*')
+_ITEM_RE = re.compile(r'^\s*\d+\.\s*\*\*(.+?)\*\*')
+_FIELD_RE = re.compile(r'^\s*-\s*\*\*(.+?):\*\*\s*(.*)$')
+_BULLET_RE = re.compile(r'^\s*-\s+(.*)$')
+_CLASSIFICATION_RE = re.compile(r'`([^`]+)`')
+
+_FIELDS = {
+    'Price Movement': 'price movement',
+    'Key Drivers': 'key drivers',
+    'Potential Reverse Factors': 'reverse factors',
+    'Reverse Factors': 'reverse factors',
+    'Classification': 'classification',
+}
+
+
+def _clean(text: str) -> str:
+    return text.strip().rstrip('.').strip()
+
+
+def _finish_item(item: dict) -> dict:
+    drivers = [_clean(d) for d in item.pop('_drivers') if _clean(d)]
+    if drivers:
+        item['key drivers'] = '; '.join(drivers)
+    classification = item.get('classification')
+    if classification:
+        match = _CLASSIFICATION_RE.search(classification)
+        item['classification'] = match.group(1).strip() if match else _clean(classification)
+    return item
+
+
+def parse_briefing_text(text: str, date: str = None) -> list:
+    """
+    Extract per-commodity rows from the text of one daily briefing.
+
+    Commodities are the numbered bold items under each '#### **SECTOR**'
+    heading; parsing stops at the next '###' heading (the summary and
+    classification table).
+
+    Args:
+        text: Briefing file content
+        date: Date to use if the 'News Briefing for:' header is missing
+
+    Returns:
+        list: One dict per commodity with BRIEFING_COLUMNS keys
+    """
+    rows = []
+    sector = None
+    item = None
+    field = None
+
+    for line in text.splitlines():
+        line = line.rstrip()
+        if not line:
+            continue
+
+        match = _DATE_RE.match(line)
+        if match:
+            date = match.group(1)
+            continue
+
+        match = _HEADING_RE.match(line)
+        if match:
+            if item is not None:
+                rows.append(_finish_item(item))
+                item = None
+            if len(match.group(1)) == 3:
+                if sector is not None:
+                    break
+                continue
+            sector = match.group(2).strip().title()
+            continue
+
+        if sector is None:
+            continue
+
+        match = _ITEM_RE.match(line)
+        if match:
+            if item is not None:
+                rows.append(_finish_item(item))
+            item = {col: None for col in BRIEFING_COLUMNS}
+            item.update(date=date, commodity=match.group(1).strip(), sector=sector, _drivers=[])
+            field = None
+            continue
+
+        if item is None:
+            continue
+
+        match = _FIELD_RE.match(line)
+        if match:
+            field = _FIELDS.get(match.group(1).strip())
+            value = match.group(2).strip()
+            if field == 'key drivers':
+                if value:
+                    item['_drivers'].append(value)
+            elif field is not None:
+                item[field] = _clean(value) if field != 'classification' else value
+            continue
+
+        match = _BULLET_RE.match(line)
+        if match and field == 'key drivers':
+            item['_drivers'].append(match.group(1))
+
+    if item is not None:
+        rows.append(_finish_item(item))
+    return rows
+
+
+def parse_briefing(path) -> list:
+    """
+    Parse one daily briefing file.
+
+    The date comes from the 'News Briefing for:' header, falling back to
+    the YYYYMMDD prefix of the file name.
+
+    Args:
+        path: Path to a *_daily_briefing.txt file
+
+    Returns:
+        list: Row dicts (see parse_briefing_text)
+    """
+    path = Path(path)
+    stem_date = path.name[:8]
+    date = f'{stem_date[:4]}-{stem_date[4:6]}-{stem_date[6:]}' if stem_date.isdigit() else None
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_briefing_text(f.read(), date)
+
+
+def load_briefings(briefing_dir=None, pattern: str = '**/*_daily_briefing.txt', output_path=None,
+                   cache_dir=None, n_workers: int = None) -> pd.DataFrame:
+    """
+    Parse a directory of daily briefings into reason-factor rows.
+
+    Parsed rows are kept in a manifest keyed on each file's path, mtime,
+    size and SHA-256, so only new or changed briefings are reparsed;
+    a touched file whose content is unchanged is rehashed but not reparsed.
+    Entries parsed by another PARSER_VERSION are reparsed.
+
+    Args:
+        briefing_dir: Root directory (defaults to data/news-briefing)
+        pattern: Glob pattern of briefing files
+        output_path: Optional CSV path to write the result to
+        cache_dir: Manifest directory (defaults to get_data_paths()['cache_dir'])
+        n_workers: Worker processes for reparsing (1 = run in-process)
+
+    Returns:
+        pd.DataFrame: BRIEFING_COLUMNS rows sorted by date; the first four
+            columns match combined_reason_factors.csv
+    """
+    paths = get_data_paths()
+    briefing_dir = Path(briefing_dir or paths['briefing_dir'])
+    cache_dir = Path(cache_dir or paths['cache_dir'])
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = cache_dir / MANIFEST_NAME
+
+    manifest = read_manifest(manifest_path)
+    updated = {}
+    stale = []
+    touched = False
+    for path in sorted(briefing_dir.glob(pattern)):
+        path = path.resolve()
+        stat = path.stat()
+        entry = manifest.get(str(path))
+        if entry and entry.get('parser_version') != PARSER_VERSION:
+            entry = None
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            updated[str(path)] = entry
+            continue
+        digest = file_digest(path)
+        if entry and entry['sha256'] == digest:
+            updated[str(path)] = dict(entry, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+            touched = True
+            continue
+        updated[str(path)] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': digest,
+                              'parser_version': PARSER_VERSION}
+        stale.append(path)
+
+    if stale:
+        if n_workers == 1 or len(stale) == 1:
+            parsed = [parse_briefing(path) for path in stale]
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                parsed = list(executor.map(parse_briefing, stale, chunksize=16))
+        for path, rows in zip(stale, parsed):
+            updated[str(path)]['rows'] = rows
+
+    print(f"Briefings in {briefing_dir}: {len(updated)} files, {len(stale)} parsed")
+    if stale or touched or updated.keys() != manifest.keys():
+        update_manifest(manifest_path, updated, removed=manifest.keys() - updated.keys(), indent=1)
+
+    rows = [row for entry in updated.values() for row in entry['rows']]
+    df = pd.DataFrame(rows, columns=BRIEFING_COLUMNS)
+    df = df.sort_values('date', kind='stable').reset_index(drop=True)
+
+    if output_path:
+        df.to_csv(output_path, index=False)
+        print(f"Wrote {len(df)} briefing rows to {output_path}")
+    return df
@@ -0,0 +1,195 @@
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+
+from ..utils.config import get_data_paths
+
+
+MANIFEST_NAME = 'manifest.json'
+
+# Part of every cache key: bump when a cached loader's output changes so
+# frames parsed by the old code are not served
+LOADER_VERSION = 1
+
+
+def parquet_available() -> bool:
+    """Check whether a Parquet engine (pyarrow or fastparquet) is installed."""
+    for engine in ('pyarrow', 'fastparquet'):
+        try:
+            __import__(engine)
+            return True
+        except ImportError:
+            continue
+    return False
+
+
+def file_digest(path, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_manifest(manifest_path: Path) -> dict:
+    """Manifest contents, or {} if it is missing or unreadable."""
+    if manifest_path.exists():
+        try:
+            with open(manifest_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+    return {}
+
+
+@contextmanager
+def manifest_lock(manifest_path: Path, stale_after: float = 60.0, poll: float = 0.02):
+    """
+    Hold <manifest>.lock for a read-modify-write of the manifest.
+
+    The lock file is created with O_EXCL, which works across processes on
+    any platform; a lock older than stale_after seconds is taken to be
+    left behind by a crashed process and removed.
+    """
+    lock_path = manifest_path.with_name(manifest_path.name + '.lock')
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - lock_path.stat().st_mtime > stale_after:
+                    lock_path.unlink()
+                    continue
+            except FileNotFoundError:
+                continue
+            time.sleep(poll)
+    try:
+        os.write(fd, str(os.getpid()).encode())
+        os.close(fd)
+        yield
+    finally:
+        try:
+            lock_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def update_manifest(manifest_path: Path, entries: dict, removed=(), indent: int = 2) -> dict:
+    """
+    Merge entries into a manifest shared by concurrent processes.
+
+    Under manifest_lock the current manifest is re-read, the removed keys
+    are dropped and the entries set, and the result is written to a
+    per-process temporary file that atomically replaces the manifest, so
+    concurrent writers neither lose each other's entries nor collide on
+    the temporary file.
+
+    Args:
+        manifest_path: Manifest JSON file
+        entries: {key: entry} to add or replace
+        removed: Keys to drop
+        indent: JSON indentation
+
+    Returns:
+        dict: The manifest as written
+    """
+    with manifest_lock(manifest_path):
+        manifest = read_manifest(manifest_path)
+        for key in removed:
+            manifest.pop(key, None)
+        manifest.update(entries)
+
+        tmp_path = manifest_path.with_name(f'{manifest_path.name}.{os.getpid()}.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f, indent=indent, sort_keys=True)
+        os.replace(tmp_path, manifest_path)
+    return manifest
+
+
+def cached_frame(source_path, kind: str, loader, cache_dir=None, version=LOADER_VERSION) -> pd.DataFrame:
+    """
+    Load a parsed DataFrame from the columnar cache, parsing only on a miss.
+
+    Entries are keyed on the SHA-256 of the source file and the loader
+    version. The source's mtime and size are recorded too, so an
+    untouched file is served without rehashing, and a modified file is
+    rehashed and reparsed only if its content actually changed.
+
+    Args:
+        source_path: Path to the raw CSV/Excel file
+        kind: Name of the parsed representation (e.g. 'price')
+        loader: Callable taking source_path and returning a DataFrame
+        cache_dir: Cache directory (defaults to get_data_paths()['cache_dir'])
+        version: Loader version; frames cached under another version are
+            reparsed
+
+    Returns:
+        pd.DataFrame: Parsed data
+    """
+    if not parquet_available():
+        return loader(source_path)
+
+    cache_dir = Path(cache_dir or get_data_paths()['cache_dir'])
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    source = Path(source_path).resolve()
+    stat = source.stat()
+    entry_key = f'{kind}|{source}'
+    manifest_path = cache_dir / MANIFEST_NAME
+
+    manifest = read_manifest(manifest_path)
+    entry = manifest.get(entry_key)
+
+    if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+        digest = entry['sha256']
+    else:
+        digest = file_digest(source)
+
+    cache_file = cache_dir / f'{kind}-v{version}-{digest[:20]}.parquet'
+    new_entry = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': digest,
+                 'version': version, 'file': cache_file.name}
+    if cache_file.exists():
+        try:
+            df = pd.read_parquet(cache_file)
+        except Exception as e:
+            print(f"Ignoring unreadable cache file {cache_file}: {e}")
+        else:
+            if entry != new_entry:
+                update_manifest(manifest_path, {entry_key: new_entry})
+            return df
+
+    df = loader(source)
+    tmp_file = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.tmp')
+    try:
+        df.to_parquet(tmp_file, index=False)
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        tmp_file.unlink(missing_ok=True)
+        print(f"Could not cache {source.name}: {e}")
+        return df
+
+    manifest = update_manifest(manifest_path, {entry_key: new_entry})
+    if entry and entry.get('file') != cache_file.name:
+        stale = cache_dir / entry['file']
+        if stale.exists() and not any(e.get('file') == entry['file'] for e in manifest.values()):
+            stale.unlink()
+    return df
+
+
+def clear_cache(cache_dir=None):
+    """Remove all cached frames and the manifest."""
+    cache_dir = Path(cache_dir or get_data_paths()['cache_dir'])
+    if not cache_dir.exists():
+        return
+    for path in cache_dir.glob('*.parquet'):
+        path.unlink()
+    manifest_path = cache_dir / MANIFEST_NAME
+    if manifest_path.exists():
+        manifest_path.unlink()
@@ -1,8 +1,51 @@
-import pandas as pd
+import hashlib
 import re
 
+import numpy as np
+import pandas as pd
+
+from ..utils.profiling import profiled, span
+
+
+_LABEL_PATTERN = re.compile(r'\((.*?)\)')
+_LABEL_CACHE = {}
+_LABEL_CACHE_SIZE = 8
+
+
+def label_indicators(texts: pd.Series) -> pd.DataFrame:
+    """
+    One-hot matrix of every parenthesized label mentioned in each text.
+    
+    The matrix covers all labels, not just a category list, and is cached
+    by text content, so re-extracting with different categories only
+    selects columns.
+    
+    Args:
+        texts: Series of driver texts, e.g. "OPEC+ output boost (supply)"
+        
+    Returns:
+        pd.DataFrame: 0/1 matrix indexed like texts with one column per label
+    """
+    key = hashlib.sha1(pd.util.hash_pandas_object(texts, index=True).to_numpy().tobytes()).hexdigest()
+    if key in _LABEL_CACHE:
+        return _LABEL_CACHE[key]
+    
+    matches = texts.reset_index(drop=True).str.findall(_LABEL_PATTERN).explode()
+    codes, labels = pd.factorize(matches)
+    found = codes >= 0
+    
+    values = np.zeros((len(texts), len(labels)), dtype=int)
+    values[matches.index.to_numpy()[found], codes[found]] = 1
+    indicators = pd.DataFrame(values, index=texts.index, columns=list(labels))
+    
+    if len(_LABEL_CACHE) >= _LABEL_CACHE_SIZE:
+        _LABEL_CACHE.pop(next(iter(_LABEL_CACHE)))
+    _LABEL_CACHE[key] = indicators
+    return indicators
+
 
-def extract_theme_scores(df_reason, df_price, categories):
+@profiled(rows=lambda df: len(df))
+def extract_theme_scores(df_reason, df_price, categories, category_matrix=None):
     """
     Extract theme scores from classification data.
     
@@ -10,6 +53,9 @@ def extract_theme_scores(df_reason, df_price, categories):
         df_reason: DataFrame with key drivers and classifications
         df_price: DataFrame with price changes
         categories: List of category names to extract
+        category_matrix: Optional precomputed 0/1 label matrix with one row
+            per df_reason row (e.g. TextIndex.category_matrix()); replaces
+            scanning the key drivers texts
         
     Returns:
         pd.DataFrame: DataFrame with theme scores
@@ -17,36 +63,30 @@ def extract_theme_scores(df_reason, df_price, categories):
     df_reason['date'] = pd.to_datetime(df_reason['date'], format='%Y-%m-%d')
     df_price['Date'] = pd.to_datetime(df_price['Date'])
     
-    merged_df = pd.merge(df_reason, df_price, left_on='date', right_on='Date', how='inner')
+    if category_matrix is not None and len(category_matrix) != len(df_reason):
+        raise ValueError(f"category_matrix has {len(category_matrix)} rows, df_reason has {len(df_reason)}")
     
-    results = []
+    with span('merge') as s:
+        left = df_reason if category_matrix is None else df_reason.assign(_row=np.arange(len(df_reason)))
+        merged_df = pd.merge(left, df_price, left_on='date', right_on='Date', how='inner')
+        s.rows = len(merged_df)
     
-    for index, row in merged_df.iterrows():
-        key_drivers_text = row['key drivers']
-        price_change = row['%Chg']
-        
-        # Extract categories mentioned in parentheses
-        mentioned_categories = set(re.findall(r'\((.*?)\)', key_drivers_text))
-        mentioned_categories = mentioned_categories.intersection(categories)
-        num_categories = len(mentioned_categories)
-        
-        if num_categories > 0:
-            fractional_score = price_change / num_categories
+    if category_matrix is not None:
+        indicators = category_matrix.iloc[merged_df['_row'].to_numpy()].set_axis(merged_df.index)
+    else:
+        # Categories mentioned in parentheses, one column per label
+        with span('label_indicators', rows=len(merged_df)):
+            indicators = label_indicators(merged_df['key drivers'])
+    
+    results = pd.DataFrame({
+        'date': merged_df['date'],
+        'commodity': merged_df['commodity'],
+        'price_change': merged_df['%Chg']
+    })
+    for cat in categories:
+        if cat in indicators.columns:
+            results[f'{cat}_sym'] = indicators[cat].astype(int)
         else:
-            fractional_score = 0
-        
-        row_scores = {
-            'date': row['date'],
-            'commodity': row['commodity'],
-            'price_change': price_change
-        }
-        
-        for cat in categories:
-            if cat in mentioned_categories:
-                row_scores[f'{cat}_sym'] = 1
-            else:
-                row_scores[f'{cat}_sym'] = 0
-                
-        results.append(row_scores)
-    
-    return pd.DataFrame(results)
+            results[f'{cat}_sym'] = 0
+    
+    return results
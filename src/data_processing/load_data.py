@@ -2,8 +2,42 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 
+from .cache import cached_frame
+from .price_data import load_price_data
+from ..utils.profiling import profiled, span
 
-def load_and_prepare_data(price_csv_path, classification_csv_path, commodity_name):
+
+def parse_price_changes(price_csv_path):
+    """
+    Parse a price CSV/Excel file into sorted Date and price_change columns.
+    
+    Args:
+        price_csv_path: Path to price data CSV/Excel
+        
+    Returns:
+        pd.DataFrame: DataFrame with 'Date' and 'price_change'
+    """
+    price_df = load_price_data(price_csv_path, use_cache=False)
+    
+    # Handle price change column
+    if 'Change %' in price_df.columns:
+        price_df['price_change'] = price_df['Change %'].astype(str).str.rstrip('%').astype('float') / 100.0
+    elif '%Chg' in price_df.columns:
+        price_df['price_change'] = price_df['%Chg']
+        
+    return price_df[['Date', 'price_change']].sort_values(by='Date').reset_index(drop=True)
+
+
+def parse_classification_data(classification_csv_path):
+    """Read a classification CSV and parse its %Y%m%d dates."""
+    classification_df = pd.read_csv(classification_csv_path)
+    classification_df['date'] = pd.to_datetime(classification_df['date'], format='%Y%m%d')
+    return classification_df
+
+
+@profiled(rows=lambda df: len(df))
+def load_and_prepare_data(price_csv_path, classification_csv_path, commodity_name,
+                          use_cache=True, cache_dir=None):
     """
     Loads, preprocesses, and merges price and classification data.
     
@@ -11,37 +45,33 @@ def load_and_prepare_data(price_csv_path, classification_csv_path, commodity_nam
         price_csv_path: Path to price data CSV/Excel
         classification_csv_path: Path to classification CSV
         commodity_name: Name of commodity to filter
+        use_cache: Serve parsed inputs from the columnar cache
+        cache_dir: Cache directory (defaults to data/cache)
         
     Returns:
         pd.DataFrame: Merged dataframe with price and classification data
     """
     print(f"Loading price data from: {price_csv_path}")
     try:
-        # Handle both CSV and Excel formats
-        if str(price_csv_path).endswith('.xlsx'):
-            price_df = pd.read_excel(price_csv_path, engine='openpyxl')
-            if 'Exchange Date' in price_df.columns:
-                price_df.rename(columns={'Exchange Date': 'Date'}, inplace=True)
-        else:
-            price_df = pd.read_csv(price_csv_path)
-            
-        price_df['Date'] = pd.to_datetime(price_df['Date'])
-        
-        # Handle price change column
-        if 'Change %' in price_df.columns:
-            price_df['price_change'] = price_df['Change %'].astype(str).str.rstrip('%').astype('float') / 100.0
-        elif '%Chg' in price_df.columns:
-            price_df['price_change'] = price_df['%Chg']
-            
-        price_df = price_df[['Date', 'price_change']].sort_values(by='Date').reset_index(drop=True)
+        with span('load_prices') as s:
+            if use_cache:
+                price_df = cached_frame(price_csv_path, 'price_changes', parse_price_changes, cache_dir)
+            else:
+                price_df = parse_price_changes(price_csv_path)
+            s.rows = len(price_df)
     except Exception as e:
         print(f"Error loading price data: {e}")
         return None
 
     print(f"Loading classification data from: {classification_csv_path}")
     try:
-        classification_df = pd.read_csv(classification_csv_path)
-        classification_df['date'] = pd.to_datetime(classification_df['date'], format='%Y%m%d')
+        with span('load_classification') as s:
+            if use_cache:
+                classification_df = cached_frame(classification_csv_path, 'classification',
+                                                  parse_classification_data, cache_dir)
+            else:
+                classification_df = parse_classification_data(classification_csv_path)
+            s.rows = len(classification_df)
         
         # Filter for specific commodity
         commodity_df = classification_df[
@@ -58,7 +88,9 @@ def load_and_prepare_data(price_csv_path, classification_csv_path, commodity_nam
         return None
 
     print("Merging price and classification data...")
-    merged_df = pd.merge(price_df, commodity_df, on='Date', how='inner')
+    with span('merge') as s:
+        merged_df = pd.merge(price_df, commodity_df, on='Date', how='inner')
+        s.rows = len(merged_df)
     
     if merged_df.empty:
         print("No data after merging. Check date alignment.")
@@ -71,13 +103,15 @@ def load_and_prepare_data(price_csv_path, classification_csv_path, commodity_nam
     return merged_df.sort_values(by='Date').reset_index(drop=True)
 
 
-def load_combined_classification_data(data_dir, years):
+def load_combined_classification_data(data_dir, years, use_cache=True, cache_dir=None):
     """
     Load and combine classification data from multiple years.
     
     Args:
         data_dir: Directory containing classification CSV files
         years: List of years to load
+        use_cache: Serve parsed files from the columnar cache
+        cache_dir: Cache directory (defaults to data/cache)
         
     Returns:
         pd.DataFrame: Combined classification data
@@ -86,7 +120,10 @@ def load_combined_classification_data(data_dir, years):
     for year in years:
         file_path = Path(data_dir) / f'{year}_combined_price_movement.csv'
         if file_path.exists():
-            df = pd.read_csv(file_path)
+            if use_cache:
+                df = cached_frame(file_path, 'classification_raw', pd.read_csv, cache_dir)
+            else:
+                df = pd.read_csv(file_path)
             dfs.append(df)
         else:
             print(f"Warning: {file_path} not found")
@@ -0,0 +1,315 @@
+import json
+import re
+import sqlite3
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+from ..utils.config import get_data_paths
+
+
+# Barchart timestamps are US Central; trading dates follow that calendar
+MARKET_TZ = ZoneInfo('America/Chicago')
+
+# Ordered: more specific patterns first ("bean oil" before "beans")
+COMMODITY_PATTERNS = [
+    ('Soybean Oil', r'\b(?:soybean|soy|bean) oil\b'),
+    ('Soybean Meal', r'\b(?:soybean|soy|bean) meal\b'),
+    ('Soybeans', r'\b(?:soy)?beans?\b(?! oil| meal)'),
+    ('Crude Oil', r'\b(?:crude|wti|brent)\b'),
+    ('Natural Gas', r'\b(?:nat-gas|natural gas|natgas)\b'),
+    ('Wheat', r'\bwheat\b'),
+    ('Corn', r'\bcorn\b'),
+    ('Cattle', r'\bcattle\b'),
+    ('Hogs', r'\bhogs?\b'),
+    ('Coffee', r'\bcoffee\b'),
+    ('Cocoa', r'\bcocoa\b'),
+    ('Cotton', r'\bcotton\b'),
+    ('Sugar', r'\bsugar\b'),
+    # Barchart's dollar-index reports lead with "Dollar ..."; a dollar
+    # mentioned elsewhere in a title ("gold up as dollar weakens") is not
+    # a dollar story
+    ('US Dollar Index', r'\b(?:dollar index|dxy(?:00)?|usdx)\b|^dollar\b(?! general| tree)'),
+    ('Gold', r'\bgold\b'),
+    ('Silver', r'\bsilver\b'),
+    ('Copper', r'\bcopper\b'),
+]
+_COMMODITY_REGEXES = [(name, re.compile(pattern, re.IGNORECASE)) for name, pattern in COMMODITY_PATTERNS]
+
+STORY_FIELDS = ['id', 'title', 'url', 'published_str_original', 'published_timestamp_utc', 'summary']
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stories (
+    id TEXT PRIMARY KEY,
+    title TEXT,
+    url TEXT,
+    published_str_original TEXT,
+    published_timestamp_utc INTEGER,
+    published_date TEXT,
+    summary TEXT,
+    source_file TEXT
+);
+CREATE INDEX IF NOT EXISTS stories_published ON stories (published_timestamp_utc);
+CREATE TABLE IF NOT EXISTS story_commodities (
+    commodity TEXT NOT NULL,
+    published_timestamp_utc INTEGER,
+    id TEXT NOT NULL,
+    PRIMARY KEY (commodity, published_timestamp_utc, id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS ingested_files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER,
+    size INTEGER,
+    stories INTEGER
+);
+"""
+
+
+def map_commodities(text: str) -> list:
+    """
+    Commodities mentioned in a headline.
+
+    Args:
+        text: Story title
+
+    Returns:
+        list: Canonical commodity names, in COMMODITY_PATTERNS order
+    """
+    if not text:
+        return []
+    return [name for name, regex in _COMMODITY_REGEXES if regex.search(text)]
+
+
+def iter_news_items(path, chunk_size: int = 1 << 16):
+    """
+    Stream the objects of a top-level JSON array one at a time.
+
+    The file is read in chunks and each element is decoded as soon as it
+    is complete, so memory stays proportional to one story rather than
+    the whole document.
+
+    Args:
+        path: Path to a news JSON file (an array of story objects)
+        chunk_size: Characters read per chunk
+
+    Yields:
+        dict: One story
+    """
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer, pos, eof = '', 0, False
+        opened = False
+
+        while True:
+            # Skip whitespace and separators, reading more as needed
+            while True:
+                while pos < len(buffer) and (buffer[pos].isspace() or (opened and buffer[pos] == ',')):
+                    pos += 1
+                if pos < len(buffer) or eof:
+                    break
+                buffer, pos = f.read(chunk_size), 0
+                eof = not buffer
+
+            if pos >= len(buffer):
+                raise ValueError(f"{path}: unexpected end of JSON array")
+            if not opened:
+                if buffer[pos] != '[':
+                    raise ValueError(f"{path}: expected a JSON array")
+                opened = True
+                pos += 1
+                continue
+            if buffer[pos] == ']':
+                return
+
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buffer, pos)
+                    break
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    chunk = f.read(chunk_size)
+                    eof = not chunk
+                    buffer, pos = buffer[pos:] + chunk, 0
+            pos = end
+            yield item
+
+
+def _market_date(timestamp) -> str:
+    return datetime.fromtimestamp(int(timestamp), MARKET_TZ).date().isoformat()
+
+
+def _day_bounds(day) -> tuple:
+    """UTC timestamp range [start, end) of a market-calendar day."""
+    day = pd.Timestamp(day).date() if not isinstance(day, date) else day
+    start = datetime.combine(day, time(0), MARKET_TZ)
+    end = datetime.combine(day + timedelta(days=1), time(0), MARKET_TZ)
+    return int(start.timestamp()), int(end.timestamp())
+
+
+class NewsStore:
+    """
+    Append-only SQLite store of news stories.
+
+    Stories are deduplicated by id (the first copy wins) and linked to the
+    commodities named in their titles; the link table is keyed on
+    (commodity, published_timestamp_utc), so per-commodity date lookups
+    are index range scans.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path or get_data_paths()['news_store'])
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def close(self):
+        self.conn.close()
+
+    def ingest_file(self, path, batch_size: int = 1000, force: bool = False) -> int:
+        """
+        Stream one news JSON file into the store.
+
+        Files whose size and mtime match a previous ingestion are skipped.
+
+        Args:
+            path: News JSON file
+            batch_size: Stories inserted per statement batch
+            force: Re-read the file even if it looks unchanged
+
+        Returns:
+            int: Number of new (previously unseen) stories
+        """
+        path = Path(path).resolve()
+        stat = path.stat()
+        seen = self.conn.execute('SELECT mtime_ns, size FROM ingested_files WHERE path = ?',
+                                 (str(path),)).fetchone()
+        if not force and seen == (stat.st_mtime_ns, stat.st_size):
+            return 0
+
+        before = self.conn.total_changes
+        stories, links = [], []
+        new_links = 0
+        with self.conn:
+            for item in iter_news_items(path):
+                story_id = item.get('id')
+                if story_id is None:
+                    continue
+                story_id = str(story_id)
+                timestamp = item.get('published_timestamp_utc')
+                timestamp = int(timestamp) if timestamp not in (None, '') else None
+                stories.append((
+                    story_id, item.get('title'), item.get('url'), item.get('published_str_original'),
+                    timestamp, _market_date(timestamp) if timestamp is not None else None,
+                    item.get('summary'), path.name,
+                ))
+                links.extend((name, timestamp, story_id) for name in map_commodities(item.get('title')))
+                if len(stories) >= batch_size:
+                    new_links += self._insert(stories, links)
+                    stories, links = [], []
+            new_links += self._insert(stories, links)
+            added = self.conn.total_changes - before - new_links
+
+            self.conn.execute('INSERT OR REPLACE INTO ingested_files VALUES (?, ?, ?, ?)',
+                              (str(path), stat.st_mtime_ns, stat.st_size, added))
+        return added
+
+    def _insert(self, stories: list, links: list) -> int:
+        """Insert a batch; returns the number of new commodity links."""
+        self.conn.executemany('INSERT OR IGNORE INTO stories VALUES (?, ?, ?, ?, ?, ?, ?, ?)', stories)
+        before = self.conn.total_changes
+        self.conn.executemany('INSERT OR IGNORE INTO story_commodities VALUES (?, ?, ?)', links)
+        return self.conn.total_changes - before
+
+    def ingest_directory(self, news_dir=None, pattern: str = '**/*_news.json') -> int:
+        """
+        Ingest every news JSON file under a directory.
+
+        Args:
+            news_dir: Root directory (defaults to data/news-dataset)
+            pattern: Glob pattern of news files
+
+        Returns:
+            int: Number of new stories across all files
+        """
+        news_dir = Path(news_dir or get_data_paths()['news_dir'])
+        files = sorted(news_dir.glob(pattern))
+        added = sum(self.ingest_file(path) for path in files)
+        print(f"Ingested {len(files)} news files from {news_dir}: {added} new stories")
+        return added
+
+    def remap_commodities(self) -> int:
+        """
+        Rebuild the commodity links of all stored stories from their titles.
+
+        Ingestion only maps new stories; run this after changing
+        COMMODITY_PATTERNS.
+
+        Returns:
+            int: Number of commodity links
+        """
+        rows = self.conn.execute('SELECT id, title, published_timestamp_utc FROM stories').fetchall()
+        links = [(name, timestamp, story_id) for story_id, title, timestamp in rows
+                 for name in map_commodities(title)]
+        with self.conn:
+            self.conn.execute('DELETE FROM story_commodities')
+            self.conn.executemany('INSERT OR IGNORE INTO story_commodities VALUES (?, ?, ?)', links)
+        return self.conn.execute('SELECT COUNT(*) FROM story_commodities').fetchone()[0]
+
+    def stories(self, commodity: str = None, day=None, start=None, end=None) -> pd.DataFrame:
+        """
+        Stories, optionally for one commodity and/or a date range.
+
+        Args:
+            commodity: Canonical commodity name (see COMMODITY_PATTERNS)
+            day: Single market date; overrides start and end
+            start: First market date to include
+            end: Last market date to include
+
+        Returns:
+            pd.DataFrame: Stories ordered by publication time
+        """
+        lo = hi = None
+        if day is not None:
+            lo, hi = _day_bounds(day)
+        else:
+            if start is not None:
+                lo = _day_bounds(start)[0]
+            if end is not None:
+                hi = _day_bounds(end)[1]
+
+        columns = ', '.join(f's.{c}' for c in STORY_FIELDS + ['published_date', 'source_file'])
+        if commodity is not None:
+            query = (f'SELECT {columns} FROM story_commodities c JOIN stories s ON s.id = c.id '
+                     'WHERE c.commodity = ?')
+            params = [commodity]
+            time_col = 'c.published_timestamp_utc'
+        else:
+            query = f'SELECT {columns} FROM stories s WHERE 1 = 1'
+            params = []
+            time_col = 's.published_timestamp_utc'
+        if lo is not None:
+            query += f' AND {time_col} >= ?'
+            params.append(lo)
+        if hi is not None:
+            query += f' AND {time_col} < ?'
+            params.append(hi)
+        query += f' ORDER BY {time_col}, s.id'
+
+        return pd.read_sql_query(query, self.conn, params=params)
+
+    def commodities(self) -> pd.Series:
+        """Number of stories per commodity."""
+        counts = self.conn.execute(
+            'SELECT commodity, COUNT(*) FROM story_commodities GROUP BY commodity ORDER BY commodity'
+        ).fetchall()
+        return pd.Series(dict(counts), name='stories', dtype=int)
@@ -0,0 +1,234 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .cache import cached_frame
+from .classification_data import extract_theme_scores
+from .load_data import parse_classification_data, parse_price_changes
+
+
+VALUES_FILE = 'values.npy'
+DATES_FILE = 'dates.npy'
+META_FILE = 'panel.json'
+
+
+def theme_fields(categories: list) -> list:
+    """Panel fields the news-momentum strategies read: price_change and <cat>_sym."""
+    return ['price_change'] + [f'{cat}_sym' for cat in categories]
+
+
+class PanelStore:
+    """
+    Dates x commodities x fields array backed by a memory-mapped file.
+
+    Opening a store maps one .npy file; slices are views into it, so
+    strategies can read aligned data for many commodities without
+    re-reading or re-filtering source files.
+    """
+
+    def __init__(self, values: np.ndarray, dates: pd.DatetimeIndex, commodities: list, fields: list):
+        self.values = values
+        self.dates = dates
+        self.commodities = list(commodities)
+        self.fields = list(fields)
+        self._commodity_pos = {name: i for i, name in enumerate(self.commodities)}
+        self._field_pos = {name: i for i, name in enumerate(self.fields)}
+
+    @classmethod
+    def open(cls, panel_dir, mmap_mode: str = 'r'):
+        """
+        Open a panel written by write_panel.
+
+        Args:
+            panel_dir: Directory containing the panel files
+            mmap_mode: numpy memory-map mode ('r' for read-only)
+
+        Returns:
+            PanelStore
+        """
+        panel_dir = Path(panel_dir)
+        with open(panel_dir / META_FILE, 'r') as f:
+            meta = json.load(f)
+        values = np.load(panel_dir / VALUES_FILE, mmap_mode=mmap_mode)
+        dates = pd.DatetimeIndex(np.load(panel_dir / DATES_FILE).astype('datetime64[ns]'))
+        return cls(values, dates, meta['commodities'], meta['fields'])
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def slice(self, fields=None, commodities=None, start=None, end=None) -> np.ndarray:
+        """
+        Aligned array slice.
+
+        Args:
+            fields: Field names (all when None)
+            commodities: Commodity names (all when None)
+            start: First date to include
+            end: Last date to include
+
+        Returns:
+            np.ndarray: Array of shape (dates, commodities, fields)
+        """
+        lo = 0 if start is None else self.dates.searchsorted(pd.Timestamp(start), side='left')
+        hi = len(self.dates) if end is None else self.dates.searchsorted(pd.Timestamp(end), side='right')
+        block = self.values[lo:hi]
+
+        if commodities is not None:
+            block = block[:, [self._commodity_pos[c] for c in commodities]]
+        if fields is not None:
+            block = block[:, :, [self._field_pos[f] for f in fields]]
+        return block
+
+    def frame(self, commodity: str, fields=None, dropna: bool = True) -> pd.DataFrame:
+        """
+        Single-commodity DataFrame in the layout of load_and_prepare_data.
+
+        Args:
+            commodity: Commodity name
+            fields: Field names (all when None)
+            dropna: Drop dates on which the commodity has missing values
+
+        Returns:
+            pd.DataFrame: 'Date' column followed by the requested fields
+        """
+        fields = list(fields or self.fields)
+        block = self.slice(fields, [commodity])[:, 0, :]
+        df = pd.DataFrame(block, columns=fields)
+        df.insert(0, 'Date', self.dates)
+        if dropna:
+            df = df.dropna(subset=fields).reset_index(drop=True)
+        return df
+
+
+def write_panel(frames: dict, fields: list, panel_dir, date_col: str = 'Date') -> PanelStore:
+    """
+    Align per-commodity frames on a common date index and write a panel.
+
+    Missing (date, commodity) cells are NaN; if a frame has several rows
+    for one date, the last one is kept.
+
+    Args:
+        frames: {commodity: DataFrame with date_col and the fields}
+        fields: Numeric columns to store
+        panel_dir: Output directory
+        date_col: Name of the date column
+
+    Returns:
+        PanelStore: The written panel, opened read-only
+    """
+    panel_dir = Path(panel_dir)
+    panel_dir.mkdir(parents=True, exist_ok=True)
+
+    commodities = list(frames)
+    dates = pd.DatetimeIndex(np.unique(np.concatenate(
+        [pd.to_datetime(f[date_col]).to_numpy(dtype='datetime64[ns]') for f in frames.values()]
+    )))
+
+    values = np.lib.format.open_memmap(
+        panel_dir / VALUES_FILE, mode='w+', dtype=np.float64,
+        shape=(len(dates), len(commodities), len(fields))
+    )
+    values[:] = np.nan
+    for j, commodity in enumerate(commodities):
+        frame = frames[commodity].drop_duplicates(subset=date_col, keep='last')
+        rows = dates.get_indexer(pd.to_datetime(frame[date_col]))
+        values[rows, j, :] = frame[fields].to_numpy(dtype=np.float64)
+    values.flush()
+    del values
+
+    np.save(panel_dir / DATES_FILE, dates.to_numpy().astype('datetime64[ns]'))
+    with open(panel_dir / META_FILE, 'w') as f:
+        json.dump({'commodities': commodities, 'fields': list(fields)}, f, indent=2)
+
+    return PanelStore.open(panel_dir)
+
+
+def write_theme_panel(themes: pd.DataFrame, categories: list, panel_dir) -> PanelStore:
+    """
+    Write extract_theme_scores output for many commodities as a panel.
+
+    Args:
+        themes: Rows with date, commodity, price_change and <cat>_sym columns
+        categories: List of theme categories
+        panel_dir: Output directory
+
+    Returns:
+        PanelStore: Panel with the theme_fields(categories) fields
+    """
+    frames = {commodity: frame for commodity, frame in themes.groupby('commodity', sort=False)}
+    return write_panel(frames, theme_fields(categories), panel_dir, date_col='date')
+
+
+def build_commodity_panel(price_paths: dict, classification_csv_path, panel_dir,
+                          use_cache: bool = True, cache_dir=None,
+                          reason_df: pd.DataFrame = None, categories: list = None) -> PanelStore:
+    """
+    Build a panel of price and news inputs for many commodities.
+
+    Every panel has price_change and numeric_classification. With
+    reason_df and categories, each commodity's key drivers are scored by
+    extract_theme_scores and the <cat>_sym theme fields are stored too, so
+    the panel can feed the news-momentum strategies directly (e.g.
+    strategies.run_multi_commodity_analysis).
+
+    The classification CSV is parsed once and commodity names are matched
+    against its unique labels (case-insensitive substring, as in
+    load_and_prepare_data) rather than rescanning every row per commodity.
+
+    Args:
+        price_paths: {commodity_name: price CSV/Excel path}
+        classification_csv_path: Path to classification CSV
+        panel_dir: Output directory
+        use_cache: Serve parsed inputs from the columnar cache
+        cache_dir: Cache directory (defaults to data/cache)
+        reason_df: Reason-factor rows with date, commodity and key drivers
+        categories: Theme categories to store as <cat>_sym fields
+
+    Returns:
+        PanelStore
+    """
+    if use_cache:
+        classification_df = cached_frame(classification_csv_path, 'classification',
+                                          parse_classification_data, cache_dir)
+    else:
+        classification_df = parse_classification_data(classification_csv_path)
+
+    labels = pd.Series(classification_df['commodity'].dropna().unique())
+    grouped = classification_df.groupby('commodity', sort=False)
+
+    fields = ['price_change', 'numeric_classification']
+    with_themes = reason_df is not None and categories is not None
+    if with_themes:
+        fields += theme_fields(categories)[1:]
+        reason_labels = pd.Series(reason_df['commodity'].dropna().unique())
+
+    frames = {}
+    for commodity, price_path in price_paths.items():
+        if use_cache:
+            price_df = cached_frame(price_path, 'price_changes', parse_price_changes, cache_dir)
+        else:
+            price_df = parse_price_changes(price_path)
+
+        matched = labels[labels.str.contains(commodity, case=False, na=False)]
+        if matched.empty:
+            print(f"No data found for commodity '{commodity}'")
+            continue
+
+        commodity_df = pd.concat([grouped.get_group(label) for label in matched])
+        commodity_df = commodity_df[['date', 'numeric_classification']].rename(columns={'date': 'Date'})
+        frame = pd.merge(price_df, commodity_df, on='Date', how='inner')
+
+        if with_themes:
+            matched = reason_labels[reason_labels.str.contains(commodity, case=False, na=False)]
+            reason_rows = reason_df[reason_df['commodity'].isin(matched)].copy()
+            themes = extract_theme_scores(reason_rows, price_df.rename(columns={'price_change': '%Chg'}),
+                                          categories)
+            themes = themes.drop(columns=['commodity', 'price_change']).rename(columns={'date': 'Date'})
+            frame = pd.merge(frame, themes.drop_duplicates('Date', keep='last'), on='Date', how='inner')
+        frames[commodity] = frame
+
+    print(f"Writing panel for {len(frames)} commodities to {panel_dir}")
+    return write_panel(frames, fields, panel_dir)
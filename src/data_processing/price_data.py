@@ -1,9 +1,14 @@
 import pandas as pd
 import numpy as np
 
+from .cache import cached_frame
 
-def load_price_data(file_path):
-    """Load price data from CSV or Excel file."""
+
+def load_price_data(file_path, use_cache=True, cache_dir=None):
+    """Load price data from CSV or Excel file, via the columnar cache by default."""
+    if use_cache:
+        return cached_frame(file_path, 'price', lambda path: load_price_data(path, use_cache=False), cache_dir)
+    
     if str(file_path).endswith('.xlsx'):
         df = pd.read_excel(file_path, engine='openpyxl')
         if 'Exchange Date' in df.columns:
@@ -0,0 +1,323 @@
+import json
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ..utils.config import get_data_paths
+from .cache import file_digest
+
+
+FIELDS = ['key drivers', 'reverse factors']
+FIELD_ALIASES = {'drivers': 0, 'driver': 0, 'key': 0, 'reverse': 1, 'reverses': 1}
+INDEX_VERSION = 1
+
+_LABEL_PATTERN = re.compile(r'\((.*?)\)')
+_TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+_QUERY_PATTERN = re.compile(r'[^\s()"]*"[^"]*"|\(|\)|[^\s()"]+')
+
+
+def tokenize(text: str) -> list:
+    """Lowercase alphanumeric tokens of a text ('OPEC+ output' -> ['opec', 'output'])."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _csr(keys: np.ndarray, n_keys: int) -> np.ndarray:
+    """Offsets such that rows of key k are offsets[k]:offsets[k + 1] (keys sorted)."""
+    offsets = np.zeros(n_keys + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=n_keys), out=offsets[1:])
+    return offsets
+
+
+class TextIndex:
+    """
+    Inverted index over the key drivers and reverse factors of reason rows.
+
+    Documents are the rows of the source frame, in order (doc id = row
+    position). Every word token has a postings list of (doc, field,
+    position) sorted by doc, and every parenthesized label, e.g. the
+    "(supply)" in "OPEC+ output boost (supply)", has a list of (doc, field)
+    category tags. Labels are not indexed as words.
+
+    Queries (see search) support AND / OR / NOT, parentheses, "quoted
+    phrases", field prefixes drivers: / reverse: and category tags cat:.
+    """
+
+    def __init__(self, docs: pd.DataFrame, vocab: list, token_offsets, token_docs, token_fields,
+                 token_positions, labels: list, label_offsets, label_docs, label_fields):
+        self.docs = docs
+        self.vocab = vocab
+        self.labels = labels
+        self._token_ids = {token: i for i, token in enumerate(vocab)}
+        self._label_ids = {label: i for i, label in enumerate(labels)}
+        self.token_offsets = token_offsets
+        self.token_docs = token_docs
+        self.token_fields = token_fields
+        self.token_positions = token_positions
+        self.label_offsets = label_offsets
+        self.label_docs = label_docs
+        self.label_fields = label_fields
+        self._stride = int(token_positions.max()) + 2 if len(token_positions) else 1
+
+    @classmethod
+    def build(cls, df: pd.DataFrame) -> 'TextIndex':
+        """
+        Index a reason-factor frame.
+
+        Args:
+            df: Rows with date, commodity, key drivers and reverse factors
+
+        Returns:
+            TextIndex
+        """
+        token_ids, label_ids = {}, {}
+        postings, tags = [], []
+
+        for field_id, field in enumerate(FIELDS):
+            if field not in df.columns:
+                continue
+            for doc, text in enumerate(df[field].tolist()):
+                if not isinstance(text, str):
+                    continue
+                for label in dict.fromkeys(_LABEL_PATTERN.findall(text)):
+                    tags.append((label_ids.setdefault(label, len(label_ids)), doc, field_id))
+
+                position = 0
+                for driver in text.split(';'):
+                    for token in tokenize(_LABEL_PATTERN.sub(' ', driver)):
+                        postings.append((token_ids.setdefault(token, len(token_ids)), doc, field_id, position))
+                        position += 1
+                    # Gap so phrases never span two drivers
+                    position += 1
+
+        postings = np.array(postings, dtype=np.int64).reshape(-1, 4)
+        order = np.lexsort((postings[:, 3], postings[:, 2], postings[:, 1], postings[:, 0]))
+        postings = postings[order]
+        tags = np.array(tags, dtype=np.int64).reshape(-1, 3)
+        tags = tags[np.lexsort((tags[:, 2], tags[:, 1], tags[:, 0]))]
+
+        docs = pd.DataFrame({
+            'date': pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d').to_numpy(),
+            'commodity': df['commodity'].astype(str).to_numpy() if 'commodity' in df.columns else '',
+        })
+        return cls(
+            docs, list(token_ids), _csr(postings[:, 0], len(token_ids)),
+            postings[:, 1].astype(np.int32), postings[:, 2].astype(np.int8), postings[:, 3].astype(np.int32),
+            list(label_ids), _csr(tags[:, 0], len(label_ids)),
+            tags[:, 1].astype(np.int32), tags[:, 2].astype(np.int8),
+        )
+
+    def save(self, index_dir):
+        """Write the index to index_dir as index.npz (postings) and index.json (vocabularies, docs)."""
+        index_dir = Path(index_dir)
+        index_dir.mkdir(parents=True, exist_ok=True)
+        np.savez(index_dir / 'index.npz', token_offsets=self.token_offsets, token_docs=self.token_docs,
+                 token_fields=self.token_fields, token_positions=self.token_positions,
+                 label_offsets=self.label_offsets, label_docs=self.label_docs, label_fields=self.label_fields)
+        with open(index_dir / 'index.json', 'w', encoding='utf-8') as f:
+            json.dump({'version': INDEX_VERSION, 'vocab': self.vocab, 'labels': self.labels,
+                       'dates': self.docs['date'].tolist(), 'commodities': self.docs['commodity'].tolist()},
+                      f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, index_dir) -> 'TextIndex':
+        """Read an index written by save."""
+        index_dir = Path(index_dir)
+        with open(index_dir / 'index.json', 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('version') != INDEX_VERSION:
+            raise ValueError(f"{index_dir}: unsupported text index version {meta.get('version')}")
+        with np.load(index_dir / 'index.npz') as arrays:
+            arrays = dict(arrays)
+        docs = pd.DataFrame({'date': meta['dates'], 'commodity': meta['commodities']})
+        return cls(docs, meta['vocab'], arrays['token_offsets'], arrays['token_docs'], arrays['token_fields'],
+                   arrays['token_positions'], meta['labels'], arrays['label_offsets'],
+                   arrays['label_docs'], arrays['label_fields'])
+
+    def __len__(self):
+        return len(self.docs)
+
+    # Postings -----------------------------------------------------------
+
+    def _token_postings(self, token: str, field: int = None):
+        token_id = self._token_ids.get(token)
+        if token_id is None:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, empty
+        sl = slice(self.token_offsets[token_id], self.token_offsets[token_id + 1])
+        docs, fields, positions = self.token_docs[sl], self.token_fields[sl], self.token_positions[sl]
+        if field is not None:
+            keep = fields == field
+            docs, fields, positions = docs[keep], fields[keep], positions[keep]
+        return docs.astype(np.int64), fields.astype(np.int64), positions.astype(np.int64)
+
+    def _term(self, token: str, field: int = None) -> np.ndarray:
+        return np.unique(self._token_postings(token, field)[0])
+
+    def _phrase(self, tokens: list, field: int = None) -> np.ndarray:
+        if not tokens:
+            return np.empty(0, dtype=np.int64)
+        if len(tokens) == 1:
+            return self._term(tokens[0], field)
+        n_fields = len(FIELDS)
+        docs, fields, positions = self._token_postings(tokens[0], field)
+        starts = (docs * n_fields + fields) * self._stride + positions
+        for k, token in enumerate(tokens[1:], start=1):
+            d, f, p = self._token_postings(token, field)
+            keys = (d * n_fields + f) * self._stride + p - k
+            starts = starts[np.isin(starts, keys)]
+        return np.unique(starts // (n_fields * self._stride))
+
+    def _category(self, label: str, field: int = None) -> np.ndarray:
+        label_id = self._label_ids.get(label)
+        if label_id is None:
+            return np.empty(0, dtype=np.int64)
+        sl = slice(self.label_offsets[label_id], self.label_offsets[label_id + 1])
+        docs = self.label_docs[sl]
+        if field is not None:
+            docs = docs[self.label_fields[sl] == field]
+        return np.unique(docs).astype(np.int64)
+
+    # Queries ------------------------------------------------------------
+
+    def _atom(self, text: str) -> np.ndarray:
+        field = None
+        prefix, sep, rest = text.partition(':')
+        if sep and prefix.lower() in FIELD_ALIASES:
+            field = FIELD_ALIASES[prefix.lower()]
+            text = rest
+            prefix, sep, rest = text.partition(':')
+        if sep and prefix.lower() in ('cat', 'category'):
+            return self._category(rest.strip('"'), field)
+        return self._phrase(tokenize(text.strip('"')), field)
+
+    def match(self, query: str) -> np.ndarray:
+        """
+        Doc ids (row positions) matching a query, sorted.
+
+        Grammar: expr := and ('OR' and)*; and := not (['AND'] not)*;
+        not := 'NOT' not | '(' expr ')' | [drivers:|reverse:] (word | "phrase" | cat:label)
+
+        Examples:
+            reverse:opec
+            "output boost" AND NOT cat:demand
+            reverse:cat:supply OR (fed AND rate)
+
+        Args:
+            query: Query string; words are case-insensitive, labels are not
+
+        Returns:
+            np.ndarray: Matching doc ids
+        """
+        tokens = _QUERY_PATTERN.findall(query)
+        pos = 0
+        everything = np.arange(len(self.docs), dtype=np.int64)
+
+        def peek():
+            return tokens[pos] if pos < len(tokens) else None
+
+        def parse_or():
+            nonlocal pos
+            result = parse_and()
+            while peek() == 'OR':
+                pos += 1
+                result = np.union1d(result, parse_and())
+            return result
+
+        def parse_and():
+            nonlocal pos
+            result = parse_not()
+            while peek() not in (None, 'OR', ')'):
+                if peek() == 'AND':
+                    pos += 1
+                result = np.intersect1d(result, parse_not(), assume_unique=True)
+            return result
+
+        def parse_not():
+            nonlocal pos
+            token = peek()
+            if token is None:
+                raise ValueError(f"Unexpected end of query: {query!r}")
+            pos += 1
+            if token == 'NOT':
+                return np.setdiff1d(everything, parse_not(), assume_unique=True)
+            if token == '(':
+                result = parse_or()
+                if peek() != ')':
+                    raise ValueError(f"Unbalanced parentheses in query: {query!r}")
+                pos += 1
+                return result
+            if token == ')':
+                raise ValueError(f"Unbalanced parentheses in query: {query!r}")
+            return self._atom(token)
+
+        result = parse_or()
+        if pos != len(tokens):
+            raise ValueError(f"Unexpected {tokens[pos]!r} in query: {query!r}")
+        return result
+
+    def search(self, query: str) -> pd.DataFrame:
+        """
+        Date and commodity of every row matching a query (see match).
+
+        Returns:
+            pd.DataFrame: Matching docs indexed by row position
+        """
+        return self.docs.iloc[self.match(query)]
+
+    def mask(self, query: str) -> np.ndarray:
+        """Boolean array over the source rows, True where the query matches."""
+        result = np.zeros(len(self.docs), dtype=bool)
+        result[self.match(query)] = True
+        return result
+
+    def category_matrix(self, categories: list = None, field: str = 'key drivers') -> pd.DataFrame:
+        """
+        0/1 matrix of category tags per row, as label_indicators computes it.
+
+        Pass it to extract_theme_scores(category_matrix=...) to skip
+        re-scanning the driver texts.
+
+        Args:
+            categories: Labels to include (defaults to every label, in
+                first-seen order)
+            field: 'key drivers' or 'reverse factors'
+
+        Returns:
+            pd.DataFrame: One row per source row, one column per category
+        """
+        field_id = FIELDS.index(field)
+        categories = list(self.labels) if categories is None else list(categories)
+        values = np.zeros((len(self.docs), len(categories)), dtype=int)
+        for j, label in enumerate(categories):
+            values[self._category(label, field_id), j] = 1
+        return pd.DataFrame(values, columns=categories)
+
+
+def load_text_index(csv_path, index_dir=None) -> TextIndex:
+    """
+    Text index of a reason-factor CSV, built once per file content.
+
+    The index is stored under <cache_dir>/text_index-<sha256 prefix> and
+    reused while the CSV content is unchanged.
+
+    Args:
+        csv_path: Path to a CSV such as combined_reason_factors.csv
+        index_dir: Parent directory of stored indexes (defaults to the cache dir)
+
+    Returns:
+        TextIndex
+    """
+    index_dir = Path(index_dir or get_data_paths()['cache_dir'])
+    target = index_dir / f'text_index-{file_digest(csv_path)[:20]}'
+    if (target / 'index.json').exists():
+        try:
+            return TextIndex.load(target)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Rebuilding unreadable text index {target}: {e}")
+
+    index = TextIndex.build(pd.read_csv(csv_path))
+    index.save(target)
+    print(f"Indexed {len(index)} rows of {csv_path} into {target}")
+    return index
@@ -0,0 +1,19 @@
+"""
+LLM client layer for news classification
+
+Backends are plain objects with an async complete(prompt) method;
+fastapi_poe is only imported when PoeBackend is actually used.
+"""
+from .backends import FakeBackend, PoeBackend
+from .client import LLMClient, ResponseCache
+from .classify import build_classification_prompt, classify_drivers, parse_classification_response
+
+__all__ = [
+    'FakeBackend',
+    'PoeBackend',
+    'LLMClient',
+    'ResponseCache',
+    'build_classification_prompt',
+    'classify_drivers',
+    'parse_classification_response'
+]
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import re
+
+from ..utils.config import get_api_key
+
+
+# Keyword rules used by FakeBackend, checked in order
+FAKE_RULES = [
+    ('geopolitics', ('tariff', 'trade tension', 'sanction', 'war', 'conflict', 'geopolit', 'china', 'russia', 'iran')),
+    ('currency', ('dollar', 'usd', 'currency', 'fed', 'rate', 'yield', 'inflation')),
+    ('supply', ('supply', 'supplies', 'output', 'production', 'opec', 'inventor', 'stock', 'harvest', 'crop',
+                'weather', 'planting', 'drought')),
+    ('demand', ('demand', 'consumption', 'export', 'import', 'buying', 'sales', 'economic')),
+]
+FAKE_DEFAULT = 'markets'
+
+_ITEM_RE = re.compile(r'^\[(\d+)\]')
+_DRIVER_RE = re.compile(r'^\s+-\s+(.*)$')
+
+
+def fake_label(text: str) -> str:
+    """Category assigned to one driver by the FAKE_RULES keyword match."""
+    lowered = text.lower()
+    for category, keywords in FAKE_RULES:
+        if any(keyword in lowered for keyword in keywords):
+            return category
+    return FAKE_DEFAULT
+
+
+class FakeBackend:
+    """
+    Deterministic offline stand-in for an LLM.
+
+    Answers classification prompts (see llm.classify) by labelling each
+    driver line with FAKE_RULES, so the whole pipeline can run without
+    network access or API keys. Other prompts get an echo response.
+    """
+
+    name = 'fake'
+
+    def __init__(self, delay: float = 0.0):
+        """
+        Args:
+            delay: Seconds to sleep per request, to mimic network latency
+        """
+        self.delay = delay
+        self.calls = 0
+        self.prompts = []
+
+    async def complete(self, prompt: str) -> str:
+        self.calls += 1
+        self.prompts.append(prompt)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+        answer = {}
+        item = None
+        for line in prompt.splitlines():
+            match = _ITEM_RE.match(line)
+            if match:
+                item = match.group(1)
+                answer[item] = []
+                continue
+            match = _DRIVER_RE.match(line)
+            if match and item is not None:
+                answer[item].append(fake_label(match.group(1)))
+        if not answer:
+            return f'echo: {prompt}'
+        return json.dumps(answer)
+
+
+class PoeBackend:
+    """
+    Backend for bots served through the Poe API (fastapi_poe).
+
+    The API key is read from POE_API_KEY via utils.config.get_api_key.
+    """
+
+    def __init__(self, bot_name: str = 'DeepSeek-R1', api_key: str = None):
+        """
+        Args:
+            bot_name: Poe bot to query
+            api_key: API key (defaults to the POE_API_KEY environment variable)
+        """
+        self.bot_name = bot_name
+        self.name = f'poe:{bot_name}'
+        self.api_key = api_key or get_api_key('POE')
+        if not self.api_key:
+            raise ValueError("POE_API_KEY is not set")
+
+    async def complete(self, prompt: str) -> str:
+        try:
+            import fastapi_poe as fp
+        except ImportError as e:
+            raise ImportError("fastapi-poe is required for PoeBackend (pip install fastapi-poe)") from e
+
+        message = fp.ProtocolMessage(role='user', content=prompt)
+        parts = []
+        async for partial in fp.get_bot_response(messages=[message], bot_name=self.bot_name,
+                                                 api_key=self.api_key):
+            parts.append(partial.text)
+        return ''.join(parts)
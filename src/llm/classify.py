@@ -0,0 +1,137 @@
+import json
+import re
+
+import pandas as pd
+
+from ..utils.config import load_config
+
+
+LABELLED_COLUMNS = ['key drivers', 'reverse factors']
+# Separator of drivers in a briefing field (see data_processing.briefings);
+# a ';' inside a driver is kept
+DRIVER_SEPARATOR = '; '
+
+PROMPT_TEMPLATE = """You classify commodity market drivers.
+For every numbered item below, assign each bullet exactly one category from:
+{categories}, or "other" if none applies.
+
+Answer with a single JSON object mapping each item number to the list of
+categories of its bullets, in order. Example: {{"1": ["supply", "demand"]}}
+
+{items}
+"""
+
+_JSON_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+
+def build_classification_prompt(items: list, categories: list) -> str:
+    """
+    Prompt classifying the drivers of several commodities at once.
+
+    Args:
+        items: Dicts with 'id', 'date', 'commodity', 'column' and 'drivers'
+        categories: Allowed category names
+
+    Returns:
+        str: Prompt text
+    """
+    blocks = []
+    for item in items:
+        lines = [f"[{item['id']}] {item['date']} | {item['commodity']} | {item['column']}"]
+        lines += [f"  - {driver}" for driver in item['drivers']]
+        blocks.append('\n'.join(lines))
+    return PROMPT_TEMPLATE.format(categories=', '.join(categories), items='\n\n'.join(blocks))
+
+
+def parse_classification_response(response: str) -> dict:
+    """
+    Map item id -> list of category labels from a model response.
+
+    The first {...} block of the response is parsed as JSON, so extra
+    prose or code fences around it are ignored.
+
+    Returns:
+        dict: Empty if the response holds no valid JSON object
+    """
+    match = _JSON_RE.search(response or '')
+    if not match:
+        return {}
+    try:
+        parsed = json.loads(match.group(0))
+    except ValueError:
+        return {}
+    if not isinstance(parsed, dict):
+        return {}
+    return {str(k): [str(label).strip().lower() for label in v]
+            for k, v in parsed.items() if isinstance(v, list)}
+
+
+def classify_drivers(df: pd.DataFrame, client, categories: list = None, batch_size: int = 8) -> pd.DataFrame:
+    """
+    Tag briefing drivers with categories in the combined_reason_factors format.
+
+    Every '; '-separated driver in 'key drivers' and 'reverse factors' gets
+    a "(category)" suffix, so the result can go straight into
+    extract_theme_scores. The rows of one date are batched batch_size
+    items at a time into one prompt, ordered by commodity and column and
+    numbered within the prompt, so a prompt depends only on its own
+    date's rows. Prompts are answered concurrently and cached by the
+    client; reruns are free and adding or reordering rows only creates
+    prompts for the dates that changed. Responses that do not label every
+    driver of their prompt are not cached, so a rerun asks again.
+
+    Args:
+        df: Rows with date, commodity, key drivers and reverse factors
+            (e.g. from data_processing.load_briefings)
+        client: llm.LLMClient
+        categories: Allowed categories (defaults to the configured ones)
+        batch_size: Items (row x column) per prompt
+
+    Returns:
+        pd.DataFrame: Copy of df with labelled driver columns
+    """
+    if categories is None:
+        categories = load_config()['data']['categories']
+
+    items = []
+    for row_pos, row in enumerate(df.itertuples(index=False)):
+        values = dict(zip(df.columns, row))
+        for column in LABELLED_COLUMNS:
+            text = values.get(column)
+            if not isinstance(text, str) or not text.strip():
+                continue
+            drivers = [d.strip() for d in text.split(DRIVER_SEPARATOR) if d.strip()]
+            items.append({'row': row_pos, 'column': column, 'date': values['date'],
+                          'commodity': values['commodity'], 'drivers': drivers})
+
+    by_date = {}
+    for item in sorted(items, key=lambda item: (str(item['date']), str(item['commodity']), item['column'])):
+        by_date.setdefault(str(item['date']), []).append(item)
+    batches = []
+    for day_items in by_date.values():
+        for start in range(0, len(day_items), batch_size):
+            batches.append([dict(item, id=str(k + 1)) for k, item in enumerate(day_items[start:start + batch_size])])
+    prompts = [build_classification_prompt(batch, categories) for batch in batches]
+    batch_of = dict(zip(prompts, batches))
+
+    def labels_every_driver(prompt, response):
+        labels = parse_classification_response(response)
+        return all(len(labels.get(item['id'], [])) == len(item['drivers']) for item in batch_of[prompt])
+
+    responses = client.complete_many(prompts, validate=labels_every_driver)
+
+    result = df.copy()
+    unlabelled = 0
+    for batch, response in zip(batches, responses):
+        labels = parse_classification_response(response)
+        for item in batch:
+            item_labels = labels.get(item['id'], [])
+            if len(item_labels) != len(item['drivers']):
+                unlabelled += len(item['drivers'])
+                continue
+            text = DRIVER_SEPARATOR.join(f'{driver} ({label})' for driver, label in zip(item['drivers'], item_labels))
+            result.iloc[item['row'], result.columns.get_loc(item['column'])] = text
+
+    print(f"Classified {len(items)} driver lists in {len(prompts)} prompts"
+          + (f" ({unlabelled} drivers left unlabelled)" if unlabelled else ""))
+    return result
@@ -0,0 +1,143 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from ..utils.config import get_data_paths
+
+
+class ResponseCache:
+    """
+    Content-addressed store of LLM responses.
+
+    Each response is a small JSON file named after the SHA-256 of the
+    backend name and the prompt, so identical requests are never sent
+    twice and entries can be shared or deleted individually.
+    """
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = Path(cache_dir or get_data_paths()['cache_dir'] / 'llm')
+
+    @staticmethod
+    def key(backend_name: str, prompt: str) -> str:
+        return hashlib.sha256(f'{backend_name}\0{prompt}'.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f'{key}.json'
+
+    def get(self, key: str):
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)['response']
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, key: str, backend_name: str, prompt: str, response: str):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'backend': backend_name, 'prompt': prompt, 'response': response,
+                       'created': time.time()}, f)
+        os.replace(tmp_path, path)
+
+
+class LLMClient:
+    """
+    Async LLM client with bounded concurrency, retries and a response cache.
+
+    A backend is any object with a `name` attribute and an async
+    `complete(prompt) -> str` method (see llm.backends).
+    """
+
+    def __init__(self, backend, cache_dir=None, max_concurrency: int = 4, max_retries: int = 2,
+                 retry_delay: float = 1.0, use_cache: bool = True):
+        """
+        Args:
+            backend: Backend answering prompts
+            cache_dir: Response cache directory (defaults to data/cache/llm)
+            max_concurrency: Maximum requests in flight at once
+            max_retries: Retries per prompt after a failed request
+            retry_delay: Initial back-off in seconds, doubled per retry
+            use_cache: Read and write the response cache
+        """
+        self.backend = backend
+        self.cache = ResponseCache(cache_dir) if use_cache else None
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.stats = {'prompts': 0, 'cache_hits': 0, 'requests': 0, 'errors': 0, 'invalid': 0, 'request_s': 0.0}
+
+    async def _request(self, prompt: str, semaphore: asyncio.Semaphore, validate=None) -> str:
+        key = None
+        if self.cache is not None:
+            key = self.cache.key(self.backend.name, prompt)
+            cached = self.cache.get(key)
+            if cached is not None and (validate is None or validate(prompt, cached)):
+                self.stats['cache_hits'] += 1
+                return cached
+
+        delay = self.retry_delay
+        for attempt in range(self.max_retries + 1):
+            async with semaphore:
+                start = time.perf_counter()
+                self.stats['requests'] += 1
+                try:
+                    response = await self.backend.complete(prompt)
+                except Exception as e:
+                    self.stats['errors'] += 1
+                    if attempt == self.max_retries:
+                        raise
+                    print(f"{self.backend.name} request failed ({e}); retrying in {delay:.1f}s")
+                else:
+                    self.stats['request_s'] += time.perf_counter() - start
+                    break
+            await asyncio.sleep(delay)
+            delay *= 2
+
+        if validate is not None and not validate(prompt, response):
+            self.stats['invalid'] += 1
+        elif self.cache is not None:
+            self.cache.put(key, self.backend.name, prompt, response)
+        return response
+
+    async def acomplete_many(self, prompts: list, validate=None) -> list:
+        """
+        Answer prompts concurrently, at most max_concurrency at a time.
+
+        Duplicate prompts are sent once. Responses rejected by validate are
+        returned but never cached, and cached responses it rejects are
+        requested again, so a bad answer is not replayed on every rerun.
+
+        Args:
+            prompts: Prompt strings
+            validate: Optional validate(prompt, response) -> bool
+
+        Returns:
+            list: Responses in the order of prompts
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        unique = list(dict.fromkeys(prompts))
+        self.stats['prompts'] += len(prompts)
+        responses = await asyncio.gather(*(self._request(p, semaphore, validate) for p in unique))
+        by_prompt = dict(zip(unique, responses))
+        return [by_prompt[p] for p in prompts]
+
+    def complete_many(self, prompts: list, validate=None) -> list:
+        """Synchronous wrapper around acomplete_many."""
+        return asyncio.run(self.acomplete_many(prompts, validate))
+
+    def complete(self, prompt: str) -> str:
+        """Answer a single prompt synchronously."""
+        return self.complete_many([prompt])[0]
+
+    def print_stats(self):
+        s = self.stats
+        print(f"LLM {self.backend.name}: {s['prompts']} prompts, {s['cache_hits']} cache hits, "
+              f"{s['requests']} requests ({s['errors']} failed, {s['invalid']} invalid), "
+              f"{s['request_s']:.2f}s in requests")
@@ -1,14 +1,31 @@
 """
 Trading strategy implementations
+
+Submodules are imported on first attribute access, so importing the
+package does not pull in numerical dependencies it may never use.
 """
-from .momentum import naive_momentum_strategy, slope_momentum_strategy
-from .news_momentum import calculate_arma_residual_scores, run_strategy_analysis
-from .simulation import simulate_event_series
-
-__all__ = [
-    'naive_momentum_strategy',
-    'slope_momentum_strategy', 
-    'calculate_arma_residual_scores',
-    'run_strategy_analysis',
-    'simulate_event_series'
-]
+from ..utils.lazy import lazy_exports
+
+_EXPORTS = {
+    'naive_momentum_strategy': '.momentum',
+    'slope_momentum_strategy': '.momentum',
+    'slope_momentum_positions': '.momentum',
+    'calculate_arma_residual_scores': '.news_momentum',
+    'compute_residuals': '.news_momentum',
+    'project_theme_scores': '.news_momentum',
+    'run_strategy_analysis': '.news_momentum',
+    'sweep_strategy_analysis': '.news_momentum',
+    'simulate_event_series': '.simulation',
+    'simulate_event_paths': '.simulation',
+    'paths_to_frame': '.simulation',
+    'run_parameter_sweep': '.sweep',
+    'run_multi_commodity_analysis': '.batch',
+    'NewsMomentumStream': '.online',
+    'run_simulation_study': '.simulation_study',
+    'summarize_study': '.simulation_study',
+    'run_walk_forward': '.walk_forward',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,236 @@
+import numpy as np
+from scipy.signal import lfilter
+
+
+def arma_innovations(y: np.ndarray, mu: float, phi: np.ndarray, theta: np.ndarray) -> np.ndarray:
+    """
+    Conditional (CSS) innovations of an ARMA(p, q) model with mean mu.
+
+    The filter starts from zero pre-sample values and innovations, so each
+    window is conditioned on its own observations only.
+
+    Args:
+        y: Observations
+        mu: Process mean
+        phi: AR coefficients
+        theta: MA coefficients
+
+    Returns:
+        np.ndarray: Innovations, one per observation
+    """
+    ar_poly = np.concatenate([[1.0], -np.asarray(phi, dtype=float)])
+    ma_poly = np.concatenate([[1.0], np.asarray(theta, dtype=float)])
+    return lfilter(ar_poly, ma_poly, y - mu)
+
+
+def arma_forecast(y: np.ndarray, innovations: np.ndarray, mu: float,
+                  phi: np.ndarray, theta: np.ndarray) -> float:
+    """One-step-ahead forecast given the observations and their innovations."""
+    p, q = len(phi), len(theta)
+    forecast = mu
+    for i in range(1, p + 1):
+        forecast += phi[i - 1] * (y[-i] - mu)
+    for j in range(1, q + 1):
+        forecast += theta[j - 1] * innovations[-j]
+    return forecast
+
+
+def constrain_roots(coefs: np.ndarray, sign: float, max_modulus: float = 0.99) -> np.ndarray:
+    """
+    Make a lag polynomial stationary (AR) or invertible (MA).
+
+    The inverse roots of 1 + sign * (c_1 L + ... + c_k L^k) that lie
+    outside the unit circle are reflected to 1 / conj(root), and any
+    still above max_modulus are shrunk onto it; the coefficients are then
+    rebuilt from the roots. Coefficients already inside are returned
+    unchanged.
+
+    Args:
+        coefs: AR (sign=-1) or MA (sign=+1) coefficients
+        sign: -1 for AR polynomials, +1 for MA polynomials
+        max_modulus: Largest inverse-root modulus allowed
+
+    Returns:
+        np.ndarray: Constrained coefficients
+    """
+    coefs = np.asarray(coefs, dtype=float)
+    if len(coefs) == 0:
+        return coefs
+    if not np.all(np.isfinite(coefs)):
+        return np.zeros_like(coefs)
+
+    inverse_roots = np.roots(np.concatenate([[1.0], sign * coefs]))
+    modulus = np.abs(inverse_roots)
+    if np.all(modulus <= max_modulus):
+        return coefs
+
+    inverse_roots = np.where(modulus > 1, 1 / np.conj(inverse_roots), inverse_roots)
+    modulus = np.abs(inverse_roots)
+    inverse_roots = np.where(modulus > max_modulus, inverse_roots * max_modulus / modulus, inverse_roots)
+    return sign * np.real(np.poly(inverse_roots))[1:]
+
+
+def _constrain(params: np.ndarray, p: int) -> np.ndarray:
+    """Copy of [mu, phi..., theta...] with stationary AR and invertible MA parts."""
+    params = params.copy()
+    params[1:p + 1] = constrain_roots(params[1:p + 1], -1.0)
+    params[p + 1:] = constrain_roots(params[p + 1:], 1.0)
+    return params
+
+
+def _innovation_jacobian(y: np.ndarray, innovations: np.ndarray, mu: float,
+                         phi: np.ndarray, theta: np.ndarray) -> np.ndarray:
+    """Analytic derivatives of the CSS innovations w.r.t. [mu, phi, theta]."""
+    n, p, q = len(y), len(phi), len(theta)
+    ar_poly = np.concatenate([[1.0], -phi])
+    ma_poly = np.concatenate([[1.0], theta])
+    centered = y - mu
+
+    jac = np.empty((n, 1 + p + q))
+    jac[:, 0] = lfilter(ar_poly, ma_poly, -np.ones(n))
+    for i in range(1, p + 1):
+        shifted = np.concatenate([np.zeros(i), centered[:-i]])
+        jac[:, i] = -lfilter([1.0], ma_poly, shifted)
+    for j in range(1, q + 1):
+        shifted = np.concatenate([np.zeros(j), innovations[:-j]])
+        jac[:, p + j] = -lfilter([1.0], ma_poly, shifted)
+    return jac
+
+
+def fit_arma_css(y: np.ndarray, p: int, q: int, start: np.ndarray = None,
+                 max_iter: int = 50, tol: float = 1e-10):
+    """
+    Fit an ARMA(p, q) with intercept by conditional sum of squares.
+
+    Uses damped Gauss-Newton steps with analytic derivatives; the AR part
+    is kept stationary and the MA part invertible by reflecting their
+    roots (see constrain_roots). A start close to the
+    optimum (e.g. the previous rolling window's estimate) converges in a
+    couple of iterations.
+
+    Args:
+        y: Observations
+        p: AR order
+        q: MA order
+        start: Warm-start parameters [mu, phi..., theta...]
+        max_iter: Maximum Gauss-Newton iterations
+        tol: Relative SSE improvement at which to stop
+
+    Returns:
+        tuple: (params, innovations, aic)
+    """
+    y = np.asarray(y, dtype=float)
+    if not np.all(np.isfinite(y)):
+        raise ValueError("fit_arma_css needs finite observations")
+
+    n = len(y)
+    if p + q == 0 or start is None:
+        params = np.concatenate([[np.mean(y)], np.zeros(p + q)])
+    else:
+        params = _constrain(np.asarray(start, dtype=float), p)
+
+    innovations = arma_innovations(y, params[0], params[1:p + 1], params[p + 1:])
+    sse = np.sum(innovations ** 2)
+
+    for _ in range(max_iter if p + q > 0 else 0):
+        jac = _innovation_jacobian(y, innovations, params[0], params[1:p + 1], params[p + 1:])
+        step = np.linalg.lstsq(jac, -innovations, rcond=None)[0]
+
+        improved = False
+        for _ in range(10):
+            candidate = _constrain(params + step, p)
+            cand_innov = arma_innovations(
+                y, candidate[0], candidate[1:p + 1], candidate[p + 1:]
+            )
+            cand_sse = np.sum(cand_innov ** 2)
+            if np.isfinite(cand_sse) and cand_sse <= sse:
+                improved = True
+                break
+            step = step / 2
+
+        if not improved:
+            break
+        converged = sse - cand_sse <= tol * sse
+        params, innovations, sse = candidate, cand_innov, cand_sse
+        if converged:
+            break
+
+    aic = n * np.log(sse / n) + 2 * (p + q + 2) if sse > 0 else -np.inf
+    return params, innovations, aic
+
+
+def rolling_arma_forecasts(values: np.ndarray,
+                           window: int,
+                           max_p: int = 1,
+                           max_q: int = 1,
+                           reselect_every: int = 20):
+    """
+    Rolling one-step ARMA forecasts with warm-started refits.
+
+    Uses the same windows as calculate_arma_residual_scores: for day i the
+    model is trained on values[i - window : i - 1]. Consecutive windows
+    share all but one observation, so each fit is warm-started from the
+    previous window's parameters for the same order and converges in a
+    few Gauss-Newton iterations. The (p, q) order is
+    chosen by AIC over the grid up to (max_p, max_q) on the first window
+    and then only every reselect_every windows.
+
+    Windows containing NaN or infinite values are not fitted: like the
+    fallback of the auto_arima engine, they forecast the mean of their
+    finite values (NaN if there are none) and record order None.
+
+    Args:
+        values: 1-D array of price changes
+        window: Rolling window size
+        max_p: Maximum AR order
+        max_q: Maximum MA order
+        reselect_every: Number of windows between order selections (>= 1)
+
+    Returns:
+        tuple: (residuals, oos_preds, orders) where orders lists the (p, q)
+            used for each window
+    """
+    if reselect_every < 1:
+        raise ValueError(f"reselect_every must be at least 1, got {reselect_every}")
+
+    values = np.asarray(values, dtype=float)
+    grid = [(p, q) for p in range(max_p + 1) for q in range(max_q + 1)]
+    warm = {}
+    order = None
+
+    residuals = []
+    oos_preds = []
+    orders = []
+
+    for k, i in enumerate(range(window, len(values))):
+        train = values[i - window : i - 1]
+
+        finite = np.isfinite(train)
+        if not finite.all():
+            mean = train[finite].mean() if finite.any() else np.nan
+            residuals.append(values[i - 1] - mean)
+            oos_preds.append(mean)
+            orders.append(None)
+            continue
+
+        best_fit = None
+        if order is None or k % reselect_every == 0:
+            best_aic = np.inf
+            for p, q in grid:
+                fit = fit_arma_css(train, p, q, warm.get((p, q)))
+                warm[(p, q)] = fit[0]
+                if best_fit is None or fit[2] < best_aic:
+                    best_aic, order, best_fit = fit[2], (p, q), fit
+            params, innovations, _ = best_fit
+        else:
+            params, innovations, _ = fit_arma_css(train, *order, warm.get(order))
+            warm[order] = params
+
+        p, q = order
+
+        mu, phi, theta = params[0], params[1:p + 1], params[p + 1:]
+        residuals.append(values[i - 1] - train.mean())
+        oos_preds.append(arma_forecast(train, innovations, mu, phi, theta))
+        orders.append(order)
+
+    return np.array(residuals), np.array(oos_preds), orders
@@ -0,0 +1,151 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from .momentum import naive_momentum_strategy, slope_momentum_strategy
+from .news_momentum import run_strategy_analysis
+from ..analysis.backtest import backtest_positions
+from ..data_processing.panel import PanelStore, theme_fields
+from ..utils.config import load_config
+
+
+METRIC_COLUMNS = ['sharpe_ratio', 'cumulative_return', 'max_drawdown', 'annual_turnover', 'cost_drag']
+
+
+def _commodity_arrays(frames, columns: list) -> dict:
+    """
+    {commodity: (days, columns) array} from frames or a PanelStore.
+
+    Panel dates on which a commodity has missing values are dropped, as
+    PanelStore.frame does.
+    """
+    if not isinstance(frames, PanelStore):
+        return {name: df[columns].to_numpy(dtype=np.float64) for name, df in frames.items()}
+
+    block = frames.slice(columns)
+    arrays = {}
+    for j, name in enumerate(frames.commodities):
+        values = block[:, j]
+        arrays[name] = values[~np.isnan(values).any(axis=1)]
+    return arrays
+
+
+def _pack_frames(frames, columns: list):
+    """
+    Copy the numeric columns of every commodity into one shared block.
+
+    Returns:
+        tuple: (SharedMemory, shape, {commodity: (offset, length)})
+    """
+    arrays = _commodity_arrays(frames, columns)
+    layout = {}
+    offset = 0
+    for name, values in arrays.items():
+        layout[name] = (offset, len(values))
+        offset += len(values)
+
+    shape = (offset, len(columns))
+    shm = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * 8, 1))
+    block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    for name, values in arrays.items():
+        start, length = layout[name]
+        block[start:start + length] = values
+    return shm, shape, layout
+
+
+def _run_commodity(shm_name: str, shape: tuple, start: int, length: int,
+                   columns: list, commodity: str, categories: list, params: dict) -> list:
+    """Worker: rebuild one commodity's frame from shared memory and evaluate it."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        df = pd.DataFrame(block[start:start + length].copy(), columns=columns)
+    finally:
+        shm.close()
+
+    rows = []
+    cost_model = params['cost_model']
+    result = run_strategy_analysis(df, categories, beta=params['beta'],
+                                   middle_weight=params['middle_weight'], window=params['window'])
+    if result is not None:
+        positions = result['positions']
+        summary = backtest_positions(positions, result['climate_df']['price_change'], cost_model,
+                                     commodities=[commodity] * positions.shape[1])['summary']
+        for strategy, metrics in summary.iterrows():
+            rows.append({'commodity': commodity, 'strategy': strategy,
+                         **{key: metrics[key] for key in METRIC_COLUMNS}})
+
+    for strategy, strategy_fn, lookback in [
+        ('naive_momentum', naive_momentum_strategy, params['lookback_naive']),
+        ('slope_momentum', slope_momentum_strategy, params['lookback_slope']),
+    ]:
+        metrics = backtest_positions(strategy_fn(df, lookback), df['price_change'], cost_model,
+                                     commodities=[commodity])['summary'].iloc[0]
+        rows.append({'commodity': commodity, 'strategy': strategy,
+                     **{key: metrics[key] for key in METRIC_COLUMNS}})
+    return rows
+
+
+def run_multi_commodity_analysis(frames,
+                                 categories: list,
+                                 beta: float = None,
+                                 middle_weight: float = None,
+                                 window: int = None,
+                                 lookback_naive: int = None,
+                                 lookback_slope: int = None,
+                                 cost_model: dict = None,
+                                 n_workers: int = None) -> pd.DataFrame:
+    """
+    Run the news-momentum pipeline for many commodities in parallel.
+
+    Inputs are copied once into a shared-memory block that worker
+    processes attach to, so no DataFrames are pickled to the workers.
+    Parameters left as None use the load_config strategy defaults.
+
+    Args:
+        frames: {commodity: DataFrame with price_change and <cat>_sym
+            columns}, or a data_processing.PanelStore holding those fields
+            (e.g. from build_commodity_panel with categories)
+        categories: List of theme categories
+        beta: ARMA residual penalty coefficient
+        middle_weight: Weight for middle period in aggregation
+        window: Residual window size
+        lookback_naive: Lookback for the naive momentum benchmark
+        lookback_slope: Lookback for the slope momentum benchmark
+        cost_model: Transaction costs for backtest_positions, either one
+            model for all commodities or {commodity: model}; None =
+            frictionless
+        n_workers: Worker processes (1 = run in-process)
+
+    Returns:
+        pd.DataFrame: Comparison table indexed by (commodity, strategy)
+    """
+    defaults = load_config()['strategy']
+    params = {
+        'beta': defaults['beta'] if beta is None else beta,
+        'middle_weight': defaults['middle_weight'] if middle_weight is None else middle_weight,
+        'window': defaults['arma_window'] if window is None else window,
+        'lookback_naive': defaults['lookback_naive'] if lookback_naive is None else lookback_naive,
+        'lookback_slope': defaults['lookback_slope'] if lookback_slope is None else lookback_slope,
+        'cost_model': cost_model,
+    }
+    columns = theme_fields(categories)
+
+    shm, shape, layout = _pack_frames(frames, columns)
+    try:
+        jobs = [(shm.name, shape, start, length, columns, name, categories, params)
+                for name, (start, length) in layout.items()]
+        if n_workers == 1:
+            results = [_run_commodity(*job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                results = list(executor.map(_run_commodity, *zip(*jobs)))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    rows = [row for commodity_rows in results for row in commodity_rows]
+    df = pd.DataFrame(rows, columns=['commodity', 'strategy'] + METRIC_COLUMNS)
+    return df.set_index(['commodity', 'strategy'])
@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
-from scipy.stats import linregress
+
+from ..analysis.performance import calculate_metrics_matrix
 
 
 def naive_momentum_strategy(df: pd.DataFrame, lookback: int) -> np.array:
@@ -22,6 +23,88 @@ def naive_momentum_strategy(df: pd.DataFrame, lookback: int) -> np.array:
     return positions
 
 
+# Closed-form slope numerators at or below this many rounding units of the
+# cumulative sums they come from may have the wrong sign
+SLOPE_CANCELLATION_ULPS = 4
+
+
+def _centered_slopes(windows: np.ndarray) -> np.ndarray:
+    """Slopes of (k, L) windows from np.cov-style centered sums, as linregress."""
+    lookback = windows.shape[-1]
+    stacked = np.empty(windows.shape[:-1] + (2, lookback))
+    stacked[..., 0, :] = np.arange(lookback, dtype=float)
+    stacked[..., 1, :] = windows
+    stacked -= stacked.mean(axis=-1, keepdims=True)
+    cov = np.matmul(stacked, stacked.swapaxes(-1, -2)) * (1.0 / lookback)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return cov[..., 0, 1] / cov[..., 0, 0]
+
+
+def rolling_slope(values: np.ndarray, lookbacks) -> np.ndarray:
+    """
+    Rolling OLS slope of values against time.
+    
+    For a window y_0..y_{L-1} regressed on t = 0..L-1 the slope is
+    (sum t*y - (L-1)/2 * sum y) / (L(L^2-1)/12), taken in O(n) per
+    lookback from cumulative sums of y and t*y. Windows whose numerator is
+    within the rounding error of those sums (SLOPE_CANCELLATION_ULPS) are
+    recomputed from centered windows exactly as linregress does, so flat
+    and symmetric windows get the same sign as the linregress baseline
+    rather than cumulative-sum rounding noise. Windows containing NaNs
+    give NaN, as pandas rolling does.
+    
+    Args:
+        values: Array of observations with days along the first axis;
+            further axes (e.g. simulated paths) are independent series
+        lookbacks: Window length or sequence of window lengths
+        
+    Returns:
+        np.ndarray: Slopes of shape values.shape for a scalar lookback,
+            or values.shape + (len(lookbacks),) otherwise
+    """
+    values = np.asarray(values, dtype=float)
+    lb = np.atleast_1d(np.asarray(lookbacks, dtype=int))
+    n = len(values)
+    flat = values.reshape(n, int(np.prod(values.shape[1:])))
+    
+    # Cumulative sums of the series centered on its mean (slopes do not
+    # depend on the level), with NaNs counted separately
+    missing = np.isnan(flat)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        center = np.nansum(flat, axis=0) / np.sum(~missing, axis=0)
+    y = np.where(missing, 0.0, flat - np.nan_to_num(center))
+    t = np.arange(n, dtype=float)[:, None]
+    zero = np.zeros((1, flat.shape[1]))
+    sum_y = np.concatenate([zero, np.cumsum(y, axis=0)])
+    sum_ty = np.concatenate([zero, np.cumsum(t * y, axis=0)])
+    sum_abs = np.concatenate([zero, np.cumsum(np.abs(y), axis=0)])
+    sum_tabs = np.concatenate([zero, np.cumsum(t * np.abs(y), axis=0)])
+    sum_missing = np.concatenate([np.zeros((1, flat.shape[1]), dtype=int), np.cumsum(missing, axis=0)])
+    
+    slopes = np.full(flat.shape + (len(lb),), np.nan)
+    for j, lookback in enumerate(lb):
+        if lookback < 2 or lookback > n:
+            continue
+        end = np.arange(lookback, n + 1)
+        start = (end - lookback)[:, None]
+        window_y = sum_y[end] - sum_y[start[:, 0]]
+        numerator = sum_ty[end] - sum_ty[start[:, 0]] - (start + (lookback - 1) / 2) * window_y
+        slope = numerator / (lookback * (lookback ** 2 - 1) / 12)
+        
+        # Rounding error bound of the numerator, from the magnitudes summed
+        tolerance = SLOPE_CANCELLATION_ULPS * n * np.finfo(float).eps * (sum_tabs[end] + n * sum_abs[end])
+        has_nan = sum_missing[end] - sum_missing[start[:, 0]] > 0
+        rows, cols = np.nonzero((np.abs(numerator) <= tolerance) & ~has_nan)
+        if len(rows):
+            windows = flat[start[rows] + np.arange(lookback), cols[:, None]]
+            slope[rows, cols] = _centered_slopes(windows)
+        slope[has_nan] = np.nan
+        slopes[lookback - 1:, :, j] = slope
+    
+    slopes = slopes.reshape(values.shape + (len(lb),))
+    return slopes[..., 0] if np.ndim(lookbacks) == 0 else slopes
+
+
 def slope_momentum_strategy(df: pd.DataFrame, lookback: int) -> np.array:
     """
     Implement slope momentum strategy using linear regression.
@@ -33,13 +116,25 @@ def slope_momentum_strategy(df: pd.DataFrame, lookback: int) -> np.array:
     Returns:
         np.array: Position signals (-1, 0, 1)
     """
-    slopes = df['price_change'].rolling(window=lookback).apply(
-        lambda x: linregress(range(len(x)), x).slope,
-        raw=False
-    )
+    return slope_momentum_positions(df, [lookback])[:, 0]
+
+
+def slope_momentum_positions(df: pd.DataFrame, lookbacks) -> np.array:
+    """
+    Slope momentum positions for many lookbacks in one pass.
+    
+    Args:
+        df: DataFrame with 'price_change' column
+        lookbacks: Sequence of lookback periods
+        
+    Returns:
+        np.array: Position signals (-1, 0, 1) of shape (days, len(lookbacks))
+    """
+    lookbacks = np.atleast_1d(np.asarray(lookbacks, dtype=int))
+    slopes = rolling_slope(df['price_change'].to_numpy(), lookbacks)
     positions = np.where(slopes > 0, 1, -1)
-    positions = np.roll(positions, 1)
-    positions[:lookback+1] = 0
+    positions = np.roll(positions, 1, axis=0)
+    positions[np.arange(len(positions))[:, None] < lookbacks[None, :] + 1] = 0
     return positions
 
 
@@ -54,21 +149,9 @@ def calculate_metrics(returns: np.array, risk_free_rate: float = 0.05):
     Returns:
         dict: Dictionary with Sharpe ratio, cumulative return, and max drawdown
     """
-    # Annualized Sharpe Ratio
-    excess_returns = returns - risk_free_rate / 252
-    sharpe = np.sqrt(252) * np.mean(excess_returns) / np.std(returns)
-    
-    # Cumulative Return
-    cum_ret = (1 + returns).cumprod()[-1] - 1
-    
-    # Maximum Drawdown
-    cum_ret_series = (1 + returns).cumprod()
-    running_max = np.maximum.accumulate(cum_ret_series)
-    drawdowns = cum_ret_series / running_max - 1
-    max_drawdown = np.min(drawdowns)
-    
+    metrics = calculate_metrics_matrix(returns, risk_free_rate)
     return {
-        'sharpe': sharpe,
-        'cumulative_return': cum_ret,
-        'max_drawdown': max_drawdown
+        'sharpe': metrics['sharpe_ratio'].iloc[0],
+        'cumulative_return': metrics['cumulative_return'].iloc[0],
+        'max_drawdown': metrics['max_drawdown'].iloc[0]
     }
@@ -1,84 +1,291 @@
+import hashlib
+
 import pandas as pd
 import numpy as np
-import pmdarima as pm
-from tqdm import tqdm
 
+from ..analysis.performance import calculate_metrics_matrix, max_drawdowns, wealth_paths
+from ..utils.profiling import profiled, span
 
-def calculate_arma_residual_scores(df: pd.DataFrame, 
-                                   categories: list,
-                                   window: int = 20, 
-                                   beta: float = 0.7) -> pd.DataFrame:
+
+def window_mean_forecasts(train: np.ndarray):
     """
-    Calculate residual-based theme scores using ARMA models.
+    Mean-only ARMA fit on each row of a matrix of training windows.
+    
+    Reproduces auto_arima restricted to (0, 0, 0): the intercept model is
+    kept only when it wins on AIC, i.e. when
+    n * log(mean(x^2) / var(x)) > 2 over the n non-NaN values, otherwise
+    the forecast is zero. Constant windows (zero variance, e.g. a run of
+    zero returns) and all-NaN windows forecast zero, as auto_arima does.
     
     Args:
-        df: DataFrame with price_change and category symbols
-        categories: List of theme categories
-        window: Rolling window size for ARMA fitting
-        beta: Penalty coefficient for inactive themes
+        train: Array with one training window along the last axis
+            (e.g. 2-D, one window per row)
         
     Returns:
-        pd.DataFrame: DataFrame with added score columns
+        tuple: (means, oos_preds) arrays with one entry per window
     """
-    df_copy = df.copy()
+    train = np.asarray(train, dtype=float)
+    valid = ~np.isnan(train)
+    count = valid.sum(axis=-1)
+    filled = np.where(valid, train, 0.0)
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = filled.sum(axis=-1) / count
+        mean_sq = (filled ** 2).sum(axis=-1) / count
+        centered = np.where(valid, train - means[..., None], 0.0)
+        variance = (centered ** 2).sum(axis=-1) / count
+        constant = np.nanmax(np.where(valid, train, -np.inf), axis=-1) <= np.nanmin(np.where(valid, train, np.inf), axis=-1)
+        aic_gain = np.where(constant, np.nan, count * np.log(mean_sq / variance))
+    
+    oos_preds = np.where(aic_gain > 2, means, 0.0)
+    return means, oos_preds
+
+
+def rolling_mean_residuals(values: np.ndarray, window: int):
+    """
+    Vectorized residuals and forecasts of the rolling mean-only ARMA model.
+    
+    For every day i >= window the model is trained on
+    values[i - window : i - 1] and the residual is values[i - 1] minus the
+    training mean; the forecast follows window_mean_forecasts. NaNs are
+    dropped from a window before fitting, as auto_arima does.
+    
+    Args:
+        values: Array of price changes with days along the first axis;
+            further axes (e.g. simulated paths) are independent series
+        window: Rolling window size (training span is window - 1 days)
+        
+    Returns:
+        tuple: (residuals, oos_preds) arrays of shape
+            (len(values) - window, ...)
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    if n <= window:
+        return np.empty((0,) + values.shape[1:]), np.empty((0,) + values.shape[1:])
+    
+    train = np.lib.stride_tricks.sliding_window_view(values[:n - 1], window - 1, axis=0)[:n - window]
+    means, oos_preds = window_mean_forecasts(train)
+    residuals = values[window - 1:n - 1] - means
+    return residuals, oos_preds
+
+
+def _auto_arima_residuals(series: pd.Series, window: int, max_p: int, max_q: int):
+    """Per-day auto_arima refit; only used for non-trivial (p, q) orders."""
+    # Heavy dependencies, imported only when this engine is selected
+    import pmdarima as pm
+    from tqdm import tqdm
+    
     residuals = []
     oos_preds = []
     
-    print(f"\nCalculating residual scores (beta={beta}, window={window})...")
-    
-    for i in tqdm(range(window, len(df_copy))):
-        train_data = df_copy['price_change'].iloc[i - window : i-1]
+    for i in tqdm(range(window, len(series))):
+        train_data = series.iloc[i - window : i-1]
         
         try:
             # Fit ARMA model
             model = pm.auto_arima(
                 train_data, start_p=0, start_q=0,
-                max_p=0, max_q=0,
+                max_p=max_p, max_q=max_q,
                 d=0, seasonal=False,
                 trace=False, error_action='ignore', 
                 suppress_warnings=True
             )
             ins_pred = train_data.mean()
-            actual = df_copy['price_change'].iloc[i-1]
+            actual = series.iloc[i-1]
             residual = actual - ins_pred
             oos_pred = model.predict(n_periods=1).values[0]
             
         except Exception:
             ins_pred = train_data.mean()
-            actual = df_copy['price_change'].iloc[i-1]
+            actual = series.iloc[i-1]
             residual = actual - ins_pred
             oos_pred = ins_pred
 
         residuals.append(residual)
         oos_preds.append(oos_pred)
+    
+    return np.array(residuals), np.array(oos_preds)
+
+
+_RESIDUAL_CACHE = {}
+_RESIDUAL_CACHE_SIZE = 32
+
+
+@profiled('residuals', rows=lambda df: len(df))
+def compute_residuals(price_change: pd.Series,
+                      window: int = 20,
+                      max_p: int = 0,
+                      max_q: int = 0,
+                      engine: str = 'incremental',
+                      reselect_every: int = 20,
+                      use_cache: bool = True) -> pd.DataFrame:
+    """
+    Stage one: rolling residuals and out-of-sample forecasts.
+    
+    Residuals do not depend on beta, so results are cached per
+    (series content, window, model settings) and reused by every beta or
+    middle_weight evaluated on the same series.
+    
+    Args:
+        price_change: Series of daily price changes
+        window: Rolling window size for ARMA fitting
+        max_p: Maximum AR order
+        max_q: Maximum MA order
+        engine: 'incremental' or 'auto_arima' for non-trivial orders
+        reselect_every: Windows between order selections (incremental engine)
+        use_cache: Reuse previously computed residuals for identical inputs
         
-    fill_indices = df_copy.index[window:]
-    df_copy['residual'] = np.nan
-    df_copy['oos_pred'] = np.nan
-    df_copy.loc[fill_indices, 'residual'] = residuals
-    df_copy.loc[fill_indices, 'oos_pred'] = oos_preds
+    Returns:
+        pd.DataFrame: 'residual' and 'oos_pred' columns aligned with the
+            input index (NaN for the first window days)
+    """
+    values = price_change.to_numpy(dtype=float)
+    key = (hashlib.sha1(values.tobytes()).hexdigest(), window,
+           max_p, max_q, engine if (max_p or max_q) else None, reselect_every)
     
-    # Calculate theme scores
-    for score_type in categories:
-        sym_col = f'{score_type}_sym'
-        score_col = f'{score_type}_score'
+    if use_cache and key in _RESIDUAL_CACHE:
+        residuals, oos_preds = _RESIDUAL_CACHE[key]
+    else:
+        if max_p == 0 and max_q == 0:
+            residuals, oos_preds = rolling_mean_residuals(values, window)
+        elif engine == 'incremental':
+            from .arma import rolling_arma_forecasts
+            residuals, oos_preds, _ = rolling_arma_forecasts(
+                values, window, max_p=max_p, max_q=max_q, reselect_every=reselect_every
+            )
+        elif engine == 'auto_arima':
+            residuals, oos_preds = _auto_arima_residuals(price_change, window, max_p, max_q)
+        else:
+            raise ValueError(f"Unknown residual engine '{engine}'")
         
-        prev_day_sym_values = df_copy[sym_col].shift(1).loc[fill_indices]
-        multiplier = np.where(prev_day_sym_values != 0, prev_day_sym_values, -beta)
-        df_copy.loc[fill_indices, score_col] = df_copy.loc[fill_indices, 'residual'] * multiplier
+        if use_cache:
+            if len(_RESIDUAL_CACHE) >= _RESIDUAL_CACHE_SIZE:
+                _RESIDUAL_CACHE.pop(next(iter(_RESIDUAL_CACHE)))
+            _RESIDUAL_CACHE[key] = (residuals, oos_preds)
+    
+    result = pd.DataFrame(np.nan, index=price_change.index, columns=['residual', 'oos_pred'])
+    result.iloc[window:, 0] = residuals
+    result.iloc[window:, 1] = oos_preds
+    return result
+
+
+def clear_residual_cache():
+    """Drop all cached residuals."""
+    _RESIDUAL_CACHE.clear()
+
+
+@profiled('theme_scores', rows=lambda scores: scores.shape[0] * scores.shape[1])
+def project_theme_scores(residuals: np.ndarray,
+                         sym_values: np.ndarray,
+                         betas) -> np.ndarray:
+    """
+    Stage two: project residuals onto theme symbols for many betas at once.
+    
+    A theme active on the previous day scores residual * sym; inactive
+    themes score residual * -beta.
+    
+    Args:
+        residuals: Array of shape (days,) from compute_residuals, or
+            (days, paths) for many independent series
+        sym_values: Array of shape (days, categories) of category symbols,
+            or (days, paths, categories)
+        betas: Scalar or sequence of penalty coefficients
+        
+    Returns:
+        np.ndarray: Scores of shape (len(betas), days, categories), or
+            (len(betas), days, paths, categories)
+    """
+    residuals = np.asarray(residuals, dtype=float)
+    sym_values = np.asarray(sym_values, dtype=float)
+    betas = np.atleast_1d(np.asarray(betas, dtype=float))
+    
+    prev_sym = np.empty_like(sym_values)
+    prev_sym[:1] = np.nan
+    prev_sym[1:] = sym_values[:-1]
+    
+    multiplier = np.where(prev_sym != 0, prev_sym, -betas.reshape((-1,) + (1,) * sym_values.ndim))
+    return residuals[None, ..., None] * multiplier
+
+
+def calculate_arma_residual_scores(df: pd.DataFrame, 
+                                   categories: list,
+                                   window: int = 20, 
+                                   beta: float = 0.7,
+                                   max_p: int = 0,
+                                   max_q: int = 0,
+                                   engine: str = 'incremental',
+                                   reselect_every: int = 20) -> pd.DataFrame:
+    """
+    Calculate residual-based theme scores using ARMA models.
+    
+    The default mean-only configuration (max_p=0, max_q=0) is computed in
+    one vectorized pass. Non-trivial orders use the warm-started rolling
+    ARMA engine, or a per-day auto_arima fit when engine='auto_arima'.
+    
+    Args:
+        df: DataFrame with price_change and category symbols
+        categories: List of theme categories
+        window: Rolling window size for ARMA fitting
+        beta: Penalty coefficient for inactive themes
+        max_p: Maximum AR order
+        max_q: Maximum MA order
+        engine: 'incremental' or 'auto_arima' for non-trivial orders
+        reselect_every: Windows between order selections (incremental engine)
+        
+    Returns:
+        pd.DataFrame: DataFrame with added score columns
+    """
+    df_copy = df.copy()
+    
+    print(f"\nCalculating residual scores (beta={beta}, window={window})...")
+    
+    fitted = compute_residuals(df_copy['price_change'], window, max_p, max_q,
+                               engine, reselect_every)
+    df_copy['residual'] = fitted['residual']
+    df_copy['oos_pred'] = fitted['oos_pred']
+    
+    # Calculate theme scores
+    sym_cols = [f'{cat}_sym' for cat in categories]
+    scores = project_theme_scores(fitted['residual'].to_numpy(), df_copy[sym_cols].to_numpy(), beta)[0]
+    for j, score_type in enumerate(categories):
+        df_copy[f'{score_type}_score'] = scores[:, j]
     
     return df_copy
 
 
+def weighted_rolling_sum(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Trailing weighted sum over all columns at once.
+    
+    Row k of the result is sum_j weights[j] * values[k + j], i.e. the
+    window ending at row k + len(weights) - 1 with the last weight on the
+    most recent row. Taps are accumulated in order, so results equal
+    np.sum(window * weights) exactly.
+    
+    Args:
+        values: Array of shape (days, columns)
+        weights: 1-D weights, oldest first
+        
+    Returns:
+        np.ndarray: Array of shape (days - len(weights) + 1, columns)
+    """
+    values = np.asarray(values, dtype=float)
+    n_out = max(len(values) - len(weights) + 1, 0)
+    
+    result = np.zeros((n_out,) + values.shape[1:])
+    for j, weight in enumerate(weights):
+        result += values[j:j + n_out] * weight
+    return result
+
+
 def calculate_max_drawdown(cumulative_returns: pd.Series) -> float:
     """Calculate maximum drawdown from cumulative returns."""
-    returns_plus_one = 1 + cumulative_returns
-    wealth_index = pd.concat([pd.Series([1.0]), returns_plus_one])
-    previous_peaks = wealth_index.cummax()
-    drawdowns = (wealth_index - previous_peaks) / previous_peaks
-    return drawdowns.min()
+    wealth = 1 + np.asarray(cumulative_returns, dtype=float).reshape(-1, 1)
+    return max_drawdowns(wealth)[0]
 
 
+@profiled()
 def run_strategy_analysis(df: pd.DataFrame, 
                          categories: list,
                          beta: float, 
@@ -95,11 +302,68 @@ def run_strategy_analysis(df: pd.DataFrame,
         window: Aggregation window size
         
     Returns:
-        dict: Strategy performance metrics and processed DataFrame
+        dict: Strategy performance metrics and processed DataFrame, or None
+            when the data is too short for one aggregation window
     """
     # Calculate scores
     df_with_scores = calculate_arma_residual_scores(df, categories, window=window, beta=beta)
+    return _analyze_scores(df_with_scores, categories, middle_weight)
+
+
+@profiled()
+def sweep_strategy_analysis(df: pd.DataFrame,
+                            categories: list,
+                            betas: list,
+                            middle_weights: list,
+                            window: int = 5,
+                            pairs: list = None) -> dict:
+    """
+    Run the strategy analysis for every (beta, middle_weight) pair.
+    
+    Residuals are computed once and all betas are projected in a single
+    broadcasted operation, so the sweep costs one residual pass.
+    
+    Args:
+        df: Input DataFrame with price and theme data
+        categories: List of theme categories
+        betas: ARMA residual penalty coefficients
+        middle_weights: Weights for middle period in aggregation
+        window: Aggregation window size
+        pairs: Optional (beta, middle_weight) pairs to evaluate instead of
+            the full betas x middle_weights cross product
+        
+    Returns:
+        dict: {(beta, middle_weight): run_strategy_analysis result (or None)}
+    """
+    print(f"\nCalculating residual scores ({len(betas)} betas, window={window})...")
+    
+    df_base = df.copy()
+    fitted = compute_residuals(df_base['price_change'], window)
+    df_base['residual'] = fitted['residual']
+    df_base['oos_pred'] = fitted['oos_pred']
+    
+    sym_cols = [f'{cat}_sym' for cat in categories]
+    score_cols = [f'{cat}_score' for cat in categories]
+    all_scores = project_theme_scores(fitted['residual'].to_numpy(), df_base[sym_cols].to_numpy(), betas)
+    
+    results = {}
+    for beta, scores in zip(betas, all_scores):
+        df_with_scores = df_base.copy()
+        df_with_scores[score_cols] = scores
+        for middle_weight in middle_weights:
+            if pairs is not None and (beta, middle_weight) not in pairs:
+                continue
+            results[(beta, middle_weight)] = _analyze_scores(df_with_scores, categories, middle_weight)
     
+    return results
+
+
+def _analyze_scores(df_with_scores: pd.DataFrame, categories: list, middle_weight: float):
+    """
+    Aggregate theme scores into signals and evaluate the strategies.
+    
+    Returns None when there are too few scored rows for one climate row.
+    """
     cate_scores = [f'{cat}_score' for cat in categories]
     df_processed = df_with_scores[['price_change', 'oos_pred', 'residual'] + cate_scores].copy()
     df_processed.dropna(inplace=True)
@@ -108,65 +372,59 @@ def run_strategy_analysis(df: pd.DataFrame,
         return None
 
     # Calculate rolling weighted average
-    weights = np.array([0.2, middle_weight, 1.0])
-    weights = weights / np.sum(weights)
+    with span('climate', rows=len(df_processed)):
+        weights = np.array([0.2, middle_weight, 1.0])
+        weights = weights / np.sum(weights)
 
-    climate = df_processed[cate_scores].rolling(window=len(weights)).apply(
-        lambda x: np.sum(x * weights), raw=True
-    )
-    climate.dropna(inplace=True)
-    climate['price_change'] = df_processed['price_change']
-    climate['oos_pred'] = df_processed['oos_pred']
-    climate['residual'] = df_processed['residual']
+        climate = pd.DataFrame(
+            weighted_rolling_sum(df_processed[cate_scores].to_numpy(), weights),
+            index=df_processed.index[len(weights) - 1:],
+            columns=cate_scores
+        )
+        climate['price_change'] = df_processed['price_change']
+        climate['oos_pred'] = df_processed['oos_pred']
+        climate['residual'] = df_processed['residual']
 
-    # Generate signals
-    climate['dominant_signal_source'] = climate[cate_scores].abs().idxmax(axis=1)
-    raw_signal = [row[row['dominant_signal_source']] for _, row in climate.iterrows()]
-    climate['raw_signal'] = raw_signal
-    
-    abs_scores = climate[cate_scores].abs()
-    norm_weights = abs_scores.div(abs_scores.sum(axis=1), axis=0)
-    climate['weighted_mean'] = (climate[cate_scores] * norm_weights).sum(axis=1)
-
-    # Define position strategies
-    positions = {
-        'raw_signal': np.sign(climate['raw_signal']),
-        'mean_signal': np.sign(climate[cate_scores].mean(axis=1)),
-        'momentum_signal': np.sign(climate['oos_pred']),
-        'residual_signal': np.sign(climate['residual']),
-        'weighted_mean_signal': np.sign(climate['weighted_mean']),
-        'long_only': pd.Series(1, index=climate.index),
-    }
+    # Fewer processed rows than aggregation weights leave no climate rows
+    if climate.empty:
+        return None
 
-    # Calculate performance metrics
-    sharpe_ratios = {}
-    cumulative_returns = {}
-    max_drawdowns = {}
+    # Generate signals
+    with span('signals', rows=len(climate)):
+        score_values = climate[cate_scores].to_numpy()
+        dominant = np.abs(score_values).argmax(axis=1)
+        climate['dominant_signal_source'] = np.array(cate_scores, dtype=object)[dominant]
+        climate['raw_signal'] = score_values[np.arange(len(score_values)), dominant]
     
-    RISK_FREE_RATE = 0.05
-    TRADING_DAYS = 252
+        abs_scores = climate[cate_scores].abs()
+        norm_weights = abs_scores.div(abs_scores.sum(axis=1), axis=0)
+        climate['weighted_mean'] = (climate[cate_scores] * norm_weights).sum(axis=1)
 
-    for name, pos in positions.items():
-        daily_returns = pos * climate['price_change']
-        
-        excess_returns = daily_returns - (RISK_FREE_RATE / TRADING_DAYS)
-        mean_excess = excess_returns.mean()
-        std_excess = excess_returns.std()
-        
-        if std_excess != 0:
-            annual_sharpe = (mean_excess / std_excess) * np.sqrt(TRADING_DAYS)
-        else:
-            annual_sharpe = 0.0
-        sharpe_ratios[name] = annual_sharpe
-        
-        cum_ret = (1 + daily_returns).cumprod() - 1
-        climate[f'cumulative_{name}_return'] = cum_ret
-        cumulative_returns[name] = cum_ret.iloc[-1] if not cum_ret.empty else 0.0
-        max_drawdowns[name] = calculate_max_drawdown(cum_ret)
+        # Define position strategies
+        positions = {
+            'raw_signal': np.sign(climate['raw_signal']),
+            'mean_signal': np.sign(climate[cate_scores].mean(axis=1)),
+            'momentum_signal': np.sign(climate['oos_pred']),
+            'residual_signal': np.sign(climate['residual']),
+            'weighted_mean_signal': np.sign(climate['weighted_mean']),
+            'long_only': pd.Series(1, index=climate.index),
+        }
+        positions = pd.DataFrame(positions)
+
+    # Calculate performance metrics for all strategies at once
+    with span('metrics', rows=len(climate)):
+        daily_returns = positions.mul(climate['price_change'], axis=0)
+        metrics = calculate_metrics_matrix(daily_returns)
+    
+        cum_ret = wealth_paths(daily_returns.to_numpy()) - 1
+        for j, name in enumerate(positions):
+            climate[f'cumulative_{name}_return'] = cum_ret[:, j]
 
     return {
-        "sharpe_ratios": sharpe_ratios,
-        "cumulative_returns": cumulative_returns,
-        "max_drawdowns": max_drawdowns,
+        "sharpe_ratios": metrics['sharpe_ratio'].to_dict(),
+        "cumulative_returns": metrics['cumulative_return'].to_dict(),
+        "max_drawdowns": metrics['max_drawdown'].to_dict(),
+        "positions": positions,
+        "daily_returns": daily_returns,
         "climate_df": climate
     }
@@ -0,0 +1,182 @@
+import json
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from .news_momentum import window_mean_forecasts
+
+
+STRATEGIES = ['raw_signal', 'mean_signal', 'momentum_signal',
+              'residual_signal', 'weighted_mean_signal', 'long_only']
+
+
+class NewsMomentumStream:
+    """
+    Incremental news-momentum engine for daily updates.
+
+    Reproduces run_strategy_analysis with the mean-only residual model one
+    day at a time. After ingesting day t it emits the positions every
+    strategy holds on day t + 1; when day t + 1 arrives, those positions
+    are marked to market. State is O(window) and each update is
+    O(window): the training window is refitted with the same
+    window_mean_forecasts used by the batch path, so positions match a
+    full recompute exactly.
+    """
+
+    def __init__(self, categories: list, beta: float, middle_weight: float, window: int = 5):
+        self.categories = list(categories)
+        self.beta = beta
+        self.middle_weight = middle_weight
+        self.window = window
+
+        weights = np.array([0.2, middle_weight, 1.0])
+        self.weights = weights / np.sum(weights)
+
+        self.prices = deque()
+        self.scores = deque(maxlen=len(self.weights))
+        self.pending = None
+        self.days = 0
+
+        self.wealth = {name: 1.0 for name in STRATEGIES}
+        self.peaks = {name: 1.0 for name in STRATEGIES}
+        self.max_drawdowns = {name: 0.0 for name in STRATEGIES}
+
+    @classmethod
+    def from_history(cls, df: pd.DataFrame, categories: list, beta: float,
+                     middle_weight: float, window: int = 5):
+        """
+        Warm up an engine by replaying a full history.
+
+        Args:
+            df: DataFrame with price_change and <cat>_sym columns
+            categories: List of theme categories
+            beta: ARMA residual penalty coefficient
+            middle_weight: Weight for middle period in aggregation
+            window: Residual window size
+
+        Returns:
+            NewsMomentumStream
+        """
+        engine = cls(categories, beta, middle_weight, window)
+        sym_values = df[[f'{cat}_sym' for cat in categories]].to_numpy(dtype=float)
+        for price_change, sym in zip(df['price_change'].to_numpy(dtype=float), sym_values):
+            engine.update(price_change, sym)
+        return engine
+
+    @property
+    def cumulative_returns(self) -> dict:
+        return {name: wealth - 1.0 for name, wealth in self.wealth.items()}
+
+    def update(self, price_change: float, sym) -> dict:
+        """
+        Ingest one day and return the positions for the next day.
+
+        Args:
+            price_change: Today's price change
+            sym: Today's category symbols, as a sequence ordered like
+                categories or a {category: value} dict
+
+        Returns:
+            dict: {strategy: position for the next day}, or None while the
+                engine is still warming up
+        """
+        if isinstance(sym, dict):
+            sym = [sym.get(cat, 0) for cat in self.categories]
+        sym = np.asarray(sym, dtype=float)
+
+        if self.pending is not None:
+            self._mark_to_market(price_change)
+
+        self.days += 1
+        # Residual model is trained on the window - 1 days before today
+        n_train = self.window - 1
+        ready = len(self.prices) == n_train
+        if ready:
+            means, oos_preds = window_mean_forecasts(np.array(self.prices)[None, :])
+            residual = price_change - means[0]
+            oos_pred = oos_preds[0]
+
+        self.prices.append(price_change)
+        if len(self.prices) > n_train:
+            self.prices.popleft()
+
+        if not ready:
+            self.pending = None
+            return None
+
+        multiplier = np.where(sym != 0, sym, -self.beta)
+        self.scores.append(residual * multiplier)
+        if len(self.scores) < len(self.weights):
+            self.pending = None
+            return None
+
+        climate = np.zeros(len(self.categories))
+        for score, weight in zip(self.scores, self.weights):
+            climate += score * weight
+
+        abs_scores = np.abs(climate)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            weighted_mean = np.nansum(climate * (abs_scores / np.sum(abs_scores)))
+
+        self.pending = {
+            'raw_signal': float(np.sign(climate[abs_scores.argmax()])),
+            'mean_signal': float(np.sign(np.sum(climate) / len(climate))),
+            'momentum_signal': float(np.sign(oos_pred)),
+            'residual_signal': float(np.sign(residual)),
+            'weighted_mean_signal': float(np.sign(weighted_mean)),
+            'long_only': 1.0,
+        }
+        return dict(self.pending)
+
+    def _mark_to_market(self, price_change: float):
+        """Apply the pending positions to today's price change."""
+        for name, position in self.pending.items():
+            daily_return = position * price_change
+            if np.isnan(daily_return):
+                continue
+            self.wealth[name] *= 1 + daily_return
+            self.peaks[name] = max(self.peaks[name], self.wealth[name])
+            drawdown = self.wealth[name] / self.peaks[name] - 1
+            self.max_drawdowns[name] = min(self.max_drawdowns[name], drawdown)
+
+    def to_dict(self) -> dict:
+        """Serializable engine state."""
+        return {
+            'categories': self.categories,
+            'beta': self.beta,
+            'middle_weight': self.middle_weight,
+            'window': self.window,
+            'prices': list(self.prices),
+            'scores': [score.tolist() for score in self.scores],
+            'pending': self.pending,
+            'days': self.days,
+            'wealth': self.wealth,
+            'peaks': self.peaks,
+            'max_drawdowns': self.max_drawdowns,
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict):
+        """Rebuild an engine from to_dict() output."""
+        engine = cls(state['categories'], state['beta'], state['middle_weight'], state['window'])
+        engine.prices = deque(state['prices'])
+        engine.scores = deque((np.array(score) for score in state['scores']),
+                              maxlen=len(engine.weights))
+        engine.pending = state['pending']
+        engine.days = state['days']
+        engine.wealth = state['wealth']
+        engine.peaks = state['peaks']
+        engine.max_drawdowns = state['max_drawdowns']
+        return engine
+
+    def save(self, path):
+        """Persist the engine state as JSON."""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path):
+        """Load an engine saved with save()."""
+        with open(path, 'r') as f:
+            return cls.from_dict(json.load(f))
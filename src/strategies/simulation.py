@@ -86,3 +86,178 @@ def simulate_event_series(num_days_total: int = 252,
     ], axis=1)
     
     return data
+
+
+SIMULATION_FIELDS = ['themes', 'realization', 'scores', 'event']
+
+# Paths are drawn in blocks of PATH_BLOCK from one Generator per block,
+# so a path's draws depend only on the seed and its index
+PATH_BLOCK = 256
+
+
+def _block_draws(seed: np.random.SeedSequence, block: int, lookback_period: int,
+                 num_events: int, num_steps: int, daily_std: float) -> tuple:
+    """Initial theme data, event uniforms and shocks of one block of paths."""
+    block_seed = np.random.SeedSequence(seed.entropy, spawn_key=seed.spawn_key + (block,),
+                                        pool_size=seed.pool_size)
+    rng = np.random.default_rng(block_seed)
+    initial = rng.normal(0, daily_std, size=(lookback_period, num_events, PATH_BLOCK))
+    uniforms = rng.random((num_steps, PATH_BLOCK))
+    shocks = rng.standard_normal((num_steps, PATH_BLOCK))
+    return initial, uniforms, shocks
+
+
+def simulate_event_paths(n_paths: int,
+                         num_days_total: int = 252,
+                         lookback_period: int = 5,
+                         initial_weights: list = None,
+                         annual_volatility: float = 0.2,
+                         trading_days_per_year: int = 252,
+                         prob_mixture_c: float = 0.1,
+                         mean_reversion_beta: float = 0.4,
+                         seed=None,
+                         first_path: int = 0,
+                         fields: list = None) -> dict:
+    """
+    Simulate many multi-theme event-driven paths at once.
+    
+    Same model as simulate_event_series, advanced for all paths together
+    with array operations. Events are drawn by inverse-CDF sampling. The
+    random numbers come from one Generator per block of PATH_BLOCK paths,
+    keyed by the block index under seed, so path k has the same draws
+    whether it is simulated alone or with any other range of paths.
+    
+    Args:
+        n_paths: Number of independent paths
+        num_days_total: Total simulation days
+        lookback_period: Days for moving average calculation
+        initial_weights: Weights for weighted average (None = linear)
+        annual_volatility: Annual volatility for random shocks
+        trading_days_per_year: Trading days per year
+        prob_mixture_c: Random probability mixing coefficient (0-1)
+        mean_reversion_beta: Mean reversion factor for inactive themes
+        seed: int or SeedSequence
+        first_path: Index of the first path to simulate (for chunking)
+        fields: Subset of SIMULATION_FIELDS to return (None = all);
+            fields that are not requested are never stored
+        
+    Returns:
+        dict: Arrays for the requested fields, path-major:
+            'themes' float64 (n_paths, num_days_total, 3),
+            'realization' float64 (n_paths, num_days_total),
+            'scores' float32 (n_paths, num_days_total, 3) and
+            'event' int8 (n_paths, num_days_total), -1 during the warm-up
+    """
+    num_events = 3
+    daily_std = annual_volatility / np.sqrt(trading_days_per_year)
+    num_steps = max(num_days_total - lookback_period, 0)
+    
+    fields = SIMULATION_FIELDS if fields is None else list(fields)
+    unknown = set(fields) - set(SIMULATION_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown simulation fields: {sorted(unknown)}")
+    
+    # Setup weights
+    if initial_weights is None:
+        weights = np.arange(1, lookback_period + 1)
+    else:
+        weights = np.array(initial_weights)
+        if len(weights) != lookback_period:
+            raise ValueError("Length of initial_weights must equal lookback_period")
+    weights = weights / np.sum(weights)
+    
+    # Random streams of the blocks covering the requested paths
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    initial = np.empty((lookback_period, num_events, n_paths))
+    uniforms = np.empty((num_steps, n_paths))
+    shocks = np.empty((num_steps, n_paths))
+    last_path = first_path + n_paths
+    for block in range(first_path // PATH_BLOCK, -(-last_path // PATH_BLOCK)):
+        block_start = block * PATH_BLOCK
+        lo, hi = max(first_path, block_start), min(last_path, block_start + PATH_BLOCK)
+        src = slice(lo - block_start, hi - block_start)
+        dst = slice(lo - first_path, hi - first_path)
+        block_initial, block_uniforms, block_shocks = _block_draws(
+            seed, block, lookback_period, num_events, num_steps, daily_std)
+        initial[..., dst] = block_initial[..., src]
+        uniforms[:, dst] = block_uniforms[:, src]
+        shocks[:, dst] = block_shocks[:, src]
+    
+    # Event-major (day, event, path) layout keeps per-day operations on
+    # contiguous path vectors; the last lookback days sit in a ring buffer
+    themes = np.empty((num_days_total, num_events, n_paths)) if 'themes' in fields else None
+    realization = np.zeros((num_days_total, n_paths)) if 'realization' in fields else None
+    score_means = np.zeros((num_days_total, num_events, n_paths), dtype=np.float32) if 'scores' in fields else None
+    events = np.full((num_days_total, n_paths), -1, dtype=np.int8)
+    ring = initial
+    if themes is not None:
+        themes[:lookback_period] = initial
+    
+    cols = np.arange(n_paths)
+    random_prob = 1.0 / num_events
+    current_mean = np.empty((num_events, n_paths))
+    
+    # Simulation loop over days, vectorized over paths
+    for step, t in enumerate(range(lookback_period, num_days_total)):
+        current_mean[:] = 0.0
+        for j in range(lookback_period):
+            current_mean += weights[j] * ring[(t - lookback_period + j) % lookback_period]
+        if score_means is not None:
+            score_means[t] = current_mean
+        
+        abs_mean = np.abs(current_mean)
+        sum_abs_mean = abs_mean.sum(axis=0)
+        degenerate = sum_abs_mean <= 1e-9
+        with np.errstate(invalid='ignore', divide='ignore'):
+            event_probabilities = abs_mean / sum_abs_mean
+        if degenerate.any():
+            event_probabilities[:, degenerate] = random_prob
+        event_probabilities = ((1 - prob_mixture_c) * event_probabilities +
+                               prob_mixture_c * random_prob)
+        
+        # Inverse-CDF event selection and increment
+        next_event_idx = np.zeros(n_paths, dtype=np.intp)
+        cdf = np.zeros(n_paths)
+        for e in range(num_events - 1):
+            cdf += event_probabilities[e]
+            next_event_idx += uniforms[step] >= cdf
+        new_increment = current_mean[next_event_idx, cols] + daily_std * shocks[step]
+        events[t] = next_event_idx
+        if realization is not None:
+            realization[t] = new_increment
+        
+        # Apply mean reversion to inactive themes
+        new_day_data = ring[t % lookback_period]
+        new_day_data[:] = -mean_reversion_beta * new_increment
+        new_day_data[next_event_idx, cols] = new_increment
+        if themes is not None:
+            themes[t] = new_day_data
+    
+    out = {}
+    if themes is not None:
+        out['themes'] = themes.transpose(2, 0, 1)
+    if realization is not None:
+        out['realization'] = realization.T
+    if score_means is not None:
+        out['scores'] = score_means.transpose(2, 0, 1)
+    if 'event' in fields:
+        out['event'] = events.T
+    return out
+
+
+def paths_to_frame(paths: dict, path: int = 0) -> pd.DataFrame:
+    """
+    One simulated path in the DataFrame layout of simulate_event_series.
+    
+    Args:
+        paths: Output of simulate_event_paths with all fields
+        path: Index of the path to convert
+        
+    Returns:
+        pd.DataFrame: Theme data (0, 1, 2), realization and theme scores
+    """
+    data = pd.DataFrame(paths['themes'][path])
+    data['realization'] = paths['realization'][path]
+    data[['Ascore', 'Bscore', 'Cscore']] = paths['scores'][path].astype(float)
+    return data
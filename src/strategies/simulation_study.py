@@ -0,0 +1,268 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+import numpy as np
+import pandas as pd
+
+from .momentum import rolling_slope
+from .news_momentum import project_theme_scores, rolling_mean_residuals, weighted_rolling_sum
+from .simulation import simulate_event_paths
+from ..analysis.performance import sharpe_ratios
+from ..utils.config import load_config
+
+
+STUDY_PARAMS = ['prob_mixture_c', 'mean_reversion_beta', 'lookback_period', 'annual_volatility']
+NEWS_STRATEGIES = ['raw_signal', 'mean_signal', 'momentum_signal',
+                   'residual_signal', 'weighted_mean_signal', 'long_only']
+STUDY_STRATEGIES = ['naive_momentum', 'slope_momentum'] + NEWS_STRATEGIES
+
+# Simulation output the study evaluates; the rest is never stored
+STUDY_FIELDS = ['realization', 'event']
+
+RISK_FREE_RATE = 0.05
+TRADING_DAYS = 252
+
+
+def default_study_space() -> dict:
+    """Single-point study space at the simulate_event_series defaults."""
+    return {
+        'prob_mixture_c': [0.1],
+        'mean_reversion_beta': [0.4],
+        'lookback_period': [5],
+        'annual_volatility': [0.2],
+    }
+
+
+def _sharpe(returns: np.ndarray) -> np.ndarray:
+    """Annualized Sharpe ratio along the last axis."""
+    return sharpe_ratios(returns, RISK_FREE_RATE, TRADING_DAYS, axis=-1)
+
+
+def naive_momentum_paths(price_change: np.ndarray, lookback: int) -> np.ndarray:
+    """
+    naive_momentum_strategy applied to every row of a (paths, days) array.
+
+    Args:
+        price_change: Array of shape (paths, days)
+        lookback: Lookback period in days
+
+    Returns:
+        np.ndarray: Position signals (-1, 0, 1) of shape (paths, days)
+    """
+    cum_ret = np.cumprod(1 + price_change, axis=1)
+    positions = np.full(price_change.shape, -1.0)
+    positions[:, lookback:][cum_ret[:, lookback:] / cum_ret[:, :-lookback] > 1.0] = 1.0
+    positions = np.roll(positions, 1, axis=1)
+    positions[:, :lookback + 1] = 0
+    return positions
+
+
+def slope_momentum_paths(price_change: np.ndarray, lookback: int) -> np.ndarray:
+    """
+    slope_momentum_strategy applied to every row of a (paths, days) array.
+
+    Args:
+        price_change: Array of shape (paths, days)
+        lookback: Lookback period for regression
+
+    Returns:
+        np.ndarray: Position signals (-1, 0, 1) of shape (paths, days)
+    """
+    slopes = rolling_slope(price_change.T, lookback).T
+
+    positions = np.where(slopes > 0, 1.0, -1.0)
+    positions = np.roll(positions, 1, axis=1)
+    positions[:, :lookback + 1] = 0
+    return positions
+
+
+def news_momentum_paths(price_change: np.ndarray, events: np.ndarray,
+                        beta: float, middle_weight: float, window: int) -> tuple:
+    """
+    run_strategy_analysis positions for every row of a (paths, days) array.
+
+    The simulated event is used as the news symbol: the theme that drove a
+    day's move has sym 1 and the others 0, so inactive themes score
+    residual * -beta as in project_theme_scores.
+
+    Args:
+        price_change: Array of shape (paths, days)
+        events: Array of shape (paths, days) of event indices (-1 = none)
+        beta: ARMA residual penalty coefficient
+        middle_weight: Weight for middle period in aggregation
+        window: Residual window size
+
+    Returns:
+        tuple: (positions of shape (strategies, paths, days'), aligned
+            price changes of shape (paths, days'))
+    """
+    n_paths, n = price_change.shape
+    num_events = 3
+
+    residuals, oos_preds = rolling_mean_residuals(price_change.T, window)
+
+    # Theme scores from the previous day's event, days first as in the
+    # single-series pipeline
+    sym_values = (events.T[..., None] == np.arange(num_events)).astype(float)
+    padded = np.full((n, n_paths), np.nan)
+    padded[window:] = residuals
+    scores = project_theme_scores(padded, sym_values, beta)[0, window:]
+
+    weights = np.array([0.2, middle_weight, 1.0])
+    weights = weights / np.sum(weights)
+    climate = weighted_rolling_sum(scores, weights).transpose(1, 0, 2)
+    n_out = climate.shape[1]
+    residuals, oos_preds = residuals.T, oos_preds.T
+
+    offset = len(weights) - 1
+    abs_scores = np.abs(climate)
+    dominant = abs_scores.argmax(axis=2)
+    raw_signal = np.take_along_axis(climate, dominant[..., None], axis=2)[..., 0]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        weighted_mean = np.nan_to_num(np.sum(climate * (abs_scores / abs_scores.sum(axis=2, keepdims=True)), axis=2))
+
+    positions = np.stack([
+        np.sign(raw_signal),
+        np.sign(climate.mean(axis=2)),
+        np.sign(oos_preds[:, offset:]),
+        np.sign(residuals[:, offset:]),
+        np.sign(weighted_mean),
+        np.ones((n_paths, n_out)),
+    ])
+    return positions, price_change[:, window + offset:]
+
+
+def evaluate_paths(paths: dict, beta: float, middle_weight: float, window: int,
+                   lookback_naive: int, lookback_slope: int) -> np.ndarray:
+    """
+    Sharpe ratio of every study strategy on every simulated path.
+
+    Args:
+        paths: Output of simulate_event_paths with at least the
+            'realization' and 'event' fields
+        beta: ARMA residual penalty coefficient
+        middle_weight: Weight for middle period in aggregation
+        window: Residual window size
+        lookback_naive: Lookback for the naive momentum benchmark
+        lookback_slope: Lookback for the slope momentum benchmark
+
+    Returns:
+        np.ndarray: Sharpe ratios of shape (paths, len(STUDY_STRATEGIES))
+    """
+    price_change = paths['realization']
+    events = paths['event']
+
+    sharpes = np.empty((len(price_change), len(STUDY_STRATEGIES)))
+    sharpes[:, 0] = _sharpe(naive_momentum_paths(price_change, lookback_naive) * price_change)
+    sharpes[:, 1] = _sharpe(slope_momentum_paths(price_change, lookback_slope) * price_change)
+
+    positions, aligned = news_momentum_paths(price_change, events, beta, middle_weight, window)
+    sharpes[:, 2:] = _sharpe(positions * aligned).T
+    return sharpes
+
+
+def _run_chunk(cell: dict, cell_seed, first_path: int, n_paths: int, num_days_total: int,
+               strategy_params: dict) -> np.ndarray:
+    """Worker: simulate one chunk of a cell's paths and evaluate them."""
+    paths = simulate_event_paths(n_paths, num_days_total=num_days_total, seed=cell_seed,
+                                 first_path=first_path, fields=STUDY_FIELDS, **cell)
+    return evaluate_paths(paths, **strategy_params)
+
+
+def run_simulation_study(study_space: dict = None,
+                         n_paths: int = 1000,
+                         num_days_total: int = 252,
+                         seed: int = 0,
+                         beta: float = None,
+                         middle_weight: float = None,
+                         window: int = None,
+                         lookback_naive: int = None,
+                         lookback_slope: int = None,
+                         chunk_size: int = 1000,
+                         n_workers: int = None) -> pd.DataFrame:
+    """
+    Monte Carlo study of the strategies over simulator parameters.
+
+    Every cell of the study grid simulates n_paths paths and records the
+    Sharpe ratio of each strategy on each path. The root SeedSequence is
+    spawned once per cell and simulate_event_paths keys its blocked
+    streams by path index, so a path's draws depend only on (seed, cell,
+    path) and results are bit-identical for any chunk_size or n_workers.
+    Only realizations and events are simulated into memory. Strategy
+    parameters left as None use the load_config strategy defaults.
+
+    Args:
+        study_space: {simulator parameter: list of values} over STUDY_PARAMS;
+            missing names use the simulator defaults
+        n_paths: Simulated paths per cell
+        num_days_total: Days per path
+        seed: Root seed
+        beta: ARMA residual penalty coefficient
+        middle_weight: Weight for middle period in aggregation
+        window: Residual window size
+        lookback_naive: Lookback for the naive momentum benchmark
+        lookback_slope: Lookback for the slope momentum benchmark
+        chunk_size: Paths per work unit
+        n_workers: Worker processes (1 = run in-process)
+
+    Returns:
+        pd.DataFrame: One row per (cell, path) with the study parameters,
+            'path' and one Sharpe ratio column per strategy
+    """
+    defaults = load_config()['strategy']
+    strategy_params = {
+        'beta': defaults['beta'] if beta is None else beta,
+        'middle_weight': defaults['middle_weight'] if middle_weight is None else middle_weight,
+        'window': defaults['arma_window'] if window is None else window,
+        'lookback_naive': defaults['lookback_naive'] if lookback_naive is None else lookback_naive,
+        'lookback_slope': defaults['lookback_slope'] if lookback_slope is None else lookback_slope,
+    }
+
+    space = default_study_space()
+    space.update(study_space or {})
+    cells = [dict(zip(STUDY_PARAMS, values)) for values in product(*(space[name] for name in STUDY_PARAMS))]
+
+    cell_seeds = np.random.SeedSequence(seed).spawn(len(cells))
+    jobs = []
+    for cell, cell_seed in zip(cells, cell_seeds):
+        for lo in range(0, n_paths, chunk_size):
+            jobs.append((cell, cell_seed, lo, min(chunk_size, n_paths - lo), num_days_total, strategy_params))
+
+    print(f"Simulating {len(cells)} cells x {n_paths} paths in {len(jobs)} chunks...")
+    if n_workers == 1:
+        results = [_run_chunk(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(_run_chunk, *zip(*jobs)))
+
+    chunks_per_cell = len(range(0, n_paths, chunk_size))
+    frames = []
+    for i, cell in enumerate(cells):
+        sharpes = np.concatenate(results[i * chunks_per_cell:(i + 1) * chunks_per_cell])
+        frame = pd.DataFrame(sharpes, columns=STUDY_STRATEGIES)
+        frame.insert(0, 'path', np.arange(n_paths))
+        for position, name in enumerate(STUDY_PARAMS):
+            frame.insert(position, name, cell[name])
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+def summarize_study(results: pd.DataFrame, quantiles: tuple = (0.05, 0.25, 0.5, 0.75, 0.95)) -> pd.DataFrame:
+    """
+    Sharpe ratio distribution per cell and strategy.
+
+    Args:
+        results: Output of run_simulation_study
+        quantiles: Quantiles to report
+
+    Returns:
+        pd.DataFrame: Indexed by (study parameters..., strategy) with mean,
+            std and quantile columns
+    """
+    long = results.melt(id_vars=STUDY_PARAMS + ['path'], value_vars=STUDY_STRATEGIES,
+                        var_name='strategy', value_name='sharpe_ratio')
+    grouped = long.groupby(STUDY_PARAMS + ['strategy'], sort=False)['sharpe_ratio']
+    summary = grouped.agg(['mean', 'std'])
+    for q in quantiles:
+        summary[f'q{int(round(q * 100)):02d}'] = grouped.quantile(q)
+    return summary
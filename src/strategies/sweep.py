@@ -0,0 +1,237 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+
+import numpy as np
+import pandas as pd
+
+from .momentum import naive_momentum_strategy, slope_momentum_strategy
+from .news_momentum import sweep_strategy_analysis
+from ..analysis.backtest import backtest_positions
+from ..utils.config import load_config
+
+
+NEWS_PARAMS = ['window', 'beta', 'middle_weight']
+PARAM_NAMES = NEWS_PARAMS + ['lookback_naive', 'lookback_slope']
+METRIC_COLUMNS = ['sharpe_ratio', 'cumulative_return', 'max_drawdown', 'annual_turnover', 'cost_drag']
+RESULT_COLUMNS = ['task', 'task_rows', 'strategy'] + PARAM_NAMES + METRIC_COLUMNS
+# Integer parameters are nullable: news rows have no lookbacks and
+# momentum rows no window
+RESULT_DTYPES = {
+    'task': object, 'task_rows': 'Int64', 'strategy': object,
+    'window': 'Int64', 'beta': float, 'middle_weight': float,
+    'lookback_naive': 'Int64', 'lookback_slope': 'Int64',
+    **{name: float for name in METRIC_COLUMNS},
+}
+
+
+def default_param_space(config: dict = None) -> dict:
+    """
+    Single-point parameter space built from the strategy config defaults.
+
+    Args:
+        config: Configuration dict (load_config() when None)
+
+    Returns:
+        dict: {param_name: [value]}
+    """
+    strategy = (config or load_config())['strategy']
+    return {
+        'window': [strategy['arma_window']],
+        'beta': [strategy['beta']],
+        'middle_weight': [strategy['middle_weight']],
+        'lookback_naive': [strategy['lookback_naive']],
+        'lookback_slope': [strategy['lookback_slope']],
+    }
+
+
+def build_param_grid(param_space: dict, n_random: int = None, seed: int = None) -> list:
+    """
+    Expand a parameter space into a list of parameter combinations.
+
+    Args:
+        param_space: {param_name: list of candidate values}; missing names
+            fall back to the config defaults
+        n_random: Sample this many combinations instead of the full grid
+        seed: Seed for random search
+
+    Returns:
+        list: Parameter dicts
+    """
+    space = default_param_space()
+    space.update(param_space or {})
+    space = {name: [getattr(v, 'item', lambda v=v: v)() for v in values] for name, values in space.items()}
+
+    if n_random is None:
+        return [dict(zip(PARAM_NAMES, values)) for values in product(*(space[name] for name in PARAM_NAMES))]
+
+    rng = np.random.default_rng(seed)
+    combos = []
+    for _ in range(n_random):
+        combos.append({name: space[name][rng.integers(len(space[name]))] for name in PARAM_NAMES})
+    return combos
+
+
+def _task_key(kind: str, params: dict, cost_model: dict = None) -> str:
+    """Stable identifier of one evaluated parameter set (and cost model)."""
+    key = kind + json.dumps(params, sort_keys=True)
+    if cost_model:
+        key += json.dumps(cost_model, sort_keys=True)
+    return key
+
+
+def _plan_tasks(combos: list, done: set, cost_model: dict = None) -> list:
+    """
+    Deduplicate parameter combinations into independent work units.
+
+    News-momentum combinations are grouped by window so that each unit
+    computes residuals once; momentum lookbacks are evaluated once each.
+    """
+    news_pairs = {}
+    naive = set()
+    slope = set()
+
+    for params in combos:
+        news = {name: params[name] for name in NEWS_PARAMS}
+        if _task_key('news', news, cost_model) not in done:
+            news_pairs.setdefault(params['window'], set()).add((params['beta'], params['middle_weight']))
+        if _task_key('naive', {'lookback_naive': params['lookback_naive']}, cost_model) not in done:
+            naive.add(params['lookback_naive'])
+        if _task_key('slope', {'lookback_slope': params['lookback_slope']}, cost_model) not in done:
+            slope.add(params['lookback_slope'])
+
+    tasks = [('news', window, sorted(pairs)) for window, pairs in sorted(news_pairs.items())]
+    tasks += [('naive', lookback, None) for lookback in sorted(naive)]
+    tasks += [('slope', lookback, None) for lookback in sorted(slope)]
+    return tasks
+
+
+def _results_frame(rows: list) -> pd.DataFrame:
+    """Result rows as a DataFrame with RESULT_DTYPES (also when empty)."""
+    return pd.DataFrame(rows, columns=RESULT_COLUMNS).astype(RESULT_DTYPES)
+
+
+def _run_task(df: pd.DataFrame, categories: list, kind: str, value, pairs, cost_model: dict = None) -> list:
+    """
+    Evaluate one work unit and return its tidy result rows.
+
+    A parameter set without enough data for any result gets one marker
+    row with no strategy, so that a resumed sweep does not recompute it.
+    """
+    rows = []
+
+    if kind == 'news':
+        betas = sorted({beta for beta, _ in pairs})
+        middle_weights = sorted({mw for _, mw in pairs})
+        results = sweep_strategy_analysis(df, categories, betas, middle_weights, window=value,
+                                          pairs=set(pairs))
+
+        for beta, middle_weight in pairs:
+            params = {'window': value, 'beta': beta, 'middle_weight': middle_weight}
+            result = results[(beta, middle_weight)]
+            if result is None:
+                rows.append({'task': _task_key('news', params, cost_model), 'strategy': None, **params})
+                continue
+            summary = backtest_positions(result['positions'], result['climate_df']['price_change'],
+                                         cost_model)['summary']
+            for strategy, metrics in summary.iterrows():
+                rows.append({
+                    'task': _task_key('news', params, cost_model),
+                    'strategy': strategy,
+                    **params,
+                    **{key: metrics[key] for key in METRIC_COLUMNS},
+                })
+        return rows
+
+    strategy_fn = naive_momentum_strategy if kind == 'naive' else slope_momentum_strategy
+    param_name = f'lookback_{kind}'
+    positions = strategy_fn(df, value)
+    metrics = backtest_positions(positions, df['price_change'], cost_model)['summary'].iloc[0]
+    rows.append({
+        'task': _task_key(kind, {param_name: value}, cost_model),
+        'strategy': f'{kind}_momentum',
+        param_name: value,
+        **{key: metrics[key] for key in METRIC_COLUMNS},
+    })
+    return rows
+
+
+def _append_checkpoint(rows: list, checkpoint_path):
+    """Append finished rows to the checkpoint CSV."""
+    if not rows:
+        return
+    frame = _results_frame(rows)
+    frame['task_rows'] = frame.groupby('task')['task'].transform('size')
+    write_header = not os.path.exists(checkpoint_path)
+    frame.to_csv(checkpoint_path, mode='a', header=write_header, index=False)
+
+
+def run_parameter_sweep(df: pd.DataFrame,
+                        categories: list,
+                        param_space: dict = None,
+                        n_random: int = None,
+                        seed: int = None,
+                        n_workers: int = None,
+                        checkpoint_path=None,
+                        cost_model: dict = None) -> pd.DataFrame:
+    """
+    Grid or random search over strategy parameters on a process pool.
+
+    Combinations sharing a residual window are evaluated in one work unit,
+    and each finished unit is streamed into the checkpoint CSV so that an
+    interrupted sweep resumes where it stopped.
+
+    Args:
+        df: Input DataFrame with price and theme data
+        categories: List of theme categories
+        param_space: {param_name: candidate values} for window, beta,
+            middle_weight, lookback_naive and lookback_slope
+        n_random: Number of random combinations (None = full grid)
+        seed: Seed for random search
+        n_workers: Worker processes (1 = run in-process)
+        checkpoint_path: CSV file used to persist and resume results
+        cost_model: Transaction cost model passed to backtest_positions
+            (None = frictionless); metrics are net of these costs
+
+    Returns:
+        pd.DataFrame: One row per (parameter set, strategy) with Sharpe,
+            cumulative return, max drawdown, annual turnover and cost drag
+    """
+    combos = build_param_grid(param_space, n_random=n_random, seed=seed)
+
+    previous = _results_frame([])
+    if checkpoint_path is not None and os.path.exists(checkpoint_path):
+        previous = pd.read_csv(checkpoint_path, dtype=RESULT_DTYPES, float_precision='round_trip').drop_duplicates(['task', 'strategy'], keep='last')
+        # Tasks cut off while being written are recomputed
+        complete = previous.groupby('task')['task'].transform('size') == previous['task_rows']
+        previous = previous[complete]
+        print(f"Resuming sweep from {checkpoint_path} ({previous['task'].nunique()} finished)")
+
+    tasks = _plan_tasks(combos, set(previous['task']), cost_model)
+    print(f"Running {len(tasks)} sweep tasks for {len(combos)} parameter combinations...")
+
+    rows = []
+    if n_workers == 1:
+        for task in tasks:
+            task_rows = _run_task(df, categories, *task, cost_model)
+            if checkpoint_path is not None:
+                _append_checkpoint(task_rows, checkpoint_path)
+            rows.extend(task_rows)
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [executor.submit(_run_task, df, categories, *task, cost_model) for task in tasks]
+            for future in as_completed(futures):
+                task_rows = future.result()
+                if checkpoint_path is not None:
+                    _append_checkpoint(task_rows, checkpoint_path)
+                rows.extend(task_rows)
+
+    results = pd.concat([previous, _results_frame(rows)], ignore_index=True)
+    wanted = {_task_key('news', {name: c[name] for name in NEWS_PARAMS}, cost_model) for c in combos}
+    wanted |= {_task_key('naive', {'lookback_naive': c['lookback_naive']}, cost_model) for c in combos}
+    wanted |= {_task_key('slope', {'lookback_slope': c['lookback_slope']}, cost_model) for c in combos}
+    # Marker rows of parameter sets without results have no strategy
+    results = results[results['task'].isin(wanted) & results['strategy'].notna()]
+
+    return results.drop(columns=['task', 'task_rows']).sort_values(['strategy'] + PARAM_NAMES).reset_index(drop=True)
@@ -0,0 +1,148 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .news_momentum import sweep_strategy_analysis
+from ..analysis.performance import calculate_metrics_matrix
+
+
+FOLD_COLUMNS = ['fold', 'train_start', 'train_end', 'test_start', 'test_end', 'strategy',
+                'beta', 'middle_weight', 'train_metric', 'test_sharpe']
+
+
+def walk_forward_folds(n_days: int, train_size: int, test_size: int,
+                       expanding: bool = True, step: int = None) -> list:
+    """
+    Split day positions into consecutive train/test folds.
+
+    Args:
+        n_days: Number of days available
+        train_size: Days in the first training span
+        test_size: Days in each test span
+        expanding: Grow the training span from day 0 (False = rolling
+            window of train_size days)
+        step: Days between fold starts (defaults to test_size)
+
+    Returns:
+        list: (train_start, train_end, test_start, test_end) position
+            tuples with exclusive ends
+    """
+    step = step or test_size
+    folds = []
+    test_start = train_size
+    while test_start < n_days:
+        train_start = 0 if expanding else test_start - train_size
+        folds.append((train_start, test_start, test_start, min(test_start + test_size, n_days)))
+        test_start += step
+    return folds
+
+
+def _evaluate_fold(train_returns: np.ndarray, test_returns: np.ndarray,
+                   n_strategies: int, metric: str) -> tuple:
+    """
+    Worker: pick the best candidate per strategy on the training span.
+
+    Columns are ordered candidate-major, n_strategies per candidate.
+
+    Returns:
+        tuple: (chosen candidate per strategy, training metric per strategy,
+            test returns of shape (test days, strategies))
+    """
+    train = calculate_metrics_matrix(train_returns)[metric].to_numpy()
+    train = train.reshape(-1, n_strategies)
+    best = np.argmax(np.where(np.isnan(train), -np.inf, train), axis=0)
+
+    strategies = np.arange(n_strategies)
+    return best, train[best, strategies], test_returns[:, best * n_strategies + strategies]
+
+
+def run_walk_forward(df: pd.DataFrame,
+                     categories: list,
+                     betas: list,
+                     middle_weights: list,
+                     train_size: int,
+                     test_size: int,
+                     window: int = 5,
+                     expanding: bool = True,
+                     step: int = None,
+                     metric: str = 'sharpe_ratio',
+                     n_workers: int = None) -> dict:
+    """
+    Walk-forward evaluation of the news-momentum strategies.
+
+    For every fold, each strategy keeps the (beta, middle_weight) pair with
+    the best training-span metric and is evaluated on the following test
+    span. Residuals, theme scores and climate signals are causal, so they
+    are computed once on the full history (one residual pass for all
+    pairs via sweep_strategy_analysis) and only sliced per fold.
+
+    Args:
+        df: Input DataFrame with price and theme data
+        categories: List of theme categories
+        betas: Candidate ARMA residual penalty coefficients
+        middle_weights: Candidate middle-period weights
+        train_size: Days in the first training span
+        test_size: Days in each test span
+        window: Residual window size
+        expanding: Expanding (True) or rolling (False) training span
+        step: Days between folds (defaults to test_size)
+        metric: calculate_metrics_matrix column to select on
+        n_workers: Worker processes (1 = run in-process)
+
+    Returns:
+        dict: 'folds' (selected parameters and scores per fold and
+            strategy), 'oos_returns' (stitched test-span returns) and
+            'metrics' (calculate_metrics_matrix of the stitched returns),
+            or None when no (beta, middle_weight) pair has enough data
+            for run_strategy_analysis
+    """
+    results = sweep_strategy_analysis(df, categories, betas, middle_weights, window=window)
+    candidates = [pair for pair, result in results.items() if result is not None]
+    if not candidates:
+        print("No parameter pair has enough data for a walk-forward evaluation")
+        return None
+
+    daily = [results[pair]['daily_returns'] for pair in candidates]
+    strategies = list(daily[0].columns)
+    index = daily[0].index
+    returns = np.concatenate([frame.to_numpy(dtype=float) for frame in daily], axis=1)
+
+    folds = walk_forward_folds(len(index), train_size, test_size, expanding, step)
+    print(f"Evaluating {len(folds)} walk-forward folds over {len(candidates)} parameter pairs...")
+
+    jobs = [(returns[train_start:train_end], returns[test_start:test_end], len(strategies), metric)
+            for train_start, train_end, test_start, test_end in folds]
+    if n_workers == 1:
+        evaluated = [_evaluate_fold(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            evaluated = list(executor.map(_evaluate_fold, *zip(*jobs)))
+
+    rows = []
+    oos = []
+    for i, (fold, (best, train_scores, test_returns)) in enumerate(zip(folds, evaluated)):
+        train_start, train_end, test_start, test_end = fold
+        test_sharpes = calculate_metrics_matrix(test_returns)['sharpe_ratio'].to_numpy()
+        for j, strategy in enumerate(strategies):
+            beta, middle_weight = candidates[best[j]]
+            rows.append({
+                'fold': i,
+                'train_start': index[train_start],
+                'train_end': index[train_end - 1],
+                'test_start': index[test_start],
+                'test_end': index[test_end - 1],
+                'strategy': strategy,
+                'beta': beta,
+                'middle_weight': middle_weight,
+                'train_metric': train_scores[j],
+                'test_sharpe': test_sharpes[j],
+            })
+        oos.append(pd.DataFrame(test_returns, index=index[test_start:test_end], columns=strategies))
+
+    oos_returns = pd.concat(oos)
+    return {
+        'folds': pd.DataFrame(rows, columns=FOLD_COLUMNS),
+        'oos_returns': oos_returns,
+        'metrics': calculate_metrics_matrix(oos_returns),
+    }
@@ -2,5 +2,17 @@
 Utility functions and configuration
 """
 from .config import load_config, get_data_paths
+from .lazy import lazy_exports
+from .profiling import enable_profiling, disable_profiling, span, profiled, profile_summary, print_profile_summary
 
-__all__ = ['load_config', 'get_data_paths']
+__all__ = [
+    'load_config',
+    'get_data_paths',
+    'lazy_exports',
+    'enable_profiling',
+    'disable_profiling',
+    'span',
+    'profiled',
+    'profile_summary',
+    'print_profile_summary'
+]
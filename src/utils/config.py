@@ -19,6 +19,10 @@ def get_data_paths():
     
     return {
         'price_dir': data_dir / 'price',
+        'cache_dir': data_dir / 'cache',
+        'news_dir': data_dir / 'news-dataset',
+        'briefing_dir': data_dir / 'news-briefing',
+        'news_store': data_dir / 'news_store.sqlite',
         'output_dir': root / 'outputs',
         'reports_dir': root / 'docs' / 'reports',
         'figures_dir': root / 'outputs' / 'figures'
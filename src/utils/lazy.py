@@ -0,0 +1,31 @@
+import importlib
+import sys
+
+
+def lazy_exports(package: str, exports: dict):
+    """
+    Module-level __getattr__ and __dir__ that import submodules on first use.
+
+    Usage in a package __init__:
+        __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+    Args:
+        package: Name of the package (its __name__)
+        exports: Exported name -> relative submodule, e.g. {'f': '.module'}
+
+    Returns:
+        tuple: (__getattr__, __dir__) to assign in the package namespace
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name):
+        if name in exports:
+            value = getattr(importlib.import_module(exports[name], package), name)
+            namespace[name] = value
+            return value
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,224 @@
+import functools
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+
+PROFILE_ENV = 'UMCO_PROFILE'
+
+_STATE = {
+    'enabled': os.environ.get(PROFILE_ENV, '').lower() not in ('', '0', 'false', 'no'),
+    'memory': os.environ.get(PROFILE_ENV, '').lower() == 'memory',
+    'log_path': os.environ.get(f'{PROFILE_ENV}_LOG') or None,
+    'echo': False,
+}
+_RECORDS = []
+_STACK = []
+
+
+class Span:
+    """
+    One timed pipeline stage.
+
+    Set span.rows inside the block to record how many rows it processed.
+    """
+
+    __slots__ = ('name', 'path', 'rows', 'start', 'memory_start', 'child_peak')
+
+    def __init__(self, name: str, rows: int = None):
+        self.name = name
+        self.rows = rows
+
+    def __enter__(self):
+        self.path = '/'.join([s.name for s in _STACK] + [self.name])
+        self.child_peak = 0
+        if _STATE['memory']:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            if _STACK:
+                # Keep the parent's peak so far before resetting it for this span
+                _STACK[-1].child_peak = max(_STACK[-1].child_peak, tracemalloc.get_traced_memory()[1])
+            self.memory_start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        _STACK.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall = time.perf_counter() - self.start
+        _STACK.pop()
+
+        peak_mb = None
+        if _STATE['memory'] and tracemalloc.is_tracing():
+            peak = max(tracemalloc.get_traced_memory()[1], self.child_peak)
+            peak_mb = (peak - self.memory_start) / 2 ** 20
+            if _STACK:
+                _STACK[-1].child_peak = max(_STACK[-1].child_peak, peak)
+
+        _emit({
+            'span': self.path,
+            'name': self.name,
+            'wall_s': wall,
+            'rows': self.rows,
+            'peak_mb': peak_mb,
+            'ok': exc_type is None,
+            'pid': os.getpid(),
+            'time': time.time(),
+        })
+        return False
+
+
+class _NullSpan:
+    """Shared stand-in returned while profiling is disabled."""
+
+    rows = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def __setattr__(self, name, value):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def _emit(record: dict):
+    """Store a finished span and write it to the JSON log if configured."""
+    _RECORDS.append(record)
+    if _STATE['log_path'] or _STATE['echo']:
+        line = json.dumps(record)
+        if _STATE['log_path']:
+            with open(_STATE['log_path'], 'a') as f:
+                f.write(line + '\n')
+        if _STATE['echo']:
+            print(line, file=sys.stderr)
+
+
+def enable_profiling(memory: bool = False, log_path=None, echo: bool = False):
+    """
+    Turn span recording on.
+
+    Profiling can also be enabled for a whole process by setting
+    UMCO_PROFILE=1 (or UMCO_PROFILE=memory) and optionally
+    UMCO_PROFILE_LOG=<path> in the environment.
+
+    Args:
+        memory: Track peak memory per span with tracemalloc (slower)
+        log_path: Append every span as a JSON line to this file
+        echo: Also write JSON lines to stderr
+    """
+    _STATE.update(enabled=True, memory=memory, echo=echo,
+                  log_path=str(log_path) if log_path else None)
+
+
+def disable_profiling():
+    """Turn span recording off (recorded spans are kept)."""
+    _STATE['enabled'] = False
+    if tracemalloc.is_tracing() and _STATE['memory']:
+        tracemalloc.stop()
+    _STATE['memory'] = False
+
+
+def profiling_enabled() -> bool:
+    return _STATE['enabled']
+
+
+def span(name: str, rows: int = None):
+    """
+    Context manager timing one pipeline stage.
+
+    Usage:
+        with span('residuals', rows=len(df)) as s:
+            ...
+            s.rows = len(result)
+
+    Args:
+        name: Stage name; nested spans are recorded as parent/child paths
+        rows: Rows processed, if known up front
+
+    Returns:
+        Span, or a shared no-op object while profiling is disabled
+    """
+    if not _STATE['enabled']:
+        return _NULL_SPAN
+    return Span(name, rows)
+
+
+def profiled(name: str = None, rows=None):
+    """
+    Decorator wrapping every call of a function in a span.
+
+    Args:
+        name: Span name (defaults to the function name)
+        rows: Optional callable mapping the function's return value to a
+            row count
+
+    Returns:
+        Decorator
+    """
+    def decorate(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _STATE['enabled']:
+                return func(*args, **kwargs)
+            with Span(span_name) as s:
+                result = func(*args, **kwargs)
+                if rows is not None and result is not None:
+                    s.rows = rows(result)
+            return result
+        return wrapper
+    return decorate
+
+
+def profile_records() -> list:
+    """All spans recorded in this process, oldest first."""
+    return list(_RECORDS)
+
+
+def reset_profile():
+    """Forget all recorded spans."""
+    _RECORDS.clear()
+
+
+def profile_summary():
+    """
+    Aggregate recorded spans per stage.
+
+    Returns:
+        pd.DataFrame: Indexed by span path with calls, total_s, mean_s,
+            max_s, rows and peak_mb, slowest stages first
+    """
+    import pandas as pd
+
+    columns = ['calls', 'total_s', 'mean_s', 'max_s', 'rows', 'peak_mb']
+    if not _RECORDS:
+        return pd.DataFrame(columns=columns)
+
+    records = pd.DataFrame(_RECORDS)
+    grouped = records.groupby('span', sort=False)
+    summary = pd.DataFrame({
+        'calls': grouped.size(),
+        'total_s': grouped['wall_s'].sum(),
+        'mean_s': grouped['wall_s'].mean(),
+        'max_s': grouped['wall_s'].max(),
+        'rows': grouped['rows'].sum(min_count=1),
+        'peak_mb': grouped['peak_mb'].max(),
+    })
+    return summary.sort_values('total_s', ascending=False)[columns]
+
+
+def print_profile_summary():
+    """Print the per-stage summary table."""
+    summary = profile_summary()
+    if summary.empty:
+        print("No profiling spans recorded.")
+        return
+    print(summary.to_string(float_format=lambda x: f'{x:.4f}'))
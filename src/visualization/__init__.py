@@ -1,14 +1,17 @@
 """
 Visualization modules for plots and reports
+
+matplotlib and plotly are imported with the plots module on first use
+of one of its functions.
 """
-from .plots import (
-    plot_cumulative_returns,
-    plot_theme_analysis,
-    generate_interactive_report
-)
-
-__all__ = [
-    'plot_cumulative_returns',
-    'plot_theme_analysis', 
-    'generate_interactive_report'
-]
+from ..utils.lazy import lazy_exports
+
+_EXPORTS = {
+    'plot_cumulative_returns': '.plots',
+    'plot_theme_analysis': '.plots',
+    'generate_interactive_report': '.plots',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
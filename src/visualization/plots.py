@@ -1,8 +1,5 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 
 
 def plot_cumulative_returns(strategies_df: pd.DataFrame, 
@@ -14,6 +11,8 @@ def plot_cumulative_returns(strategies_df: pd.DataFrame,
         strategies_df: DataFrame with cumulative return columns
         title: Plot title
     """
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(14, 7))
     
     for col in strategies_df.columns:
@@ -42,6 +41,9 @@ def plot_theme_analysis(climate_df: pd.DataFrame, categories: list):
     Returns:
         plotly.graph_objects.Figure
     """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
     fig = make_subplots(
         rows=2, cols=1,
         shared_xaxes=True,
@@ -89,6 +91,9 @@ def generate_interactive_report(df_reason, climate_df, output_path='interactive_
         climate_df: DataFrame with theme scores
         output_path: Path to save HTML file
     """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
     # Prepare data
     df_reason_ = df_reason.copy()
     climate_df_ = climate_df.copy()